@@ -46,7 +46,8 @@ def show():
                 COUNT(*) as total,
                 SUM(CASE WHEN is_active = 1 THEN 1 ELSE 0 END) as active,
                 SUM(CASE WHEN is_pregnant = 1 THEN 1 ELSE 0 END) as pregnant,
-                (SELECT COUNT(*) FROM work_logs WHERE work_date >= date('now', 'start of month')) as work_logs
+                (SELECT COALESCE(SUM(days), 0) FROM work_log_monthly
+                 WHERE year_month >= strftime('%Y-%m', 'now')) as work_logs
             FROM employees
         """)
         
@@ -24,7 +24,8 @@ try:
         init_payroll_tables,
         get_payroll_setting,
         add_payroll_setting,
-        update_payroll_setting
+        update_payroll_setting,
+        get_employee_payroll_overview
     )
     import constants as C
     PAYROLL_MODULE_LOADED = True
@@ -517,17 +518,16 @@ def show():
     
     st.markdown("### 📊 전체 직원 급여 설정 현황")
     
-    employees = get_all_employees(active_only=True)
+    overview = get_employee_payroll_overview(active_only=True)
     
     settings_data = []
-    for emp in employees:
-        setting = get_payroll_setting(emp['emp_id'])
+    for emp in overview:
         settings_data.append({
             '이름': emp['name'],
             '부서': emp['department'],
-            '기본급': format_currency(setting['base_salary']) if setting else '❌ 미설정',
-            '총 수당': format_currency(sum(setting['allowances'].values())) if setting and 'allowances' in setting else '0원',
-            '상태': '✅ 설정 완료' if setting else '⚠️ 미설정'
+            '기본급': format_currency(emp['base_salary']) if emp['has_setting'] else '❌ 미설정',
+            '총 수당': format_currency(emp['total_allowance']) if emp['has_setting'] else '0원',
+            '상태': '✅ 설정 완료' if emp['has_setting'] else '⚠️ 미설정'
         })
     
     if settings_data:
@@ -3,9 +3,14 @@
 상수 및 마스터 데이터 정의
 """
 
+import sys
 from datetime import date
+from pathlib import Path
 from typing import Dict, List
 
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.business_days import KOREAN_HOLIDAYS
+
 # ============================================================
 # 마스터 데이터 (근로자 정보)
 # ============================================================
@@ -112,26 +117,10 @@ DESIGN_TASKS = [
 ]
 
 # ============================================================
-# 공휴일 (2026년 기준)
+# 공휴일 (2026년 기준) - shared 영업일 달력의 공휴일 목록에서 추출
 # ============================================================
 
-HOLIDAYS_2026 = [
-    date(2026, 1, 1),   # 신정
-    date(2026, 1, 28),  # 설날 연휴
-    date(2026, 1, 29),  # 설날
-    date(2026, 1, 30),  # 설날 연휴
-    date(2026, 3, 1),   # 삼일절
-    date(2026, 5, 5),   # 어린이날
-    date(2026, 5, 19),  # 부처님오신날
-    date(2026, 6, 6),   # 현충일
-    date(2026, 8, 15),  # 광복절
-    date(2026, 9, 28),  # 추석 연휴
-    date(2026, 9, 29),  # 추석
-    date(2026, 9, 30),  # 추석 연휴
-    date(2026, 10, 3),  # 개천절
-    date(2026, 10, 9),  # 한글날
-    date(2026, 12, 25), # 크리스마스
-]
+HOLIDAYS_2026 = [day for day in KOREAN_HOLIDAYS if day.year == 2026]
 
 # ============================================================
 # 정부 서식 매핑 정보
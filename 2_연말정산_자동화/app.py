@@ -18,7 +18,7 @@ from shared.design import apply_design
 from shared.utils import show_success
 
 # 로컬 모듈 임포트
-from pdf_parser import TaxPDFParser
+from parse_cache import parse_with_cache
 
 # ============================================================
 # Streamlit 페이지 설정
@@ -318,16 +318,18 @@ def show_upload_tab():
             with st.spinner("🔍 PDF를 분석하는 중... 잠시만 기다려주세요"):
                 try:
                     # 임시 파일로 저장
+                    pdf_bytes = uploaded_file.getvalue()
                     with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
+                        tmp_file.write(pdf_bytes)
                         tmp_path = tmp_file.name
                     
-                    # PDF 파싱
-                    parser = TaxPDFParser()
-                    parsed_data = parser.parse_pdf(tmp_path)
-                    
-                    # 임시 파일 삭제
-                    os.unlink(tmp_path)
+                    # PDF 파싱 (같은 파일은 캐시된 결과 사용)
+                    try:
+                        parser = parse_with_cache(tmp_path, pdf_bytes)
+                        parsed_data = parser.parsed_data
+                    finally:
+                        # 임시 파일 삭제
+                        os.unlink(tmp_path)
                     
                     # 세션 스테이트에 저장
                     st.session_state.parsed_data = parsed_data
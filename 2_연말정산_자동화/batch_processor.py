@@ -0,0 +1,237 @@
+"""
+TAX-EASY AI - PDF 일괄 처리 엔진
+여러 직원의 간소화 PDF를 프로세스 풀에서 병렬로 파싱하고
+파일별 결과를 완료되는 순서대로 돌려줍니다.
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from pdf_parser import ParsedData, TaxPDFParser
+from settlement import deduction_row
+
+# 동시에 실행할 최대 프로세스 수 (pdfplumber 는 CPU 와 메모리를 많이 사용)
+DEFAULT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# 파일당 최대 처리 시간 (초)
+DEFAULT_FILE_TIMEOUT = 60
+
+
+@dataclass
+class BatchResult:
+    """파일 1개 처리 결과"""
+    file_name: str
+    employee_name: str
+    success: bool = False
+    row: Dict = field(default_factory=dict)
+    error: str = ""
+    elapsed: float = 0.0
+    cached: bool = False
+
+
+def employee_name_from_filename(file_name: str) -> str:
+    """파일명에서 직원명 추출 (예: 홍길동_연말정산.pdf -> 홍길동)"""
+    if '_' in file_name:
+        return file_name.split('_')[0]
+    return file_name.replace('.pdf', '')
+
+
+def parsed_to_row(parsed: ParsedData) -> Dict:
+    """ParsedData 를 일괄 처리 표의 한 행(공제 자료)으로 변환"""
+    return deduction_row(parsed)
+
+
+def parse_pdf_bytes(file_name: str, data: bytes) -> Dict:
+    """
+    PDF 1개 파싱 (작업 프로세스에서 실행)
+
+    주택자금 항목은 TaxPDFParser.parse_pdf 안에서 함께 추출되므로
+    파일당 한 번만 읽습니다.
+
+    Returns:
+        Dict: ParsedData 필드 딕셔너리 (캐시 저장 및 행 변환은 호출 측에서)
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+        tmp_file.write(data)
+        tmp_path = tmp_file.name
+
+    try:
+        return asdict(TaxPDFParser().parse_pdf(tmp_path))
+    finally:
+        os.unlink(tmp_path)
+
+
+def _terminate(executor: ProcessPoolExecutor):
+    """멈춘 작업 프로세스까지 강제 종료"""
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def process_pdfs(
+    files: Iterable[Tuple[str, bytes]],
+    max_workers: Optional[int] = None,
+    timeout: float = DEFAULT_FILE_TIMEOUT,
+    use_cache: bool = True
+) -> Iterator[BatchResult]:
+    """
+    PDF 일괄 파싱 (완료되는 순서대로 결과 반환)
+
+    - 동시에 작업 프로세스 수만큼만 제출해 메모리 사용량을 제한
+    - 파일별 예외는 해당 파일의 실패 결과로만 기록
+    - 제한 시간을 넘긴 파일은 실패 처리하고 작업 프로세스를 교체
+    - 작업 프로세스가 죽으면(OOM 등) 풀을 교체하고, 처리 중이던 파일을 하나씩
+      다시 실행해 프로세스를 죽인 파일만 실패 처리
+    - 이미 파싱한 적 있는 파일은 캐시 결과를 바로 반환 (parse_cache, 사용 시각은 끝날 때 한 번에 기록)
+
+    Args:
+        files: (파일명, PDF 바이트) 목록
+        max_workers: 작업 프로세스 수 (기본: DEFAULT_MAX_WORKERS)
+        timeout: 파일당 최대 처리 시간 (초)
+        use_cache: 파싱 결과 캐시 사용 여부
+
+    Yields:
+        BatchResult: 파일별 처리 결과
+    """
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    pending = iter(files)
+    retry = []
+    suspects = []  # 작업 프로세스가 비정상 종료될 때 처리 중이던 파일 (하나씩 단독 재실행)
+    running = {}  # future -> (파일명, 바이트, 시작 시각, 단독 실행 여부)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    broken = False
+
+    cache = None
+    if use_cache:
+        import parse_cache as cache
+
+    ready = []  # 캐시에서 바로 꺼낸 결과
+
+    def submit_next():
+        nonlocal broken
+        while not broken:
+            if suspects:
+                # 어느 파일 때문에 풀이 깨졌는지 가리기 위해 의심 파일은 혼자 실행
+                if running:
+                    return False
+                item, solo = suspects.pop(), True
+            else:
+                item, solo = (retry.pop() if retry else next(pending, None)), False
+            if item is None:
+                return False
+            name, data = item
+            # 캐시에 있는 파일은 작업 프로세스로 보내지 않고 바로 반환
+            if cache is not None and not solo:
+                started = time.monotonic()
+                parsed = cache.get_cached(cache.file_digest(data))
+                if parsed is not None:
+                    ready.append(BatchResult(
+                        file_name=name,
+                        employee_name=employee_name_from_filename(name),
+                        success=True,
+                        row=parsed_to_row(parsed),
+                        elapsed=time.monotonic() - started,
+                        cached=True
+                    ))
+                    continue
+            try:
+                future = executor.submit(parse_pdf_bytes, name, data)
+            except BrokenProcessPool:
+                (suspects if solo else retry).append(item)
+                broken = True
+                return False
+            running[future] = (name, data, time.monotonic(), solo)
+            return True
+        return False
+
+    def replace_pool():
+        # 멈추거나 깨진 프로세스는 회수할 수 없으므로 풀을 교체
+        nonlocal executor, broken
+        _terminate(executor)
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        broken = False
+
+    def fill():
+        while len(running) < max_workers and submit_next():
+            pass
+        if broken:
+            # 제출 중 풀이 깨진 경우: 진행 중이던 파일은 의심 파일로 돌리고 새 풀에서 다시 제출
+            suspects.extend((name, data) for name, data, _, _ in running.values())
+            running.clear()
+            replace_pool()
+            while len(running) < max_workers and submit_next():
+                pass
+
+    try:
+        fill()
+        yield from ready
+        ready.clear()
+
+        while running:
+            oldest = min(started for _, _, started, _ in running.values())
+            wait_time = max(0.0, oldest + timeout - time.monotonic())
+            done, _ = wait(list(running), timeout=wait_time, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name, data, started, solo = running.pop(future)
+                result = BatchResult(
+                    file_name=name,
+                    employee_name=employee_name_from_filename(name),
+                    elapsed=time.monotonic() - started
+                )
+                try:
+                    parsed = ParsedData(**future.result())
+                    result.row = parsed_to_row(parsed)
+                    result.success = True
+                    if cache is not None:
+                        cache.put_cached(cache.file_digest(data), parsed)
+                except BrokenProcessPool:
+                    broken = True
+                    if not solo:
+                        # 같은 풀의 다른 파일 때문일 수 있으므로 단독으로 다시 실행
+                        suspects.append((name, data))
+                        continue
+                    result.error = "작업 프로세스가 비정상 종료되었습니다 (메모리 부족 또는 파서 오류)"
+                except Exception as e:
+                    result.error = str(e) or type(e).__name__
+                yield result
+
+            if broken:
+                suspects.extend((name, data) for name, data, _, _ in running.values())
+                running.clear()
+                replace_pool()
+
+            now = time.monotonic()
+            expired = [f for f, (_, _, started, _) in running.items() if now - started >= timeout]
+            if expired:
+                for future in expired:
+                    name, _, started, _ = running.pop(future)
+                    yield BatchResult(
+                        file_name=name,
+                        employee_name=employee_name_from_filename(name),
+                        error=f"처리 시간 초과 ({timeout:.0f}초)",
+                        elapsed=now - started
+                    )
+                # 진행 중이던 다른 파일은 새 풀에서 다시 제출
+                retry.extend((name, data) for name, data, _, solo in running.values() if not solo)
+                suspects.extend((name, data) for name, data, _, solo in running.values() if solo)
+                running.clear()
+                replace_pool()
+
+            fill()
+            yield from ready
+            ready.clear()
+    finally:
+        if running:
+            _terminate(executor)
+        else:
+            executor.shutdown(wait=True)
+        if cache is not None:
+            cache.flush_used()  # 캐시 적중 사용 시각은 일괄 처리당 한 번에 기록
@@ -0,0 +1,205 @@
+"""
+TAX-EASY AI - 파서 벤치마크
+합성 간소화 PDF 코퍼스로 TaxPDFParser 의 처리 속도(files/sec),
+단계·항목별 소요 시간, 항목별 정확도를 측정합니다.
+
+사용법:
+    python benchmark.py                       # 임시 폴더에 100개 생성 후 측정
+    python benchmark.py [코퍼스 폴더] [문서 수]  # 폴더에 없으면 생성 후 측정
+    python benchmark.py [코퍼스 폴더] [문서 수] --workers 4   # 일괄 처리 엔진 처리량도 측정
+    python benchmark.py ... --json            # 결과를 JSON 으로 출력 (회귀 비교용)
+"""
+
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pdfplumber
+
+from pdf_parser import ParsedData, SectionIndex, TaxPDFParser
+from sample_generator import TRUTH_FIELDS, generate_corpus, load_truth
+
+
+def extract_fields(parsed: ParsedData) -> Dict[str, int]:
+    """파싱 결과를 정답 항목(TRUTH_FIELDS)으로 변환"""
+    insurance = {item['type']: item['amount'] for item in parsed.insurance}
+    return {
+        'medical': sum(item['amount'] for item in parsed.medical_expenses),
+        'insurance_reimbursement': parsed.insurance_reimbursement,
+        'health_insurance': insurance.get('건강보험료', 0),
+        'employment_insurance': insurance.get('고용보험료', 0),
+        'pension_insurance': insurance.get('국민연금보험료', 0),
+        'credit_card': parsed.card_usage['credit_card'],
+        'donation': sum(item['amount'] for item in parsed.donations),
+        'education': sum(item['amount'] for item in parsed.education),
+        'jeonse_loan': parsed.jeonse_loan_repayment,
+        'housing_subscription': parsed.housing_subscription,
+    }
+
+
+def prepare_corpus(corpus_dir, count: int) -> List[Path]:
+    """코퍼스 폴더의 PDF 목록 (정답 파일이 없거나 문서 수가 모자라면 새로 생성)"""
+    corpus_dir = Path(corpus_dir)
+    try:
+        truth = load_truth(corpus_dir)
+    except FileNotFoundError:
+        truth = {}
+
+    if len(truth) < count:
+        return generate_corpus(corpus_dir, count)
+    return [corpus_dir / name for name in sorted(truth)[:count]]
+
+
+def _stats(samples: List[float]) -> Dict[str, float]:
+    """평균·p95·합계 (ms)"""
+    ordered = sorted(samples)
+    return {
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'total_s': sum(ordered),
+    }
+
+
+def benchmark_parser(paths: List[Path], truth: Dict[str, Dict[str, int]]) -> Dict:
+    """
+    단일 프로세스 측정 (텍스트 추출 / 섹션 색인 / 항목별 파싱 시간과 정확도)
+
+    Returns:
+        {'files', 'files_per_sec', 'stages': {단계: 통계}, 'sections': {항목: 통계},
+         'accuracy': {항목: 정확도}, 'mismatches': [...]}
+    """
+    stages = {'extract': [], 'index': [], 'parse': []}
+    sections: Dict[str, List[float]] = {}
+    correct = {field: 0 for field in TRUTH_FIELDS}
+    mismatches = []
+
+    for path in paths:
+        start = time.perf_counter()
+        with pdfplumber.open(path) as pdf:
+            texts = [page.extract_text() for page in pdf.pages]
+        full_text = "".join(text + "\n" for text in texts if text)
+        stages['extract'].append(time.perf_counter() - start)
+
+        # parse_text 와 같은 순서로 항목별 시간 측정
+        parser = TaxPDFParser()
+        parser.parsed_data.raw_text = full_text
+        start = time.perf_counter()
+        index = SectionIndex(full_text)
+        stages['index'].append(time.perf_counter() - start)
+
+        parse_total = 0.0
+        for section, section_parsers in parser.section_parsers().items():
+            start = time.perf_counter()
+            for parse in section_parsers:
+                parse(index)
+            elapsed = time.perf_counter() - start
+            sections.setdefault(section, []).append(elapsed)
+            parse_total += elapsed
+        stages['parse'].append(parse_total)
+
+        expected = truth[path.name]
+        actual = extract_fields(parser.parsed_data)
+        for field in TRUTH_FIELDS:
+            if actual[field] == expected[field]:
+                correct[field] += 1
+            else:
+                mismatches.append({
+                    'file': path.name, 'field': field,
+                    'expected': expected[field], 'actual': actual[field],
+                })
+
+    total_time = sum(sum(samples) for samples in stages.values())
+    return {
+        'files': len(paths),
+        'files_per_sec': len(paths) / total_time if total_time else 0.0,
+        'stages': {stage: _stats(samples) for stage, samples in stages.items()},
+        'sections': {section: _stats(samples) for section, samples in sections.items()},
+        'accuracy': {field: correct[field] / len(paths) for field in TRUTH_FIELDS},
+        'mismatches': mismatches,
+    }
+
+
+def benchmark_batch(paths: List[Path], max_workers: int) -> Dict:
+    """일괄 처리 엔진(process_pdfs) 처리량 (캐시 미사용)"""
+    from batch_processor import process_pdfs
+
+    files = ((path.name, path.read_bytes()) for path in paths)
+    start = time.perf_counter()
+    failed = sum(1 for result in process_pdfs(files, max_workers=max_workers, use_cache=False) if not result.success)
+    elapsed = time.perf_counter() - start
+    return {
+        'workers': max_workers,
+        'files_per_sec': len(paths) / elapsed if elapsed else 0.0,
+        'failed': failed,
+    }
+
+
+def print_report(report: Dict):
+    """측정 결과 출력"""
+    parser = report['parser']
+
+    print("=" * 60)
+    print(f"📊 파서 벤치마크 ({parser['files']}개 문서)")
+    print("=" * 60)
+    print(f"\n⚡ 처리량: {parser['files_per_sec']:.1f} files/sec (단일 프로세스)")
+    if 'batch' in report:
+        batch = report['batch']
+        print(f"⚡ 일괄 처리: {batch['files_per_sec']:.1f} files/sec ({batch['workers']}개 동시, 실패 {batch['failed']}건)")
+
+    print("\n⏱️ 단계별 소요 시간 (평균 / p95)")
+    for stage, stat in parser['stages'].items():
+        print(f"   {stage:<10} {stat['mean_ms']:8.2f} ms / {stat['p95_ms']:8.2f} ms")
+
+    print("\n⏱️ 항목별 파싱 시간 (평균 / p95)")
+    for section, stat in parser['sections'].items():
+        print(f"   {section:<10} {stat['mean_ms']:8.3f} ms / {stat['p95_ms']:8.3f} ms")
+
+    print("\n🎯 항목별 정확도")
+    for field, accuracy in parser['accuracy'].items():
+        print(f"   {field:<24} {accuracy * 100:6.1f}%")
+
+    mismatches = parser['mismatches']
+    if mismatches:
+        print(f"\n⚠️ 불일치 {len(mismatches)}건 (처음 10건)")
+        for item in mismatches[:10]:
+            print(f"   {item['file']} {item['field']}: 정답 {item['expected']:,} / 결과 {item['actual']:,}")
+
+
+def run(corpus_dir=None, count: int = 100, max_workers: int = 0) -> Dict:
+    """코퍼스 준비 후 측정 (corpus_dir 가 없으면 임시 폴더 사용)"""
+    with tempfile.TemporaryDirectory(prefix='yearend_corpus_') as tmp_dir:
+        corpus_dir = Path(corpus_dir or tmp_dir)
+        paths = prepare_corpus(corpus_dir, count)
+        truth = load_truth(corpus_dir)
+
+        report = {'parser': benchmark_parser(paths, truth)}
+        if max_workers:
+            report['batch'] = benchmark_batch(paths, max_workers)
+        return report
+
+
+if __name__ == "__main__":
+    import sys
+
+    argv = sys.argv[1:]
+    as_json = '--json' in argv
+    workers = 0
+    if '--workers' in argv:
+        i = argv.index('--workers')
+        workers = int(argv[i + 1])
+        del argv[i:i + 2]
+    args = [arg for arg in argv if not arg.startswith('--')]
+
+    report = run(
+        args[0] if args else None,
+        int(args[1]) if len(args) > 1 else 100,
+        workers
+    )
+
+    if as_json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
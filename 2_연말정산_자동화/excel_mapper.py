@@ -4,8 +4,28 @@ TAX-EASY AI - Excel 자동 매핑
 """
 
 import openpyxl
-from typing import Dict, List
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, List, Optional
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 import os
+import re
+import zipfile
+
+# 일괄 생성 시 항목별 입력 셀 (템플릿 첫 번째 시트 기준, 실제 셀 위치는 파일에 맞게 조정)
+DEFAULT_CELL_MAP = {
+    '직원명': 'C4',
+    '총급여': 'C8',
+    '의료비(공제대상)': 'F20',
+    '실손보험금': 'F21',
+    '보험료': 'F15',
+    '신용카드': 'F30',
+    '기부금': 'F25',
+    '교육비': 'F23',
+    '전세자금상환': 'F17',
+    '주택청약': 'F18',
+    '결정세액': 'C12',
+}
 
 
 class ExcelMapper:
@@ -83,3 +103,227 @@ def map_to_excel(parsed_data, template_path: str, output_path: str) -> str:
     )
     
     return mapper.save(output_path)
+
+
+# ============================================================
+# 일괄 생성 (템플릿 1회 로드)
+# ============================================================
+
+_NS = {
+    'm': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+_CELL_REF_RE = re.compile(r'^([A-Z]+)(\d+)$')
+_ROW_REF_RE = re.compile(r'<row\b[^>]*?\br="(\d+)"')
+_CELL_COL_RE = re.compile(r'<c\b[^>]*?\br="([A-Z]+)\d+"')
+
+
+# render 값으로 넘기면 템플릿 셀을 빈 셀로 비움 (None·'' 은 템플릿 셀을 그대로 유지)
+CLEAR_CELL = object()
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - 64)
+    return index
+
+
+def _find_element(xml: str, tag: str, ref: str):
+    """r 속성이 ref 인 <tag> 요소의 (시작, 끝) 위치 (없으면 None)"""
+    pattern = re.compile(
+        rf'<{tag}\b(?=[^>]*?\br="{ref}")[^>]*?(?:/>|>.*?</{tag}>)', re.DOTALL
+    )
+    match = pattern.search(xml)
+    return (match.start(), match.end()) if match else None
+
+
+class BatchExcelMapper:
+    """
+    템플릿을 한 번만 읽어 직원별 신고서를 대량 생성
+
+    템플릿 xlsx 의 시트 XML 에서 입력 셀 자리를 미리 잘라 두고,
+    직원마다 셀 XML 만 끼워 넣어 새 xlsx 를 만듭니다 (openpyxl 재로딩 없음).
+    """
+
+    def __init__(self, template, cell_map: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            template: 템플릿 xlsx 경로 또는 바이너리 파일 객체
+            cell_map: {항목명: 셀 주소} (기본: DEFAULT_CELL_MAP)
+        """
+        if isinstance(template, (str, os.PathLike)) and not os.path.exists(template):
+            raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template}")
+
+        self.cell_map = dict(cell_map or DEFAULT_CELL_MAP)
+        for ref in self.cell_map.values():
+            if not _CELL_REF_RE.match(ref):
+                raise ValueError(f"잘못된 셀 주소: {ref}")
+
+        with zipfile.ZipFile(template) as zf:
+            self.entries = [(info, zf.read(info.filename)) for info in zf.infolist()]
+
+        self.sheet_path = self._first_sheet_path()
+        self._drop_calc_chain()
+        self._force_recalculation()
+        self._compile_sheet()
+
+    def _entry(self, name: str) -> Optional[bytes]:
+        for info, data in self.entries:
+            if info.filename == name:
+                return data
+        return None
+
+    def _replace_entry(self, name: str, data: Optional[bytes]):
+        self.entries = [
+            (info, data if info.filename == name else old)
+            for info, old in self.entries
+            if not (info.filename == name and data is None)
+        ]
+
+    def _first_sheet_path(self) -> str:
+        """workbook.xml 의 첫 번째 시트 파일 경로"""
+        workbook = ElementTree.fromstring(self._entry('xl/workbook.xml'))
+        rels = ElementTree.fromstring(self._entry('xl/_rels/workbook.xml.rels'))
+        sheet = workbook.find('m:sheets/m:sheet', _NS)
+        rel_id = sheet.get(f"{{{_NS['r']}}}id")
+        for rel in rels.findall('rel:Relationship', _NS):
+            if rel.get('Id') == rel_id:
+                target = rel.get('Target').lstrip('/')
+                return target if target.startswith('xl/') else f"xl/{target}"
+        raise ValueError("템플릿에서 시트를 찾을 수 없습니다")
+
+    def _drop_calc_chain(self):
+        """입력 셀에 있던 수식과 어긋나지 않도록 계산 체인 제거 (Excel 이 다시 생성)"""
+        if self._entry('xl/calcChain.xml') is None:
+            return
+        self._replace_entry('xl/calcChain.xml', None)
+        for name, pattern in (
+            ('[Content_Types].xml', r'<Override\b[^>]*?PartName="/xl/calcChain\.xml"[^>]*?/>'),
+            ('xl/_rels/workbook.xml.rels', r'<Relationship\b[^>]*?Target="[^"]*calcChain\.xml"[^>]*?/>'),
+        ):
+            xml = self._entry(name).decode('utf-8')
+            self._replace_entry(name, re.sub(pattern, '', xml).encode('utf-8'))
+
+    def _force_recalculation(self):
+        """열 때 전체 재계산 (입력값에 연결된 수식 갱신)"""
+        xml = self._entry('xl/workbook.xml').decode('utf-8')
+        if '<calcPr' in xml:
+            xml = re.sub(r'<calcPr\b', '<calcPr fullCalcOnLoad="1"', xml.replace(' fullCalcOnLoad="1"', ''), count=1)
+        else:
+            anchor = max(xml.find('</definedNames>'), xml.find('</sheets>'))
+            anchor = xml.find('>', anchor) + 1
+            xml = xml[:anchor] + '<calcPr fullCalcOnLoad="1"/>' + xml[anchor:]
+        self._replace_entry('xl/workbook.xml', xml.encode('utf-8'))
+
+    def _ensure_cell(self, xml: str, ref: str) -> str:
+        """셀이 없으면 행/열 순서에 맞게 빈 셀 추가"""
+        if _find_element(xml, 'c', ref):
+            return xml
+
+        column, row_no = _CELL_REF_RE.match(ref).groups()
+        cell = f'<c r="{ref}"/>'
+        row = _find_element(xml, 'row', row_no)
+
+        if row is None:
+            if '<sheetData/>' in xml:
+                xml = xml.replace('<sheetData/>', '<sheetData></sheetData>')
+            insert_at = xml.find('</sheetData>')
+            for match in _ROW_REF_RE.finditer(xml):
+                if int(match.group(1)) > int(row_no):
+                    insert_at = match.start()
+                    break
+            return xml[:insert_at] + f'<row r="{row_no}">{cell}</row>' + xml[insert_at:]
+
+        start, end = row
+        row_xml = xml[start:end]
+        if row_xml.endswith('/>'):
+            row_xml = row_xml[:-2] + '></row>'
+        insert_at = row_xml.rfind('</row>')
+        for match in _CELL_COL_RE.finditer(row_xml):
+            if _column_index(match.group(1)) > _column_index(column):
+                insert_at = match.start()
+                break
+        row_xml = row_xml[:insert_at] + cell + row_xml[insert_at:]
+        return xml[:start] + row_xml + xml[end:]
+
+    def _compile_sheet(self):
+        """입력 셀 자리를 잘라 [고정 XML, 셀, 고정 XML, ...] 조각으로 보관"""
+        xml = self._entry(self.sheet_path).decode('utf-8')
+        for ref in self.cell_map.values():
+            xml = self._ensure_cell(xml, ref)
+
+        spans = []
+        for key, ref in self.cell_map.items():
+            start, end = _find_element(xml, 'c', ref)
+            style = re.search(r'\bs="(\d+)"', xml[start:xml.find('>', start)])
+            spans.append((start, end, key, ref, f' s="{style.group(1)}"' if style else ''))
+        spans.sort()
+
+        self.parts = []
+        self.slots = []  # (항목명, 셀 주소, 스타일 속성, 템플릿 원래 셀 XML)
+        pos = 0
+        for start, end, key, ref, style in spans:
+            self.parts.append(xml[pos:start])
+            self.slots.append((key, ref, style, xml[start:end]))
+            pos = end
+        self.parts.append(xml[pos:])
+
+    @staticmethod
+    def _cell_xml(ref: str, style: str, value, original: str) -> str:
+        if value is None or value == '':
+            return original  # 값이 없으면 템플릿의 값·수식 유지
+        if value is CLEAR_CELL:
+            return f'<c r="{ref}"{style}/>'
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f'<c r="{ref}"{style}><v>{value}</v></c>'
+        return (f'<c r="{ref}"{style} t="inlineStr">'
+                f'<is><t xml:space="preserve">{escape(str(value))}</t></is></c>')
+
+    def render(self, values: Dict) -> bytes:
+        """
+        직원 1명 신고서 xlsx 바이트 생성
+
+        값이 None 이거나 없는 항목은 템플릿 셀을 그대로 두고,
+        CLEAR_CELL 을 넘긴 항목만 빈 셀로 비웁니다.
+        """
+        chunks = [self.parts[0]]
+        for (key, ref, style, original), part in zip(self.slots, self.parts[1:]):
+            value = values.get(key)
+            if hasattr(value, 'item'):  # numpy 스칼라
+                value = value.item()
+            chunks.append(self._cell_xml(ref, style, value, original))
+            chunks.append(part)
+        sheet = ''.join(chunks).encode('utf-8')
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for info, data in self.entries:
+                zf.writestr(info.filename, sheet if info.filename == self.sheet_path else data)
+        return buffer.getvalue()
+
+    def write_zip(self, rows: Iterable[Dict], output: BinaryIO, name_key: str = '직원명') -> int:
+        """
+        직원별 신고서를 ZIP 으로 순차 기록 (직원 1명분만 메모리에 유지)
+
+        Args:
+            rows: 직원별 값 (cell_map 의 항목명 키)
+            output: 바이너리 출력 (파일, BytesIO, 스트리밍 응답 등)
+            name_key: 파일명에 쓸 항목
+
+        Returns:
+            int: 생성한 신고서 수
+        """
+        used = {}
+        count = 0
+        # xlsx 는 이미 압축되어 있으므로 바깥 ZIP 은 무압축
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as zf:
+            for row in rows:
+                base = str(row.get(name_key) or f"직원{count + 1}")
+                used[base] = used.get(base, 0) + 1
+                suffix = f"_{used[base]}" if used[base] > 1 else ""
+                zf.writestr(f"{base}{suffix}_근로소득세액공제신고서.xlsx", self.render(row))
+                count += 1
+        return count
@@ -6,11 +6,17 @@ TAX-EASY AI - 주택 관련 항목 전용 파서
 import re
 from typing import Dict, List
 
+AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*)')
 
-def parse_jeonse_loan(text: str) -> Dict:
+
+def parse_jeonse_loan(text: str, index=None) -> Dict:
     """
     전세자금 대출 원리금 상환액 파싱
     
+    Args:
+        text: 문서 전체 텍스트
+        index: pdf_parser.SectionIndex (있으면 키워드 위치를 색인에서 조회)
+    
     Returns:
         {
             'found': bool,
@@ -24,31 +30,32 @@ def parse_jeonse_loan(text: str) -> Dict:
         'details': []
     }
     
-    if '주택임차차입금' not in text and '전세자금' not in text:
+    find = index.find if index is not None else text.find
+    
+    if find('주택임차차입금') == -1 and find('전세자금') == -1:
         return result
     
     # 주택임차차입금 섹션 추출
-    section_start = text.find('주택임차차입금')
+    section_start = find('주택임차차입금')
     if section_start == -1:
-        section_start = text.find('전세자금')
+        section_start = find('전세자금')
     
     if section_start == -1:
         return result
     
-    section_end = text.find('주택마련저축', section_start)
+    section_end = find('주택마련저축', section_start)
     if section_end == -1:
-        section_end = text.find('주택청약', section_start)
+        section_end = find('주택청약', section_start)
     if section_end == -1:
         section_end = len(text)
     
     section_text = text[section_start:section_end]
     
-    amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
     lines = section_text.split('\n')
     
     for line in lines:
         if '합 계' in line or ('합계' in line and '상환액' in section_text[:section_text.find(line)+1000]):
-            amounts = re.findall(amount_pattern, line)
+            amounts = AMOUNT_RE.findall(line)
             if amounts:
                 amount_str = amounts[-1].replace(',', '')
                 try:
@@ -63,10 +70,14 @@ def parse_jeonse_loan(text: str) -> Dict:
     return result
 
 
-def parse_housing_subscription(text: str) -> Dict:
+def parse_housing_subscription(text: str, index=None) -> Dict:
     """
     주택청약저축 납입액 파싱
     
+    Args:
+        text: 문서 전체 텍스트
+        index: pdf_parser.SectionIndex (있으면 키워드 위치를 색인에서 조회)
+    
     Returns:
         {
             'found': bool,
@@ -80,33 +91,34 @@ def parse_housing_subscription(text: str) -> Dict:
         'account_details': []
     }
     
-    if '주택마련저축' not in text and '주택청약' not in text:
+    find = index.find if index is not None else text.find
+    
+    if find('주택마련저축') == -1 and find('주택청약') == -1:
         return result
     
     # 주택마련저축 섹션 추출
-    section_start = text.find('주택마련저축')
+    section_start = find('주택마련저축')
     if section_start == -1:
-        section_start = text.find('주택청약저축')
+        section_start = find('주택청약저축')
     if section_start == -1:
-        section_start = text.find('청약종합저축')
+        section_start = find('청약종합저축')
     
     if section_start == -1:
         return result
     
-    section_end = text.find('의료비', section_start)
+    section_end = find('의료비', section_start)
     if section_end == -1:
-        section_end = text.find('신용카드', section_start)
+        section_end = find('신용카드', section_start)
     if section_end == -1:
         section_end = len(text)
     
     section_text = text[section_start:section_end]
     
-    amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
     lines = section_text.split('\n')
     
     for line in lines:
         if '합 계' in line or ('합계' in line and '납입' in section_text[:section_text.find(line)+1000]):
-            amounts = re.findall(amount_pattern, line)
+            amounts = AMOUNT_RE.findall(line)
             if amounts:
                 amount_str = amounts[-1].replace(',', '')
                 try:
@@ -121,10 +133,14 @@ def parse_housing_subscription(text: str) -> Dict:
     return result
 
 
-def parse_housing_data(text: str) -> Dict:
+def parse_housing_data(text: str, index=None) -> Dict:
     """
     주택 관련 모든 데이터 파싱
     
+    Args:
+        text: 문서 전체 텍스트
+        index: pdf_parser.SectionIndex (TaxPDFParser 에서 만든 색인 재사용)
+    
     Returns:
         {
             'jeonse_loan': Dict,
@@ -132,6 +148,6 @@ def parse_housing_data(text: str) -> Dict:
         }
     """
     return {
-        'jeonse_loan': parse_jeonse_loan(text),
-        'housing_subscription': parse_housing_subscription(text)
+        'jeonse_loan': parse_jeonse_loan(text, index),
+        'housing_subscription': parse_housing_subscription(text, index)
     }
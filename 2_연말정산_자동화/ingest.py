@@ -0,0 +1,204 @@
+"""
+TAX-EASY AI - 대량 PDF 수집
+ZIP 파일이나 서버 폴더의 간소화 PDF를 한 건씩 읽어 일괄 처리 엔진에 넘기고,
+처리 결과는 임시 SQLite 파일에 바로 기록하여 메모리 사용량을 일정하게 유지합니다.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from batch_processor import BatchResult, process_pdfs
+
+
+def _entry_name(info: zipfile.ZipInfo) -> str:
+    """ZIP 항목 파일명 (UTF-8 플래그가 없으면 Windows 한글 압축 파일로 보고 cp949 로 복원)"""
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode('cp437').decode('cp949')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return os.path.basename(name)
+
+
+def _is_pdf_entry(info: zipfile.ZipInfo) -> bool:
+    name = info.filename
+    return (
+        not info.is_dir()
+        and name.lower().endswith('.pdf')
+        and not name.startswith('__MACOSX/')
+        and not os.path.basename(name).startswith('._')
+    )
+
+
+def count_zip_pdfs(source) -> int:
+    """ZIP 안의 PDF 수 (목록만 읽음)"""
+    with zipfile.ZipFile(source) as zf:
+        return sum(1 for info in zf.infolist() if _is_pdf_entry(info))
+
+
+def iter_zip_pdfs(source) -> Iterator[Tuple[str, bytes]]:
+    """
+    ZIP 안의 PDF 를 한 건씩 읽기 (요청한 항목만 압축 해제)
+
+    Args:
+        source: ZIP 경로 또는 바이너리 파일 객체
+
+    Yields:
+        (파일명, PDF 바이트)
+    """
+    with zipfile.ZipFile(source) as zf:
+        for info in zf.infolist():
+            if _is_pdf_entry(info):
+                yield _entry_name(info), zf.read(info)
+
+
+def list_folder_pdfs(folder) -> List[Path]:
+    """서버 폴더 안의 PDF 경로 (하위 폴더 포함, 이름순)"""
+    folder = Path(folder)
+    if not folder.is_dir():
+        raise FileNotFoundError(f"폴더를 찾을 수 없습니다: {folder}")
+    return sorted(p for p in folder.rglob('*') if p.is_file() and p.suffix.lower() == '.pdf')
+
+
+def iter_folder_pdfs(paths: List[Path]) -> Iterator[Tuple[str, bytes]]:
+    """폴더 PDF 를 한 건씩 읽기"""
+    for path in paths:
+        yield path.name, path.read_bytes()
+
+
+class ResultSpool:
+    """
+    일괄 처리 결과 임시 저장소 (임시 SQLite 파일)
+
+    결과를 받는 즉시 디스크에 기록하고, 화면·엑셀용 데이터는 필요할 때 나눠 읽습니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='yearend_batch_', suffix='.db')
+            os.close(fd)
+            self._owns_file = True
+        else:
+            self._owns_file = False
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file_name TEXT NOT NULL,
+            employee_name TEXT,
+            success INTEGER NOT NULL,
+            error TEXT,
+            data TEXT
+        )
+        """)
+
+    def add(self, result: BatchResult, row: Optional[Dict] = None):
+        """처리 결과 1건 기록 (row 를 주면 result.row 대신 저장)"""
+        self.conn.execute(
+            "INSERT INTO results (file_name, employee_name, success, error, data) VALUES (?, ?, ?, ?, ?)",
+            (
+                result.file_name,
+                result.employee_name,
+                int(result.success),
+                result.error,
+                json.dumps(row if row is not None else result.row, ensure_ascii=False)
+                if result.success else None,
+            )
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+    def update_rows(self, rows: Dict[int, Dict]):
+        """{id: row} 로 저장된 행 갱신 (결정세액 등 후처리 결과 반영)"""
+        self.conn.executemany(
+            "UPDATE results SET data = ? WHERE id = ?",
+            [(json.dumps(row, ensure_ascii=False), row_id) for row_id, row in rows.items()]
+        )
+        self.conn.commit()
+
+    def counts(self) -> Tuple[int, int]:
+        """(성공 수, 실패 수)"""
+        ok, failed = self.conn.execute(
+            "SELECT COALESCE(SUM(success), 0), COALESCE(SUM(1 - success), 0) FROM results"
+        ).fetchone()
+        return ok, failed
+
+    def errors(self, limit: int = 1000) -> List[str]:
+        cursor = self.conn.execute(
+            "SELECT file_name, error FROM results WHERE success = 0 ORDER BY id LIMIT ?", (limit,)
+        )
+        return [f"{name}: {error}" for name, error in cursor]
+
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[List[Tuple[int, Dict]]]:
+        """성공한 행을 chunk_size 건씩 [(id, row)] 로 읽기 (후처리 후 update_rows 로 반영)"""
+        last_id = 0
+        while True:
+            chunk = self.conn.execute(
+                "SELECT id, data FROM results WHERE success = 1 AND id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size)
+            ).fetchall()
+            if not chunk:
+                return
+            yield [(row_id, json.loads(data)) for row_id, data in chunk]
+            last_id = chunk[-1][0]
+
+    def iter_rows(self, chunk_size: int = 500) -> Iterator[Tuple[int, Dict]]:
+        """성공한 행을 (id, row) 로 나눠 읽기"""
+        for chunk in self.iter_chunks(chunk_size):
+            yield from chunk
+
+    def to_dataframe(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """성공한 행 DataFrame (limit 지정 시 앞부분만)"""
+        rows = []
+        for _, row in self.iter_rows():
+            rows.append(row)
+            if limit is not None and len(rows) >= limit:
+                break
+        return pd.DataFrame(rows)
+
+    def close(self):
+        self.conn.close()
+        if self._owns_file and os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def ingest(
+    files: Iterator[Tuple[str, bytes]],
+    spool: ResultSpool,
+    make_row: Callable[[BatchResult], Dict] = None,
+    on_result: Callable[[BatchResult], None] = None,
+    commit_every: int = 50,
+    **process_options
+) -> ResultSpool:
+    """
+    PDF 를 한 건씩 파싱해 결과를 바로 임시 저장소에 기록
+
+    Args:
+        files: (파일명, PDF 바이트) 이터레이터 (iter_zip_pdfs, iter_folder_pdfs 등)
+        spool: 결과 저장소
+        make_row: 성공 결과를 저장할 행으로 변환 (기본: result.row)
+        on_result: 결과마다 호출 (진행률 표시 등)
+        commit_every: 커밋 주기 (건)
+        process_options: process_pdfs 옵션 (max_workers, timeout, use_cache)
+    """
+    for count, result in enumerate(process_pdfs(files, **process_options), 1):
+        row = make_row(result) if make_row and result.success else None
+        spool.add(result, row)
+        if count % commit_every == 0:
+            spool.commit()
+        if on_result:
+            on_result(result)
+    spool.commit()
+    return spool
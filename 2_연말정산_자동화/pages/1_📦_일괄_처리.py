@@ -6,17 +6,25 @@
 import streamlit as st
 import pandas as pd
 from pathlib import Path
+import itertools
+import os
 import sys
+import zipfile
 from io import BytesIO
 from datetime import datetime
 
 # 상위 디렉토리 모듈 import
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 
 try:
-    from pdf_parser import YearEndTaxPDFParser
-    from excel_mapper import YearEndTaxExcelMapper
-    from housing_parser import HousingDeductionParser
+    from batch_processor import DEFAULT_FILE_TIMEOUT, DEFAULT_MAX_WORKERS, process_pdfs
+    from settlement import load_payroll_totals, run_settlement
+    from tax_database import save_year_end_batch, get_year_over_year
+    from excel_mapper import BatchExcelMapper
+    from ingest import ResultSpool, count_zip_pdfs, ingest, iter_folder_pdfs, iter_zip_pdfs, list_folder_pdfs
+    from shared.database import get_employee_by_name
+    from shared.excel_writer import XLSX_MIME, ZIP_MIME, build_workbook
 except ImportError as e:
     st.error(f"모듈 import 실패: {e}")
     st.stop()
@@ -28,6 +36,10 @@ st.set_page_config(
     layout="wide"
 )
 
+# 결과 후처리 묶음 크기 / 화면 미리보기 행 수
+RESULT_CHUNK_SIZE = 500
+PREVIEW_ROWS = 1000
+
 st.title("📦 연말정산 일괄 처리")
 st.markdown("여러 직원의 PDF를 한 번에 업로드하고 엑셀로 통합 다운로드합니다.")
 
@@ -39,21 +51,75 @@ st.divider()
 
 st.subheader("📤 PDF 파일 업로드")
 
-uploaded_files = st.file_uploader(
-    "연말정산 PDF 파일 선택 (여러 개 가능)",
-    type=['pdf'],
-    accept_multiple_files=True,
-    help="Ctrl(Cmd) + 클릭으로 여러 파일 선택 가능"
+source_type = st.radio(
+    "입력 방식",
+    ["PDF 파일", "ZIP 파일", "서버 폴더"],
+    horizontal=True,
+    help="직원 수가 많으면 서버 폴더를 사용하세요 (PDF를 한 건씩 읽어 메모리 사용량 일정). "
+         "업로드한 파일(PDF·ZIP)은 브라우저 업로드 특성상 전체가 메모리에 올라갑니다."
 )
 
-if uploaded_files:
-    st.success(f"✅ {len(uploaded_files)}개 파일 업로드 완료")
+source_ready = False
+total = 0
+
+if source_type == "PDF 파일":
+    uploaded_files = st.file_uploader(
+        "연말정산 PDF 파일 선택 (여러 개 가능)",
+        type=['pdf'],
+        accept_multiple_files=True,
+        help="Ctrl(Cmd) + 클릭으로 여러 파일 선택 가능"
+    )
     
-    # 파일 목록 표시
-    with st.expander("📋 업로드된 파일 목록"):
-        for i, file in enumerate(uploaded_files, 1):
-            st.write(f"{i}. {file.name} ({file.size:,} bytes)")
+    if uploaded_files:
+        total = len(uploaded_files)
+        source_ready = True
+        st.success(f"✅ {total}개 파일 업로드 완료")
+        
+        # 파일 목록 표시
+        with st.expander("📋 업로드된 파일 목록"):
+            for i, file in enumerate(uploaded_files, 1):
+                st.write(f"{i}. {file.name} ({file.size:,} bytes)")
+
+elif source_type == "ZIP 파일":
+    zip_file = st.file_uploader(
+        "연말정산 PDF를 묶은 ZIP 파일 선택",
+        type=['zip'],
+        help="ZIP 안의 PDF를 한 건씩 압축 해제하여 처리 (하위 폴더 포함, ZIP 파일 자체는 메모리에 유지)"
+    )
+    
+    if zip_file is not None:
+        try:
+            total = count_zip_pdfs(zip_file)
+        except zipfile.BadZipFile:
+            st.error("❌ 올바른 ZIP 파일이 아닙니다.")
+        else:
+            source_ready = total > 0
+            if source_ready:
+                st.success(f"✅ ZIP 안의 PDF {total:,}개 확인 ({zip_file.size:,} bytes)")
+            else:
+                st.warning("⚠️ ZIP 안에 PDF 파일이 없습니다.")
+
+else:
+    folder_path = st.text_input(
+        "서버 폴더 경로",
+        placeholder="/data/yearend/2025",
+        help="서버에 있는 PDF 폴더 (하위 폴더 포함)"
+    )
     
+    if folder_path:
+        try:
+            folder_pdfs = list_folder_pdfs(folder_path)
+        except FileNotFoundError as e:
+            st.error(f"❌ {e}")
+        else:
+            total = len(folder_pdfs)
+            source_ready = total > 0
+            if source_ready:
+                st.success(f"✅ 폴더 안의 PDF {total:,}개 확인")
+            else:
+                st.warning("⚠️ 폴더에 PDF 파일이 없습니다.")
+
+if source_ready:
     st.divider()
     
     # ============================================================
@@ -78,6 +144,59 @@ if uploaded_files:
             help="모든 결과를 하나의 엑셀 파일로 통합"
         )
     
+    template_file = None
+    if not merge_excel:
+        template_file = st.file_uploader(
+            "📄 근로소득세액공제신고서 템플릿 (xlsx)",
+            type=['xlsx'],
+            help="직원별 신고서를 이 템플릿으로 생성하여 ZIP으로 다운로드"
+        )
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        max_workers = st.number_input(
+            "⚙️ 동시 처리 수",
+            min_value=1,
+            max_value=max(DEFAULT_MAX_WORKERS, os.cpu_count() or 1),
+            value=DEFAULT_MAX_WORKERS,
+            help="동시에 파싱할 PDF 수 (CPU 코어 수 이하 권장)"
+        )
+    
+    with col4:
+        file_timeout = st.number_input(
+            "⏱️ 파일당 제한 시간 (초)",
+            min_value=10,
+            max_value=600,
+            value=DEFAULT_FILE_TIMEOUT,
+            step=10,
+            help="제한 시간을 넘긴 파일은 실패로 처리하고 나머지를 계속 처리"
+        )
+    
+    col5, col6, col7 = st.columns(3)
+    
+    with col5:
+        calc_settlement = st.checkbox(
+            "🧮 결정세액 계산",
+            value=True,
+            help="급여 이력의 연간 합계와 PDF 공제 자료로 결정세액·환급액 계산 (직원명으로 매칭)"
+        )
+    
+    with col6:
+        save_to_db = st.checkbox(
+            "💾 연말정산 DB 저장",
+            value=True,
+            help="직원별 공제 자료와 결정세액을 저장하여 내년에 전년 대비로 비교"
+        )
+    
+    with col7:
+        settlement_year = st.number_input(
+            "📅 귀속 연도",
+            min_value=2020,
+            max_value=datetime.now().year,
+            value=datetime.now().year - 1
+        )
+    
     st.divider()
     
     # ============================================================
@@ -90,40 +209,147 @@ if uploaded_files:
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # 결과 저장
-        all_results = []
-        errors = []
+        # 입력 PDF 는 한 건씩 읽고, 결과는 임시 DB에 바로 기록
+        if source_type == "PDF 파일":
+            files = ((f.name, f.getvalue()) for f in uploaded_files)
+        elif source_type == "ZIP 파일":
+            files = iter_zip_pdfs(zip_file)
+        else:
+            files = iter_folder_pdfs(folder_pdfs)
+        
+        def make_row(result):
+            row = {'직원명': result.employee_name, '파일명': result.file_name}
+            row.update(result.row)
+            if not parse_housing:
+                row.pop('전세자금상환', None)
+                row.pop('주택청약', None)
+            return row
         
-        for i, uploaded_file in enumerate(uploaded_files):
-            try:
-                status_text.text(f"처리 중: {uploaded_file.name} ({i+1}/{len(uploaded_files)})")
+        done_counter = itertools.count(1)
+        
+        def on_result(result):
+            done_count = next(done_counter)
+            
+            # 진행률 업데이트
+            progress_bar.progress(min(done_count / total, 1.0))
+            status_text.text(f"처리 중: {result.file_name} 완료 ({done_count:,}/{total:,})")
+        
+        spool = ResultSpool()
+        try:
+            # 완료되는 순서대로 결과 수신
+            ingest(
+                files, spool,
+                make_row=make_row,
+                on_result=on_result,
+                max_workers=int(max_workers),
+                timeout=file_timeout
+            )
+            errors = spool.errors()
+            ok_count, _ = spool.counts()
+            
+            # 급여 이력은 한 번만 조회하고 결정세액은 묶음별로 계산
+            payroll = None
+            if calc_settlement and ok_count:
+                try:
+                    payroll = load_payroll_totals(int(settlement_year))
+                except Exception as e:
+                    st.error(f"❌ 급여 이력 조회 실패로 결정세액을 계산하지 못했습니다: {e}")
+            
+            if (calc_settlement or save_to_db) and ok_count:
+                status_text.text("결정세액 계산 및 저장 중...")
+            
+            # 임시 DB의 결과를 묶음 단위로 읽어 매칭·계산·저장·집계 (전체 결과를 메모리에 올리지 않음)
+            unknown, unmatched = [], []
+            saved_count = 0
+            save_error = None
+            columns = {}  # 엑셀 컬럼 (처음 나온 순서)
+            totals = {col: 0 for col in ['결정세액', '의료비(공제대상)', '신용카드', '보험료']}
+            refund_total = collect_total = 0
+            
+            for chunk in spool.iter_chunks(RESULT_CHUNK_SIZE):
+                rows = dict(chunk)
+                
+                # 직원명으로 직원 매칭
+                if calc_settlement or save_to_db:
+                    for row in rows.values():
+                        employee = get_employee_by_name(row['직원명'])
+                        if employee:
+                            row['emp_id'] = employee['emp_id']
+                        else:
+                            unknown.append(row['직원명'])
                 
-                # PDF 파싱
-                parser = YearEndTaxPDFParser(uploaded_file)
-                data = parser.parse()
+                # 결정세액 계산 (급여 이력이 있는 직원만)
+                if payroll is not None:
+                    parsed_by_emp = {row['emp_id']: row for row in rows.values() if row.get('emp_id')}
+                    chunk_payroll = payroll[payroll['emp_id'].isin(parsed_by_emp)] if not payroll.empty else payroll
+                    settlement = run_settlement(int(settlement_year), parsed_by_emp, payroll=chunk_payroll)
+                    if not settlement.empty:
+                        settlement = settlement.set_index('emp_id')
+                        for row in rows.values():
+                            if row.get('emp_id') in settlement.index:
+                                values = settlement.loc[row['emp_id']]
+                                for col in ['총급여', '근로소득공제', '과세표준', '산출세액', '결정세액', '기납부세액', '차감징수세액']:
+                                    row[col] = int(values[col])
+                    unmatched.extend(
+                        row['직원명'] for row in rows.values() if row.get('emp_id') and '결정세액' not in row
+                    )
                 
-                if data:
-                    # 주택자금공제 파싱 (선택 시)
-                    if parse_housing:
-                        housing_parser = HousingDeductionParser(uploaded_file)
-                        housing_data = housing_parser.parse()
-                        if housing_data:
-                            data.update(housing_data)
-                    
-                    # 파일명에서 이름 추출 (예: 홍길동_연말정산.pdf -> 홍길동)
-                    employee_name = uploaded_file.name.split('_')[0] if '_' in uploaded_file.name else uploaded_file.name.replace('.pdf', '')
-                    data['파일명'] = uploaded_file.name
-                    data['직원명'] = employee_name
-                    
-                    all_results.append(data)
-                else:
-                    errors.append(f"{uploaded_file.name}: 데이터 추출 실패")
+                # 연말정산 DB 저장 (묶음당 트랜잭션 1회, 실패하면 이후 묶음은 저장하지 않음)
+                if save_to_db and save_error is None:
+                    try:
+                        saved_count += save_year_end_batch(int(settlement_year), list(rows.values()), parsed_by='일괄 처리')
+                    except Exception as e:
+                        save_error = e
+                        st.error(f"❌ 연말정산 DB 저장 실패 ({saved_count}명까지 저장됨): {e}")
                 
-            except Exception as e:
-                errors.append(f"{uploaded_file.name}: {str(e)}")
+                spool.update_rows(rows)
+                
+                for row in rows.values():
+                    for key in row:
+                        columns.setdefault(key, None)
+                    for col in totals:
+                        totals[col] += row.get(col) or 0
+                    balance = row.get('차감징수세액') or 0
+                    if balance < 0:
+                        refund_total -= balance
+                    else:
+                        collect_total += balance
             
-            # 진행률 업데이트
-            progress_bar.progress((i + 1) / len(uploaded_files))
+            if unknown:
+                errors.append(f"직원 정보 없음 (결정세액 계산·저장 제외): {', '.join(unknown)}")
+            if unmatched:
+                errors.append(f"결정세액 미계산 ({settlement_year}년 급여 이력 없음): {', '.join(unmatched)}")
+            
+            # 화면에는 앞부분만 표시
+            preview = spool.to_dataframe(limit=PREVIEW_ROWS)
+            
+            # 다운로드 파일도 임시 DB에서 한 행씩 읽어 작성
+            download = None
+            if ok_count and merge_excel:
+                status_text.text("엑셀 작성 중...")
+                excel_columns = list(columns)
+                buffer = BytesIO()
+                build_workbook(
+                    lambda book: book.add_sheet(
+                        '연말정산_통합',
+                        ([row.get(col) for col in excel_columns] for _, row in spool.iter_rows()),
+                        columns=[(col, max(12, len(col) * 2)) for col in excel_columns]
+                    ),
+                    buffer
+                )
+                download = ('excel', buffer.getvalue(), ok_count)
+            elif ok_count and template_file is not None:
+                # 직원별 신고서 ZIP (템플릿 1회 로드)
+                status_text.text("직원별 신고서 작성 중...")
+                try:
+                    mapper = BatchExcelMapper(BytesIO(template_file.getvalue()))
+                    buffer = BytesIO()
+                    count = mapper.write_zip((row for _, row in spool.iter_rows()), buffer)
+                    download = ('zip', buffer.getvalue(), count)
+                except Exception as e:
+                    st.error(f"❌ 신고서 생성 실패: {e}")
+        finally:
+            spool.close()
         
         status_text.text("처리 완료!")
         
@@ -133,21 +359,21 @@ if uploaded_files:
         # 결과 표시
         # ============================================================
         
-        if all_results:
-            st.success(f"✅ {len(all_results)}개 파일 처리 완료!")
-            
-            # DataFrame 생성
-            df = pd.DataFrame(all_results)
+        if ok_count:
+            st.success(f"✅ {ok_count:,}개 파일 처리 완료!")
             
             # 주요 정보만 표시
-            display_columns = ['직원명', '파일명', '총급여', '근로소득공제', '과세표준', '결정세액']
-            available_columns = [col for col in display_columns if col in df.columns]
+            display_columns = ['직원명', '파일명', '총급여', '근로소득공제', '과세표준', '결정세액', '차감징수세액',
+                               '의료비(공제대상)', '보험료', '신용카드', '기부금', '교육비', '전세자금상환', '주택청약']
+            available_columns = [col for col in display_columns if col in preview.columns]
             
             st.dataframe(
-                df[available_columns] if available_columns else df,
+                preview[available_columns] if available_columns else preview,
                 use_container_width=True,
                 hide_index=True
             )
+            if ok_count > len(preview):
+                st.caption(f"💡 앞 {len(preview):,}건만 표시합니다. 전체 결과는 엑셀로 내려받으세요.")
             
             # 통계
             st.divider()
@@ -156,44 +382,73 @@ if uploaded_files:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                if '총급여' in df.columns:
-                    st.metric("평균 총급여", f"₩{df['총급여'].mean():,.0f}")
+                st.metric("처리 인원", f"{ok_count}명")
             
             with col2:
-                if '결정세액' in df.columns:
-                    st.metric("평균 결정세액", f"₩{df['결정세액'].mean():,.0f}")
+                if '결정세액' in columns:
+                    st.metric("결정세액 합계", f"₩{totals['결정세액']:,.0f}")
+                elif '의료비(공제대상)' in columns:
+                    st.metric("의료비 합계", f"₩{totals['의료비(공제대상)']:,.0f}")
             
             with col3:
-                if '총급여' in df.columns:
-                    st.metric("총급여 합계", f"₩{df['총급여'].sum():,.0f}")
+                if '차감징수세액' in columns:
+                    st.metric("환급 합계", f"₩{refund_total:,.0f}")
+                elif '신용카드' in columns:
+                    st.metric("신용카드 합계", f"₩{totals['신용카드']:,.0f}")
             
             with col4:
-                if '결정세액' in df.columns:
-                    st.metric("결정세액 합계", f"₩{df['결정세액'].sum():,.0f}")
+                if '차감징수세액' in columns:
+                    st.metric("추가 납부 합계", f"₩{collect_total:,.0f}")
+                elif '보험료' in columns:
+                    st.metric("보험료 합계", f"₩{totals['보험료']:,.0f}")
+            
+            # 전년 대비
+            if saved_count:
+                st.divider()
+                st.subheader(f"📈 전년 대비 ({settlement_year - 1}년 → {settlement_year}년)")
+                st.caption(f"💾 {saved_count}명 저장 완료")
+                
+                yoy = pd.DataFrame(get_year_over_year(int(settlement_year)))
+                if not yoy.empty:
+                    yoy_columns = {
+                        'name': '직원명',
+                        'medical_net_delta': '의료비 증감',
+                        'credit_card_usage_delta': '신용카드 증감',
+                        'donation_delta': '기부금 증감',
+                        'education_delta': '교육비 증감',
+                        'determined_tax_delta': '결정세액 증감',
+                    }
+                    st.dataframe(
+                        yoy[list(yoy_columns)].rename(columns=yoy_columns),
+                        use_container_width=True,
+                        hide_index=True
+                    )
             
             # 엑셀 다운로드
             st.divider()
             st.subheader("📥 다운로드")
             
-            if merge_excel:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if download and download[0] == 'excel':
                 # 단일 엑셀 파일로 통합
-                mapper = YearEndTaxExcelMapper()
-                
-                buffer = BytesIO()
-                with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                    df.to_excel(writer, sheet_name='연말정산_통합', index=False)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 st.download_button(
                     label="📥 통합 엑셀 다운로드",
-                    data=buffer.getvalue(),
+                    data=download[1],
                     file_name=f"연말정산_일괄처리_{timestamp}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    mime=XLSX_MIME,
                     use_container_width=True
                 )
-            else:
+            elif download and download[0] == 'zip':
+                st.download_button(
+                    label=f"📥 직원별 신고서 ZIP 다운로드 ({download[2]}명)",
+                    data=download[1],
+                    file_name=f"연말정산_신고서_{timestamp}.zip",
+                    mime=ZIP_MIME,
+                    use_container_width=True
+                )
+            elif template_file is None and not merge_excel:
                 # 개별 엑셀 파일로 제공
-                st.info("💡 개별 다운로드는 메인 페이지에서 각 PDF를 처리하세요.")
+                st.info("💡 직원별 신고서를 받으려면 처리 옵션에서 템플릿을 업로드하세요.")
         
         # 에러 표시
         if errors:
@@ -205,7 +460,7 @@ if uploaded_files:
                     st.write(f"- {error}")
 
 else:
-    st.info("💡 PDF 파일을 업로드하면 일괄 처리를 시작할 수 있습니다.")
+    st.info("💡 PDF 파일이나 ZIP 파일을 업로드하거나 서버 폴더를 지정하면 일괄 처리를 시작할 수 있습니다.")
     
     st.markdown("""
     ### 📌 사용 방법
@@ -214,6 +469,7 @@ else:
        - 파일 선택 버튼 클릭
        - Ctrl(Cmd) + 클릭으로 여러 파일 선택
        - 또는 드래그 & 드롭
+       - 직원이 많으면 PDF를 ZIP으로 묶어 올리거나 서버 폴더 경로 입력
     
     2. **처리 옵션 선택**
        - 주택자금공제 파싱 여부
@@ -245,13 +501,15 @@ st.sidebar.markdown("""
 - `이름_연말정산.pdf`
 - `이름_2026.pdf`
 
-**권장 파일 수**
-- 한 번에 10~20개 이하
+**권장 입력 방식**
+- 20개 이하: PDF 파일 직접 선택
+- 그 이상: ZIP 파일
+- 수백 명 이상: 서버 폴더 (업로드 없이 한 건씩 읽음)
 
 **처리 시간**
 - 파일당 약 2~5초
-- 10개: 약 30초
-- 20개: 약 1분
+- 여러 파일을 동시에 처리 (CPU 코어 수만큼)
+- 제한 시간을 넘긴 파일은 건너뜀
 
 **지원 형식**
 - PDF 파일만 가능
@@ -0,0 +1,195 @@
+"""
+TAX-EASY AI - PDF 파싱 결과 캐시
+같은 PDF를 다시 올리면 파일 내용(SHA-256)과 파서 버전으로 저장된 결과를 바로 돌려줍니다.
+결과는 hr_master.db 의 pdf_parse_cache 테이블에 보관합니다 (year_end_tax 와 같은 DB).
+캐시 조회는 읽기만 하고, 사용 시각(last_used_at)은 모아 두었다가 한 번에 기록합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.database import get_db
+
+from pdf_parser import PARSER_VERSION, ParsedData, TaxPDFParser
+
+# 캐시 최대 크기 (결과 JSON 기준, 초과 시 오래 사용하지 않은 항목부터 삭제)
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# 모아 둔 사용 시각이 이만큼 쌓이면 조회 중에도 기록
+TOUCH_FLUSH_SIZE = 256
+
+_table_ready = False
+
+# 캐시 적중 후 아직 기록하지 않은 사용 시각 {sha256: 'YYYY-MM-DD HH:MM:SS.SSS' (UTC)}
+_pending_touches: Dict[str, str] = {}
+_touch_lock = threading.Lock()
+
+
+def _ensure_table(conn: sqlite3.Connection):
+    """캐시 테이블 생성 (프로세스당 1회)"""
+    global _table_ready
+    if _table_ready:
+        return
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS pdf_parse_cache (
+        sha256 TEXT NOT NULL,
+        parser_version TEXT NOT NULL,
+        result TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (sha256, parser_version)
+    )
+    """)
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_parse_cache_used ON pdf_parse_cache(last_used_at)
+    """)
+    # 이전 파서 버전 결과는 다시 쓰이지 않으므로 정리
+    conn.execute("DELETE FROM pdf_parse_cache WHERE parser_version != ?", (PARSER_VERSION,))
+    conn.commit()
+    _table_ready = True
+
+
+def file_digest(data: bytes) -> str:
+    """PDF 바이트의 SHA-256"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _utc_now() -> str:
+    """strftime('%Y-%m-%d %H:%M:%f', 'now') 와 같은 형식의 현재 UTC 시각"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+
+
+def flush_used():
+    """
+    모아 둔 캐시 사용 시각을 UPDATE 한 번으로 기록 (일괄 처리 종료 시·캐시 저장 시 호출)
+
+    적중할 때마다 쓰기 트랜잭션을 열지 않아 조회가 쓰기 경합으로 바뀌지 않습니다.
+    """
+    with _touch_lock:
+        if not _pending_touches:
+            return
+        touches = list(_pending_touches.items())
+        _pending_touches.clear()
+
+    try:
+        with get_db() as conn:
+            _ensure_table(conn)
+            conn.executemany(
+                """UPDATE pdf_parse_cache SET last_used_at = MAX(last_used_at, ?)
+                   WHERE sha256 = ? AND parser_version = ?""",
+                [(used_at, digest, PARSER_VERSION) for digest, used_at in touches]
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        # 사용 시각은 삭제 순서에만 쓰이므로 실패해도 다음 기록 때 다시 모음
+        print(f"파싱 캐시 사용 시각 기록 실패: {e}")
+
+
+def get_cached(digest: str) -> Optional[ParsedData]:
+    """
+    캐시된 파싱 결과 조회 (읽기 전용, 사용 시각은 flush_used 에서 한 번에 기록)
+
+    Args:
+        digest: PDF 바이트의 SHA-256
+
+    Returns:
+        ParsedData 또는 None (캐시 없음)
+    """
+    try:
+        with get_db() as conn:
+            _ensure_table(conn)
+            row = conn.execute(
+                "SELECT result FROM pdf_parse_cache WHERE sha256 = ? AND parser_version = ?",
+                (digest, PARSER_VERSION)
+            ).fetchone()
+            if row is None:
+                return None
+        parsed = ParsedData(**json.loads(row['result']))
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        print(f"파싱 캐시 조회 실패: {e}")
+        return None
+
+    with _touch_lock:
+        _pending_touches[digest] = _utc_now()
+        full = len(_pending_touches) >= TOUCH_FLUSH_SIZE
+    if full:
+        flush_used()
+    return parsed
+
+
+def put_cached(digest: str, parsed: ParsedData):
+    """파싱 결과 저장 (용량 초과 시 오래 사용하지 않은 항목부터 삭제)"""
+    result = json.dumps(asdict(parsed), ensure_ascii=False)
+    size = len(result.encode('utf-8'))
+    if size > MAX_CACHE_BYTES:
+        return
+
+    # 삭제 순서가 최근 사용을 반영하도록 모아 둔 사용 시각부터 기록
+    flush_used()
+    try:
+        with get_db() as conn:
+            _ensure_table(conn)
+            conn.execute(
+                """INSERT OR REPLACE INTO pdf_parse_cache (sha256, parser_version, result, size, last_used_at)
+                   VALUES (?, ?, ?, ?, strftime('%Y-%m-%d %H:%M:%f', 'now'))""",
+                (digest, PARSER_VERSION, result, size)
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pdf_parse_cache").fetchone()[0]
+            if total > MAX_CACHE_BYTES:
+                # 최근 사용 순으로 누적 크기가 한도 안에 드는 항목만 남김
+                conn.execute("""
+                DELETE FROM pdf_parse_cache WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, SUM(size) OVER (
+                            ORDER BY last_used_at DESC, created_at DESC, rowid DESC
+                        ) AS running
+                        FROM pdf_parse_cache
+                    ) WHERE running > ?
+                )
+                """, (MAX_CACHE_BYTES,))
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"파싱 캐시 저장 실패: {e}")
+
+
+def clear_cache() -> int:
+    """캐시 전체 삭제 (삭제된 항목 수 반환)"""
+    with get_db() as conn:
+        _ensure_table(conn)
+        deleted = conn.execute("DELETE FROM pdf_parse_cache").rowcount
+        conn.commit()
+    return deleted
+
+
+def parse_with_cache(pdf_path: str, data: Optional[bytes] = None) -> TaxPDFParser:
+    """
+    캐시를 거쳐 PDF 파싱
+
+    Args:
+        pdf_path: PDF 파일 경로 (캐시에 없을 때만 읽음)
+        data: PDF 바이트 (없으면 pdf_path 에서 읽음)
+
+    Returns:
+        TaxPDFParser: parsed_data 가 채워진 파서 (export_summary 등 그대로 사용 가능)
+    """
+    if data is None:
+        data = Path(pdf_path).read_bytes()
+    digest = file_digest(data)
+
+    parser = TaxPDFParser()
+    cached = get_cached(digest)
+    if cached is not None:
+        parser.parsed_data = cached
+        return parser
+
+    put_cached(digest, parser.parse_pdf(pdf_path))
+    return parser
@@ -5,10 +5,156 @@ TAX-EASY AI - PDF 스마트 파서
 
 import pdfplumber
 import re
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass
 import json
 
+# 파서 버전 (파싱 규칙이 바뀌면 올려서 parse_cache 의 이전 결과를 무효화)
+PARSER_VERSION = "1.1.0"
+
+# 금액 패턴 (모듈 로드 시 1회 컴파일)
+AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*)')
+AMOUNT_WON_RE = re.compile(r'(\d{1,3}(?:,\d{3})*)\s*원?')
+MASKED_BIZ_NO_RE = re.compile(r'\*\*-\d{2}-\d{2}\*\*\*')
+BIZ_NO_RE = re.compile(r'\d{3}-\d{2}-\d{5}')
+
+# 섹션 색인 대상 키워드 (각 파서가 섹션 경계로 사용하는 문자열)
+SECTION_KEYWORDS = (
+    '[실손의료보험금]', '실손의료보험금', '의료비 인별합계금액', '의료비',
+    '[건강보험료]', '건강보험료', '[고용보험료]', '고용보험료',
+    '[국민연금', '국민연금', '연금',
+    '[주택임차', '주택임차', '주택임차차입금', '전세자금',
+    '주택마련', '주택마련저축', '주택청약', '주택청약저축', '청약종합저축',
+    '신용카드', '카드 사용', '기부금', '교육비',
+)
+
+
+# 항목별 페이지 탐색 키워드 (선택 추출 시 이 키워드가 있는 페이지만 전체 추출)
+SECTION_PAGE_KEYWORDS = {
+    'medical': ('의료비', '실손의료보험금'),
+    'insurance': ('건강보험료', '고용보험료', '국민연금'),
+    'card': ('신용카드', '카드 사용'),
+    'donation': ('기부금',),
+    'education': ('교육비',),
+    'housing': ('주택임차', '전세자금', '주택마련', '주택청약', '청약종합저축'),
+}
+
+
+def select_pages(probes: List[str], sections) -> List[int]:
+    """
+    요청한 항목이 들어 있는 페이지 번호 선택
+    
+    항목 키워드가 있는 페이지와, 그 뒤로 다른 항목 키워드가 나오기 전까지의
+    이어지는 페이지(상세 내역이 다음 페이지로 넘어가는 경우)를 함께 선택합니다.
+    
+    Args:
+        probes: 페이지별 간이 추출 텍스트
+        sections: SECTION_PAGE_KEYWORDS 의 키 목록
+    
+    Returns:
+        List[int]: 선택된 페이지 번호 (0부터)
+    """
+    unknown = set(sections) - set(SECTION_PAGE_KEYWORDS)
+    if unknown:
+        raise ValueError(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+    
+    wanted = [k for s in sections for k in SECTION_PAGE_KEYWORDS[s]]
+    others = [k for s, keywords in SECTION_PAGE_KEYWORDS.items() if s not in sections for k in keywords]
+    
+    selected = []
+    in_section = False
+    for page_no, probe in enumerate(probes):
+        probe = probe or ""
+        if any(k in probe for k in wanted):
+            in_section = True
+        elif any(k in probe for k in others):
+            in_section = False
+        if in_section:
+            selected.append(page_no)
+    return selected
+
+
+class SectionIndex:
+    """
+    섹션 키워드 위치 색인
+    
+    문서 텍스트를 한 번만 훑어 모든 키워드의 출현 위치를 기록하고,
+    이후 섹션 탐색은 색인에서 이진 탐색으로 처리합니다.
+    """
+    
+    def __init__(self, text: str, keywords=SECTION_KEYWORDS):
+        self.text = text
+        self.lines = text.split('\n')
+        self.line_starts = []
+        offset = 0
+        for line in self.lines:
+            self.line_starts.append(offset)
+            offset += len(line) + 1
+        
+        self.positions: Dict[str, List[int]] = {k: [] for k in keywords}
+        
+        # 긴 키워드 우선 매칭 + 같은 위치에서 시작하는 짧은 키워드(접두어)도 함께 기록
+        ordered = sorted(self.positions, key=len, reverse=True)
+        prefixes = {k: [p for p in ordered if p != k and k.startswith(p)] for k in ordered}
+        pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in ordered) + '))')
+        
+        for match in pattern.finditer(text):
+            keyword = match.group(1)
+            pos = match.start()
+            self.positions[keyword].append(pos)
+            for prefix in prefixes[keyword]:
+                self.positions[prefix].append(pos)
+    
+    def find(self, keyword: str, start: int = 0) -> int:
+        """str.find 와 같은 결과 (색인에 없는 키워드는 직접 검색)"""
+        positions = self.positions.get(keyword)
+        if positions is None:
+            return self.text.find(keyword, start)
+        i = bisect_left(positions, start)
+        return positions[i] if i < len(positions) else -1
+    
+    def contains(self, keyword: str) -> bool:
+        return self.find(keyword) != -1
+    
+    def section(self, start_keyword: str, end_keyword: str) -> Optional[str]:
+        """start_keyword 부터 그 뒤 첫 end_keyword 직전까지 (없으면 문서 끝까지)"""
+        start_idx = self.find(start_keyword)
+        if start_idx == -1:
+            return None
+        
+        end_idx = self.find(end_keyword, start_idx)
+        if end_idx == -1:
+            return self.text[start_idx:]
+        
+        return self.text[start_idx:end_idx]
+    
+    def lines_with(self, keyword: str) -> Iterator[str]:
+        """키워드가 들어 있는 줄 (문서 순서, 줄당 1회)"""
+        last = -1
+        for pos in self.positions[keyword]:
+            line_no = bisect_right(self.line_starts, pos) - 1
+            if line_no != last:
+                last = line_no
+                yield self.lines[line_no]
+
+
+def _contains_before(section: str, keyword: str, line: str, margin: int = 0) -> bool:
+    """keyword 가 section 에서 line 의 첫 출현 위치(+margin) 이전에 있는지"""
+    pos = section.find(keyword)
+    return pos != -1 and pos + len(keyword) <= section.find(line) + margin
+
+
+def _last_amount(line: str, pattern=AMOUNT_RE) -> Optional[int]:
+    """줄의 마지막 금액 (없으면 None)"""
+    amounts = pattern.findall(line)
+    if not amounts:
+        return None
+    try:
+        return int(amounts[-1].replace(',', ''))
+    except ValueError:
+        return None
+
 
 @dataclass
 class ParsedData:
@@ -49,89 +195,112 @@ class TaxPDFParser:
     def __init__(self):
         self.parsed_data = ParsedData()
     
-    def parse_pdf(self, pdf_path: str) -> ParsedData:
+    def parse_pdf(self, pdf_path: str, sections=None) -> ParsedData:
         """
         PDF 파일을 읽어서 데이터 추출
         
         Args:
             pdf_path: PDF 파일 경로
-            
+            sections: 추출할 항목 (예: ['card', 'medical'], 기본: 전체)
+                      지정하면 페이지마다 간이 추출로 항목 키워드를 먼저 확인하고
+                      해당 페이지만 전체 추출합니다. 나머지 항목은 기본값으로 남습니다.
+        
         Returns:
             ParsedData: 파싱된 데이터
         """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        full_text += text + "\n"
-                
-                self.parsed_data.raw_text = full_text
-                
-                # 각 항목별 파싱
-                self._parse_medical_expenses(full_text)
-                self._parse_insurance_reimbursement(full_text)
-                self._parse_insurance(full_text)
-                self._parse_card_usage(full_text)
-                self._parse_donations(full_text)
-                self._parse_education(full_text)
-                self._parse_housing(full_text)
-                
-            return self.parsed_data
+                if sections is None:
+                    texts = [page.extract_text() for page in pdf.pages]
+                else:
+                    texts = self._extract_selected(pdf.pages, sections)
+            
+            return self.parse_text("".join(text + "\n" for text in texts if text), sections)
         
         except Exception as e:
             raise Exception(f"PDF 파싱 오류: {str(e)}")
     
-    def _parse_medical_expenses(self, text: str):
+    def _extract_selected(self, pages, sections) -> List[str]:
+        """간이 추출(레이아웃 분석 없음)로 페이지를 고른 뒤 선택된 페이지만 전체 추출"""
+        probes = []
+        for page in pages:
+            probe = getattr(page, 'extract_text_simple', page.extract_text)
+            probes.append(probe())
+        
+        selected = set(select_pages(probes, sections))
+        texts = []
+        for page_no, page in enumerate(pages):
+            if page_no in selected:
+                texts.append(page.extract_text())
+            elif hasattr(page, 'flush_cache'):
+                page.flush_cache()  # 건너뛴 페이지의 문자 캐시 해제
+        return texts
+    
+    def parse_text(self, full_text: str, sections=None) -> ParsedData:
+        """
+        추출된 문서 텍스트 파싱
+        
+        섹션 위치를 한 번에 색인한 뒤 각 항목 파서에는 해당 섹션만 넘깁니다.
+        
+        Args:
+            full_text: 문서 텍스트
+            sections: 파싱할 항목 (기본: 전체)
+        """
+        self.parsed_data.raw_text = full_text
+        index = SectionIndex(full_text)
+        
+        # 각 항목별 파싱
+        for section, section_parsers in self.section_parsers().items():
+            if sections is None or section in sections:
+                for parse in section_parsers:
+                    parse(index)
+        
+        return self.parsed_data
+    
+    def section_parsers(self) -> Dict[str, tuple]:
+        """항목별 파서 (SECTION_PAGE_KEYWORDS 의 키, 실행 순서대로)"""
+        return {
+            'medical': (self._parse_medical_expenses, self._parse_insurance_reimbursement),
+            'insurance': (self._parse_insurance,),
+            'card': (self._parse_card_usage,),
+            'donation': (self._parse_donations,),
+            'education': (self._parse_education,),
+            'housing': (self._parse_housing,),
+        }
+    
+    def _parse_medical_expenses(self, index: SectionIndex):
         """의료비 파싱 - 실손의료보험금과 의료비 지출내역 모두 파싱"""
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
-        lines = text.split('\n')
+        text = index.text
         
         # 1. 의료비 지출액 찾기 - "의료비 인별합계금액" 라인
         medical_expense = 0
-        for line in lines:
-            if '의료비 인별합계금액' in line:
-                amounts = re.findall(amount_pattern, line)
-                if amounts:
-                    try:
-                        amount = int(amounts[-1].replace(',', ''))
-                        if amount > 1000:
-                            medical_expense = amount
-                            break
-                    except ValueError:
-                        continue
+        for line in index.lines_with('의료비 인별합계금액'):
+            amount = _last_amount(line)
+            if amount is not None and amount > 1000:
+                medical_expense = amount
+                break
         
         # 2. 실손의료보험금 찾기 - "[실손의료보험금]" 섹션의 "인별합계금액" 라인
         insurance_reimbursement = 0
-        if '실손의료보험금' in text:
+        if index.contains('실손의료보험금'):
             # 실손의료보험금 섹션 찾기
-            insurance_start = text.find('[실손의료보험금]')
+            insurance_start = index.find('[실손의료보험금]')
             if insurance_start == -1:
-                insurance_start = text.find('실손의료보험금')
+                insurance_start = index.find('실손의료보험금')
             
-            insurance_end = text.find('건강보험료', insurance_start)
+            insurance_end = index.find('건강보험료', insurance_start)
             if insurance_end == -1:
-                insurance_end = text.find('고용보험료', insurance_start)
+                insurance_end = index.find('고용보험료', insurance_start)
             if insurance_end == -1:
                 insurance_end = len(text)
             
-            insurance_section = text[insurance_start:insurance_end]
-            insurance_lines = insurance_section.split('\n')
-            
-            for line in insurance_lines:
+            for line in text[insurance_start:insurance_end].split('\n'):
                 # "인별합계금액" 라인 (의료비가 아닌)
                 if '인별합계금액' in line and '의료비' not in line:
-                    amounts = re.findall(amount_pattern, line)
-                    if amounts:
-                        try:
-                            amount = int(amounts[-1].replace(',', ''))
-                            if amount > 1000:
-                                insurance_reimbursement = amount
-                                break
-                        except ValueError:
-                            continue
+                    amount = _last_amount(line)
+                    if amount is not None and amount > 1000:
+                        insurance_reimbursement = amount
+                        break
         
         # 3. 결과 저장
         if medical_expense > 0:
@@ -151,198 +320,143 @@ class TaxPDFParser:
         
         # 의료비 인별합계금액을 찾지 못한 경우, 개별 항목 파싱
         if medical_expense == 0:
-            for line in lines:
+            for line in index.lines:
                 # 사업자번호 패턴이 있는 라인 (의료기관)
-                if re.search(r'\*\*-\d{2}-\d{2}\*\*\*', line) or re.search(r'\d{3}-\d{2}-\d{5}', line):
-                    amounts = re.findall(amount_pattern, line)
-                    if amounts:
-                        try:
-                            amount = int(amounts[-1].replace(',', ''))
-                            if amount > 1000:
-                                # 의료기관명 추출 (사업자번호 앞부분)
-                                institution = line.split('**')[0].strip() if '**' in line else line[:30].strip()
-                                self.parsed_data.medical_expenses.append({
-                                    'institution': institution,
-                                    'amount': amount,
-                                    'insurance_reimbursement': 0
-                                })
-                        except ValueError:
-                            continue
+                if MASKED_BIZ_NO_RE.search(line) or BIZ_NO_RE.search(line):
+                    amount = _last_amount(line)
+                    if amount is not None and amount > 1000:
+                        # 의료기관명 추출 (사업자번호 앞부분)
+                        institution = line.split('**')[0].strip() if '**' in line else line[:30].strip()
+                        self.parsed_data.medical_expenses.append({
+                            'institution': institution,
+                            'amount': amount,
+                            'insurance_reimbursement': 0
+                        })
     
-    def _parse_insurance_reimbursement(self, text: str):
+    def _parse_insurance_reimbursement(self, index: SectionIndex):
         """실손의료보험금 파싱"""
         # 실손의료보험금 섹션 찾기
-        reimbursement_section = self._extract_section(text, "[실손의료보험금]", "[국민연금")
+        reimbursement_section = index.section("[실손의료보험금]", "[국민연금")
         if not reimbursement_section:
-            reimbursement_section = self._extract_section(text, "실손의료보험금", "국민연금")
+            reimbursement_section = index.section("실손의료보험금", "국민연금")
         if not reimbursement_section:
-            reimbursement_section = self._extract_section(text, "실손의료보험금", "건강보험료")
+            reimbursement_section = index.section("실손의료보험금", "건강보험료")
         
         if not reimbursement_section:
             return
         
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
-        lines = reimbursement_section.split('\n')
-        
         # '인별합계금액' 찾기
-        for line in lines:
-            if '인별합계금액' in line or ('합계금액' in line and '수령금액' in reimbursement_section[:reimbursement_section.find(line)+500]):
-                amounts = re.findall(amount_pattern, line)
-                if amounts:
-                    try:
-                        amount = int(amounts[-1].replace(',', ''))
-                        if amount > 1000:
-                            self.parsed_data.insurance_reimbursement = amount
-                            break
-                    except ValueError:
-                        continue
+        for line in reimbursement_section.split('\n'):
+            if '인별합계금액' in line or (
+                '합계금액' in line and _contains_before(reimbursement_section, '수령금액', line, 500)
+            ):
+                amount = _last_amount(line)
+                if amount is not None and amount > 1000:
+                    self.parsed_data.insurance_reimbursement = amount
+                    break
     
-    def _parse_insurance(self, text: str):
-        """보험료 파싱 - 국세청 간소화 서비스 형식"""
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
-        lines = text.split('\n')
+    def _add_insurance(self, section: Optional[str], insurance_type: str, min_amount: int, is_total_line):
+        """보험료 섹션에서 합계 라인을 찾아 1건 추가 (같은 종류는 1회만)"""
+        if not section:
+            return
         
+        for line in section.split('\n'):
+            if is_total_line(line):
+                amount = _last_amount(line)
+                if amount is not None and amount > min_amount:
+                    if not any(ins['type'] == insurance_type for ins in self.parsed_data.insurance):
+                        self.parsed_data.insurance.append({
+                            'type': insurance_type,
+                            'amount': amount
+                        })
+                    break
+    
+    def _fallback_section(self, index: SectionIndex, start_keyword: str, end_keywords) -> Optional[str]:
+        """start_keyword 부터 end_keywords 중 먼저 찾은 키워드 직전까지 (끝을 못 찾으면 None)"""
+        start = index.find(start_keyword)
+        if start == -1:
+            return None
+        for end_keyword in end_keywords:
+            end = index.find(end_keyword, start)
+            if end != -1:
+                return index.text[start:end]
+        return None
+    
+    def _parse_insurance(self, index: SectionIndex):
+        """보험료 파싱 - 국세청 간소화 서비스 형식"""
         # 1. 건강보험료 파싱
-        health_section = self._extract_section(text, "[건강보험료]", "[고용보험료]")
+        health_section = index.section("[건강보험료]", "[고용보험료]")
         if not health_section:
-            health_start = text.find("건강보험료")
-            if health_start != -1:
-                health_end = text.find("고용보험료", health_start)
-                if health_end == -1:
-                    health_end = text.find("국민연금", health_start)
-                if health_end != -1:
-                    health_section = text[health_start:health_end]
-        
-        if health_section:
-            health_lines = health_section.split('\n')
-            for line in health_lines:
-                if '총합계' in line:
-                    amounts = re.findall(amount_pattern, line)
-                    if amounts:
-                        try:
-                            amount_str = amounts[-1].replace(',', '')
-                            amount = int(amount_str)
-                            if amount > 10000:
-                                if not any(ins['type'] == '건강보험료' for ins in self.parsed_data.insurance):
-                                    self.parsed_data.insurance.append({
-                                        'type': '건강보험료',
-                                        'amount': amount
-                                    })
-                                break
-                        except (ValueError, IndexError):
-                            continue
+            health_section = self._fallback_section(index, "건강보험료", ("고용보험료", "국민연금"))
+        
+        self._add_insurance(health_section, '건강보험료', 10000, lambda line: '총합계' in line)
         
         # 2. 고용보험료 파싱
-        employment_section = self._extract_section(text, "[고용보험료]", "[국민연금")
+        employment_section = index.section("[고용보험료]", "[국민연금")
         if not employment_section:
-            emp_start = text.find("고용보험료")
-            if emp_start != -1:
-                emp_end = text.find("국민연금", emp_start)
-                if emp_end == -1:
-                    emp_end = text.find("주택임차", emp_start)
-                if emp_end != -1:
-                    employment_section = text[emp_start:emp_end]
-        
-        if employment_section:
-            emp_lines = employment_section.split('\n')
-            for line in emp_lines:
-                if '합계' in line and '고용보험료' in employment_section[:employment_section.find(line)]:
-                    amounts = re.findall(amount_pattern, line)
-                    if amounts:
-                        try:
-                            amount_str = amounts[-1].replace(',', '')
-                            amount = int(amount_str)
-                            if amount > 100:
-                                if not any(ins['type'] == '고용보험료' for ins in self.parsed_data.insurance):
-                                    self.parsed_data.insurance.append({
-                                        'type': '고용보험료',
-                                        'amount': amount
-                                    })
-                                break
-                        except (ValueError, IndexError):
-                            continue
+            employment_section = self._fallback_section(index, "고용보험료", ("국민연금", "주택임차"))
+        
+        self._add_insurance(
+            employment_section, '고용보험료', 100,
+            lambda line: '합계' in line and _contains_before(employment_section, '고용보험료', line)
+        )
         
         # 3. 국민연금보험료 파싱
-        pension_section = self._extract_section(text, "[국민연금", "[주택임차")
+        pension_section = index.section("[국민연금", "[주택임차")
         if not pension_section:
-            pension_start = text.find("국민연금")
-            if pension_start != -1:
-                pension_end = text.find("주택임차", pension_start)
-                if pension_end == -1:
-                    pension_end = text.find("주택마련", pension_start)
-                if pension_end != -1:
-                    pension_section = text[pension_start:pension_end]
+            pension_section = self._fallback_section(index, "국민연금", ("주택임차", "주택마련"))
         
         if pension_section:
-            pension_lines = pension_section.split('\n')
             found_pension_header = False
-            for line in pension_lines:
+            for line in pension_section.split('\n'):
                 if '국민연금' in line and ('내역' in line or '보험료' in line):
                     found_pension_header = True
                 elif found_pension_header and '합계' in line:
-                    amounts = re.findall(amount_pattern, line)
-                    if amounts:
-                        try:
-                            amount_str = amounts[-1].replace(',', '')
-                            amount = int(amount_str)
-                            if amount > 10000:
-                                if not any(ins['type'] == '국민연금보험료' for ins in self.parsed_data.insurance):
-                                    self.parsed_data.insurance.append({
-                                        'type': '국민연금보험료',
-                                        'amount': amount
-                                    })
-                                break
-                        except (ValueError, IndexError):
-                            continue
+                    amount = _last_amount(line)
+                    if amount is not None and amount > 10000:
+                        if not any(ins['type'] == '국민연금보험료' for ins in self.parsed_data.insurance):
+                            self.parsed_data.insurance.append({
+                                'type': '국민연금보험료',
+                                'amount': amount
+                            })
+                        break
     
-    def _parse_card_usage(self, text: str):
+    def _parse_card_usage(self, index: SectionIndex):
         """신용카드 사용액 파싱"""
-        card_section = self._extract_section(text, "신용카드", "의료비")
+        card_section = index.section("신용카드", "의료비")
         if not card_section:
-            card_start = text.find("신용카드")
+            card_start = index.find("신용카드")
             if card_start == -1:
-                card_start = text.find("카드 사용")
+                card_start = index.find("카드 사용")
             if card_start != -1:
-                card_end = text.find("의료비", card_start)
+                card_end = index.find("의료비", card_start)
                 if card_end == -1:
-                    card_end = text.find("기부금", card_start)
+                    card_end = index.find("기부금", card_start)
                 if card_end == -1:
-                    card_end = len(text)
-                card_section = text[card_start:card_end]
+                    card_end = len(index.text)
+                card_section = index.text[card_start:card_end]
         
         if not card_section:
             return
         
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)'
-        lines = card_section.split('\n')
-        
         # 합계 라인 찾기
-        for line in lines:
+        for line in card_section.split('\n'):
             if '합계' in line or '총계' in line or '합 계' in line:
-                amounts = re.findall(amount_pattern, line)
-                if amounts:
-                    amount_str = amounts[-1].replace(',', '')
-                    try:
-                        amount = int(amount_str)
-                        if amount > 1000:
-                            self.parsed_data.card_usage['credit_card'] = amount
-                            break
-                    except ValueError:
-                        continue
+                amount = _last_amount(line)
+                if amount is not None and amount > 1000:
+                    self.parsed_data.card_usage['credit_card'] = amount
+                    break
     
-    def _parse_donations(self, text: str):
+    def _parse_donations(self, index: SectionIndex):
         """기부금 파싱"""
-        donation_section = self._extract_section(text, "기부금", "교육비")
+        donation_section = index.section("기부금", "교육비")
         
         if not donation_section:
             return
         
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)\s*원?'
-        lines = donation_section.split('\n')
-        
-        for line in lines:
+        for line in donation_section.split('\n'):
             if any(keyword in line for keyword in ['기부', '후원', '종교', '법정', '지정']):
-                amounts = re.findall(amount_pattern, line)
+                amounts = AMOUNT_WON_RE.findall(line)
                 if amounts:
                     amount_str = amounts[0].replace(',', '')
                     try:
@@ -356,19 +470,16 @@ class TaxPDFParser:
                     except ValueError:
                         continue
     
-    def _parse_education(self, text: str):
+    def _parse_education(self, index: SectionIndex):
         """교육비 파싱"""
-        education_section = self._extract_section(text, "교육비", "연금")
+        education_section = index.section("교육비", "연금")
         
         if not education_section:
             return
         
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*)\s*원?'
-        lines = education_section.split('\n')
-        
-        for line in lines:
+        for line in education_section.split('\n'):
             if any(keyword in line for keyword in ['대학교', '유치원', '어린이집', '초등학교', '중학교', '고등학교', '학원']):
-                amounts = re.findall(amount_pattern, line)
+                amounts = AMOUNT_WON_RE.findall(line)
                 if amounts:
                     amount_str = amounts[0].replace(',', '')
                     try:
@@ -391,30 +502,18 @@ class TaxPDFParser:
                     except ValueError:
                         continue
     
-    def _parse_housing(self, text: str):
+    def _parse_housing(self, index: SectionIndex):
         """주택 관련 항목 파싱"""
         from housing_parser import parse_housing_data
         
-        housing_data = parse_housing_data(text)
+        housing_data = parse_housing_data(index.text, index=index)
         
         if housing_data['jeonse_loan']['found']:
             self.parsed_data.jeonse_loan_repayment = housing_data['jeonse_loan']['total_repayment']
         
         if housing_data['housing_subscription']['found']:
             self.parsed_data.housing_subscription = housing_data['housing_subscription']['total_payment']
-    
-    def _extract_section(self, text: str, start_keyword: str, end_keyword: str) -> Optional[str]:
-        """텍스트에서 특정 섹션 추출"""
-        start_idx = text.find(start_keyword)
-        if start_idx == -1:
-            return None
-        
-        end_idx = text.find(end_keyword, start_idx)
-        if end_idx == -1:
-            return text[start_idx:]
-        
-        return text[start_idx:end_idx]
-    
+
     def to_json(self) -> str:
         """파싱 결과를 JSON으로 변환"""
         data = {
@@ -473,9 +572,10 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         pdf_file = sys.argv[1]
+        sections = sys.argv[2].split(',') if len(sys.argv) > 2 else None
         try:
             parser = TaxPDFParser()
-            data = parser.parse_pdf(pdf_file)
+            data = parser.parse_pdf(pdf_file, sections)
             
             print("=" * 60)
             print("📄 PDF 파싱 완료!")
@@ -497,4 +597,4 @@ if __name__ == "__main__":
             traceback.print_exc()
             sys.exit(1)
     else:
-        print("사용법: python pdf_parser.py [PDF파일경로]")
+        print("사용법: python pdf_parser.py [PDF파일경로] [항목(선택): card,medical,...]")
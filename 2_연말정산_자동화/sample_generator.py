@@ -0,0 +1,244 @@
+"""
+TAX-EASY AI - 합성 간소화 PDF 생성기
+국세청 간소화 자료 형식을 흉내 낸 PDF와 정답 값을 함께 만들어
+실제 직원 PDF 없이 파서 속도·정확도를 측정합니다.
+"""
+
+import json
+import random
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfgen import canvas
+
+# 정답 파일 이름 (코퍼스 폴더 안)
+TRUTH_FILE = 'truth.json'
+
+# 정답 항목 (benchmark.extract_fields 와 같은 키)
+TRUTH_FIELDS = [
+    'medical', 'insurance_reimbursement', 'health_insurance', 'employment_insurance',
+    'pension_insurance', 'credit_card', 'donation', 'education', 'jeonse_loan', 'housing_subscription',
+]
+
+LAST_NAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권']
+FIRST_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '지민', '준서', '하은', '예준', '수아']
+HOSPITALS = ['서울내과의원', '연세치과의원', '하나약국', '튼튼정형외과', '밝은안과의원', '우리소아과의원', '중앙대학병원']
+CHARITIES = [('법정', '사회복지공동모금회'), ('지정', '유니세프한국위원회'), ('종교', '종교단체 교회'), ('지정', '굿네이버스')]
+SCHOOLS = ['한국대학교', '새싹유치원', '푸른초등학교', '햇살중학교', '미래고등학교']
+
+FONT_NAME = 'HYGothic-Medium'
+LINES_PER_PAGE = 40
+
+
+def register_font() -> str:
+    """한글 CID 폰트 등록 (글꼴 파일 없이 pdfplumber 로 다시 읽을 수 있음)"""
+    if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+    return FONT_NAME
+
+
+def _won(amount: int) -> str:
+    return f"{amount:,}"
+
+
+def _masked_biz_no(rng: random.Random) -> str:
+    return f"**-{rng.randint(10, 99)}-{rng.randint(10, 99)}***"
+
+
+def generate_sample(seed: int) -> Tuple[str, List[List[Tuple[str, str]]], Dict[str, int]]:
+    """
+    직원 1명의 간소화 자료 생성
+
+    항목마다 포함 여부와 금액을 무작위로 정하고, 항목은 실제 간소화 PDF처럼 새 페이지에서 시작합니다.
+
+    Args:
+        seed: 난수 시드 (같은 시드면 같은 문서)
+
+    Returns:
+        (직원명, 페이지별 [(왼쪽 글자, 오른쪽 금액)] 목록, 정답 값 {TRUTH_FIELDS: 금액})
+    """
+    rng = random.Random(seed)
+    name = rng.choice(LAST_NAMES) + rng.choice(FIRST_NAMES)
+    truth = {field: 0 for field in TRUTH_FIELDS}
+    sections: List[List[Tuple[str, str]]] = []
+
+    def include(probability: float) -> bool:
+        return rng.random() < probability
+
+    # 보험료 (건강 → 고용 → 국민연금)
+    if include(0.95):
+        monthly = rng.randint(50, 400) * 1000
+        lines = [('[건강보험료] 납부내역', ''), ('납부연월 / 보험료', '')]
+        lines += [(f'{m}월분 직장가입자 보험료', _won(monthly)) for m in range(1, 13)]
+        lines.append(('총합계', _won(monthly * 12)))
+        truth['health_insurance'] = monthly * 12
+        sections.append(lines)
+
+    if include(0.9):
+        monthly = rng.randint(10, 60) * 1000
+        lines = [('[고용보험료] 납부내역', '')]
+        lines += [(f'{m}월분 근로자 부담분', _won(monthly)) for m in range(1, 13)]
+        lines.append(('합계', _won(monthly * 12)))
+        truth['employment_insurance'] = monthly * 12
+        sections.append(lines)
+
+    if include(0.9):
+        monthly = rng.randint(100, 500) * 1000
+        lines = [('[국민연금보험료] 납부내역', '')]
+        lines += [(f'{m}월분 사업장가입자 부담분', _won(monthly)) for m in range(1, 13)]
+        lines.append(('합계', _won(monthly * 12)))
+        truth['pension_insurance'] = monthly * 12
+        sections.append(lines)
+
+    # 주택자금 (주택임차차입금 → 주택마련저축)
+    if include(0.3):
+        repayments = [rng.randint(50, 300) * 10000 for _ in range(rng.randint(1, 2))]
+        lines = [('[주택임차차입금] 원리금 상환액', ''), ('대출기관 / 원금 / 이자 / 상환액', '')]
+        lines += [(f'{bank} 전세대출', _won(amount)) for bank, amount in zip(['국민은행', '신한은행'], repayments)]
+        lines.append(('합 계', _won(sum(repayments))))
+        truth['jeonse_loan'] = sum(repayments)
+        sections.append(lines)
+
+    if include(0.5):
+        monthly = rng.choice([20000, 50000, 100000, 200000, 250000])
+        lines = [('[주택마련저축] 납입내역', ''), ('청약종합저축 납입 월수 / 납입액', '')]
+        lines.append(('주택청약종합저축', _won(monthly * 12)))
+        lines.append(('합 계', _won(monthly * 12)))
+        truth['housing_subscription'] = monthly * 12
+        sections.append(lines)
+
+    # 의료비 (기관별 내역 → 인별합계금액, 실손의료보험금)
+    if include(0.8):
+        amounts = [rng.randint(1, 300) * 10000 + rng.randint(0, 9) * 100 for _ in range(rng.randint(1, 8))]
+        lines = [('[의료비] 지출내역', ''), ('상호 / 사업자번호 / 지출금액', '')]
+        lines += [(f'{rng.choice(HOSPITALS)} {_masked_biz_no(rng)}', _won(amount)) for amount in amounts]
+        lines.append(('의료비 인별합계금액', _won(sum(amounts))))
+        truth['medical'] = sum(amounts)
+        sections.append(lines)
+
+        if include(0.4):
+            refund = rng.randint(1, max(1, sum(amounts) // 20000)) * 10000
+            sections.append([
+                ('[실손의료보험금] 수령내역', ''),
+                ('보험회사 / 수령금액', ''),
+                ('한국생명보험', _won(refund)),
+                ('인별합계금액', _won(refund)),
+            ])
+            truth['insurance_reimbursement'] = refund
+
+    # 신용카드 등 사용금액
+    if include(0.95):
+        usage = {
+            '신용카드 일반': rng.randint(100, 3000) * 10000,
+            '직불·선불카드 일반': rng.randint(0, 1000) * 10000,
+            '현금영수증 일반': rng.randint(0, 300) * 10000,
+        }
+        lines = [('[신용카드] 등 사용금액 내역', ''), ('구분 / 사용금액', '')]
+        lines += [(label, _won(amount)) for label, amount in usage.items()]
+        lines.append(('합계', _won(sum(usage.values()))))
+        truth['credit_card'] = sum(usage.values())
+        sections.append(lines)
+
+    # 기부금
+    if include(0.4):
+        donations = [(rng.choice(CHARITIES), rng.randint(1, 120) * 10000) for _ in range(rng.randint(1, 3))]
+        lines = [('[기부금] 지출내역', '')]
+        lines += [(f'{kind} 기부 {charity}', f'{_won(amount)}원') for (kind, charity), amount in donations]
+        truth['donation'] = sum(amount for _, amount in donations)
+        sections.append(lines)
+
+    # 교육비 (문서 마지막 항목)
+    if include(0.35):
+        payments = [(rng.choice(SCHOOLS), rng.randint(10, 500) * 10000) for _ in range(rng.randint(1, 2))]
+        lines = [('[교육비] 납입내역', '')]
+        lines += [(f'{school} 수업료', f'{_won(amount)}원') for school, amount in payments]
+        truth['education'] = sum(amount for _, amount in payments)
+        sections.append(lines)
+
+    # 항목별 새 페이지 (긴 항목은 다음 페이지로 이어짐)
+    pages = []
+    for lines in sections:
+        for start in range(0, len(lines), LINES_PER_PAGE):
+            pages.append(lines[start:start + LINES_PER_PAGE])
+
+    return name, pages, truth
+
+
+def render_pdf(name: str, pages: List[List[Tuple[str, str]]], output: Union[str, Path, BytesIO]):
+    """generate_sample 결과를 간소화 자료 모양의 PDF로 그리기"""
+    font = register_font()
+    c = canvas.Canvas(str(output) if isinstance(output, Path) else output, pagesize=A4)
+    width, height = A4
+    left, right = 20 * mm, width - 20 * mm
+
+    for page_no, lines in enumerate(pages or [[]], 1):
+        c.setFont(font, 14)
+        c.drawCentredString(width / 2, height - 20 * mm, '연말정산 간소화 자료')
+        c.setFont(font, 9)
+        c.drawString(left, height - 28 * mm, f'성명 {name}')
+        c.line(left, height - 31 * mm, right, height - 31 * mm)
+
+        y = height - 38 * mm
+        c.setFont(font, 10)
+        for label, amount in lines:
+            c.drawString(left, y, label)
+            if amount:
+                c.drawRightString(right, y, amount)
+            y -= 6 * mm
+
+        c.setFont(font, 8)
+        c.drawCentredString(width / 2, 12 * mm, f'- {page_no} / {len(pages)} -')
+        c.showPage()
+
+    c.save()
+
+
+def generate_corpus(output_dir, count: int, seed: int = 0) -> List[Path]:
+    """
+    합성 PDF 코퍼스 생성
+
+    Args:
+        output_dir: 저장 폴더 (PDF 와 정답 파일 truth.json)
+        count: 문서 수
+        seed: 시작 시드 (문서 i 는 seed + i)
+
+    Returns:
+        List[Path]: 생성된 PDF 경로
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    truth = {}
+    for i in range(count):
+        name, pages, values = generate_sample(seed + i)
+        path = output_dir / f'{name}_{seed + i:05d}.pdf'
+        render_pdf(name, pages, path)
+        paths.append(path)
+        truth[path.name] = values
+
+    with open(output_dir / TRUTH_FILE, 'w', encoding='utf-8') as f:
+        json.dump(truth, f, ensure_ascii=False, indent=1)
+
+    return paths
+
+
+def load_truth(corpus_dir) -> Dict[str, Dict[str, int]]:
+    """코퍼스 정답 값 {파일명: {항목: 금액}}"""
+    with open(Path(corpus_dir) / TRUTH_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 2:
+        paths = generate_corpus(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+        print(f"✅ {len(paths)}개 PDF 생성: {sys.argv[1]}")
+    else:
+        print("사용법: python sample_generator.py [출력폴더] [문서 수] [시드(선택)]")
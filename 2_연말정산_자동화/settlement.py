@@ -0,0 +1,308 @@
+"""
+TAX-EASY AI - 연말정산 결정세액 계산 엔진
+급여 이력(payroll_history) 연간 합계와 간소화 PDF 공제 자료를 합쳐
+전 직원의 소득공제 → 과세표준 → 산출세액 → 세액공제 → 결정세액/환급액을 한 번에 계산합니다.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 급여관리 모듈과 같은 세율표 사용 (근로소득공제, 종합소득세율, 인적공제)
+sys.path.append(str(Path(__file__).parent.parent))
+from shared import income_tax as C  # noqa: E402
+from shared.database import get_annual_payroll_totals  # noqa: E402
+
+# 특별소득공제·세액공제 기준 (소득세법, 조세특례제한법)
+SETTLEMENT_RULES = {
+    "카드_최저사용률": 0.25,         # 총급여의 25% 초과분부터 공제
+    "카드_공제율": 0.15,             # 신용카드 공제율
+    "카드_한도": (70000000, 3000000, 2500000),  # (총급여 기준, 이하 한도, 초과 한도)
+    "주택자금_공제율": 0.40,          # 주택임차차입금 원리금·주택청약저축
+    "주택청약_납입한도": 3000000,
+    "주택청약_총급여한도": 70000000,
+    "주택자금_한도": 4000000,
+    "의료비_최저사용률": 0.03,        # 총급여의 3% 초과분
+    "의료비_한도": 7000000,           # 본인 외 부양가족 기준 (보수적으로 전체 적용)
+    "세액공제율": 0.15,               # 의료비·교육비·기부금
+    "기부금_고액기준": 10000000,      # 초과분 30%
+    "기부금_고액공제율": 0.30,
+    "교육비_한도": {"취학전": 3000000, "초중고": 3000000, "대학": 9000000, "기타": 0},
+    "표준세액공제": 130000,
+    # 근로소득세액공제: 산출세액 130만원 이하 55%, 초과분 30%
+    "근로세액공제_기준": 1300000,
+    # 근로소득세액공제 한도: (총급여 상한, 기본 한도, 초과분 감액률, 최저 한도)
+    "근로세액공제_한도": [
+        (33000000, 740000, 0.0, 740000),
+        (70000000, 740000, 0.008, 660000),
+        (120000000, 660000, 0.5, 500000),
+        (float('inf'), 500000, 0.5, 200000),
+    ],
+}
+
+# 공제 자료 컬럼 (간소화 PDF 1건 = 1행)
+DEDUCTION_COLUMNS = [
+    '의료비', '실손보험금', '의료비(공제대상)', '보험료', '건강보험료', '고용보험료', '국민연금보험료',
+    '신용카드', '기부금', '교육비', '교육비(공제대상)', '전세자금상환', '주택청약',
+]
+
+
+def deduction_row(parsed) -> Dict:
+    """
+    ParsedData 를 공제 자료 1행으로 변환
+
+    의료비는 인별합계금액(없으면 개별 내역 합계)에서 실손의료보험금을 뺀 금액,
+    교육비는 교육 단계별 1건당 한도를 적용한 금액을 공제대상으로 봅니다.
+    """
+    medical = parsed.medical_total or sum(e.get('amount', 0) for e in parsed.medical_expenses)
+    reimbursement = max(
+        parsed.insurance_reimbursement,
+        sum(e.get('insurance_reimbursement', 0) for e in parsed.medical_expenses)
+    )
+    insurance = {ins['type']: ins['amount'] for ins in parsed.insurance}
+    education_limits = SETTLEMENT_RULES["교육비_한도"]
+
+    return {
+        '의료비': medical,
+        '실손보험금': reimbursement,
+        '의료비(공제대상)': max(0, medical - reimbursement),
+        '보험료': sum(insurance.values()),
+        '건강보험료': insurance.get('건강보험료', 0),
+        '고용보험료': insurance.get('고용보험료', 0),
+        '국민연금보험료': insurance.get('국민연금보험료', 0),
+        '신용카드': sum(parsed.card_usage.values()),
+        '기부금': sum(d['amount'] for d in parsed.donations),
+        '교육비': sum(e['amount'] for e in parsed.education),
+        '교육비(공제대상)': sum(
+            min(e['amount'], education_limits.get(e['level'], 0)) for e in parsed.education
+        ),
+        '전세자금상환': parsed.jeonse_loan_repayment,
+        '주택청약': parsed.housing_subscription,
+    }
+
+
+def load_payroll_totals(year: int) -> pd.DataFrame:
+    """급여 이력 연간 합계 (직원별 1행, 통합 DB 조회 - 조회 오류는 호출 측으로 전달)"""
+    return pd.DataFrame(get_annual_payroll_totals(year))
+
+
+def _bracket_lookup(amounts: np.ndarray, brackets: List[Dict]) -> np.ndarray:
+    """금액이 속하는 구간 번호 (구간 상한 이하)"""
+    maxes = np.array([b['max'] for b in brackets], dtype=np.float64)
+    return np.minimum(np.searchsorted(maxes, amounts, side='left'), len(brackets) - 1)
+
+
+def earned_income_deduction(gross: np.ndarray) -> np.ndarray:
+    """근로소득공제 (EARNED_INCOME_DEDUCTION_BRACKETS)"""
+    brackets = C.EARNED_INCOME_DEDUCTION_BRACKETS
+    idx = _bracket_lookup(gross, brackets)
+    lowers = np.array([0] + [b['max'] for b in brackets[:-1]], dtype=np.float64)
+    rates = np.array([b['rate'] for b in brackets])
+    fixed = np.array([b['fixed'] for b in brackets], dtype=np.float64)
+    limit = max(b.get('max_deduction', 0) for b in brackets) or np.inf
+
+    deduction = fixed[idx] + (gross - lowers[idx]) * rates[idx]
+    return np.floor(np.minimum(np.minimum(deduction, limit), gross))
+
+
+def calculated_tax(tax_base: np.ndarray) -> np.ndarray:
+    """산출세액 (INCOME_TAX_BRACKETS 누진공제 방식)"""
+    brackets = C.INCOME_TAX_BRACKETS
+    idx = _bracket_lookup(tax_base, brackets)
+    rates = np.array([b['rate'] for b in brackets])
+    progressive = np.array([b['deduction'] for b in brackets], dtype=np.float64)
+    return np.floor(np.maximum(tax_base * rates[idx] - progressive[idx], 0))
+
+
+def earned_income_tax_credit(tax: np.ndarray, gross: np.ndarray) -> np.ndarray:
+    """근로소득세액공제 (총급여 구간별 한도 적용)"""
+    base = SETTLEMENT_RULES["근로세액공제_기준"]
+    credit = np.where(tax <= base, tax * 0.55, base * 0.55 + (tax - base) * 0.30)
+
+    limits = SETTLEMENT_RULES["근로세액공제_한도"]
+    uppers = np.array([u for u, _, _, _ in limits], dtype=np.float64)
+    lowers = np.array([0] + [u for u, _, _, _ in limits[:-1]], dtype=np.float64)
+    starts = np.array([s for _, s, _, _ in limits], dtype=np.float64)
+    cuts = np.array([c for _, _, c, _ in limits])
+    floors = np.array([f for _, _, _, f in limits], dtype=np.float64)
+    idx = np.minimum(np.searchsorted(uppers, gross, side='left'), len(limits) - 1)
+    limit = np.maximum(starts[idx] - (gross - lowers[idx]) * cuts[idx], floors[idx])
+
+    return np.floor(np.minimum(credit, limit))
+
+
+def _settle(earned_income: np.ndarray, gross: np.ndarray, deduction: np.ndarray, credit) -> tuple:
+    """소득공제·세액공제 조합 하나로 (과세표준, 산출세액, 근로소득세액공제, 세액공제합계, 결정세액) 계산"""
+    tax_base = np.maximum(earned_income - deduction, 0)
+    tax = calculated_tax(tax_base)
+    earned_credit = earned_income_tax_credit(tax, gross)
+    total_credit = np.minimum(earned_credit + credit, tax)
+    return tax_base, tax, earned_credit, total_credit, tax - total_credit
+
+
+def _column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame:
+        return np.zeros(len(frame))
+    return frame[name].fillna(0).to_numpy(dtype=np.float64)
+
+
+def compute_settlement(payroll: pd.DataFrame, deductions: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    전 직원 연말정산 일괄 계산 (배열 연산)
+
+    Args:
+        payroll: 직원별 연간 급여 합계 (get_annual_payroll_totals 결과)
+        deductions: emp_id 인덱스의 공제 자료 (DEDUCTION_COLUMNS, 없으면 급여 자료만으로 계산)
+
+    Returns:
+        pd.DataFrame: 직원별 소득공제·과세표준·세액공제·결정세액·차감징수세액
+                      (차감징수세액이 음수면 환급)
+    """
+    rules = SETTLEMENT_RULES
+    frame = payroll.reset_index(drop=True)
+    if deductions is not None and len(deductions):
+        frame = frame.join(deductions[DEDUCTION_COLUMNS], on='emp_id')
+
+    gross = _column(frame, 'taxable_total')
+    dependents = np.maximum(_column(frame, 'dependents'), 1)
+
+    # ==================== 소득공제 ====================
+    earned_deduction = earned_income_deduction(gross)
+    earned_income = gross - earned_deduction
+
+    personal = dependents * C.PERSONAL_DEDUCTION["본인"]
+
+    # 급여에서 원천공제한 보험료 우선, 급여 자료가 없으면 간소화 자료 사용
+    pension = np.where(_column(frame, 'pension_total') > 0,
+                       _column(frame, 'pension_total'), _column(frame, '국민연금보험료'))
+    payroll_insurance = _column(frame, 'health_total') + _column(frame, 'employment_total')
+    parsed_insurance = _column(frame, '건강보험료') + _column(frame, '고용보험료')
+    insurance = np.where(payroll_insurance > 0, payroll_insurance, parsed_insurance)
+
+    subscription = np.where(
+        gross <= rules["주택청약_총급여한도"],
+        np.minimum(_column(frame, '주택청약'), rules["주택청약_납입한도"]),
+        0
+    )
+    housing = np.minimum(
+        (_column(frame, '전세자금상환') + subscription) * rules["주택자금_공제율"],
+        rules["주택자금_한도"]
+    )
+    # 주택임차차입금 원리금은 특별소득공제, 주택청약저축은 조특법 소득공제 (표준세액공제와 함께 적용 가능)
+    subscription_housing = np.floor(np.minimum(subscription * rules["주택자금_공제율"], rules["주택자금_한도"]))
+
+    card_limit_gross, card_limit_low, card_limit_high = rules["카드_한도"]
+    card_excess = np.maximum(_column(frame, '신용카드') - gross * rules["카드_최저사용률"], 0)
+    card = np.minimum(
+        card_excess * rules["카드_공제율"],
+        np.where(gross <= card_limit_gross, card_limit_low, card_limit_high)
+    )
+
+    housing = np.floor(housing)
+    card = np.floor(card)
+
+    # ==================== 세액공제 ====================
+    medical_base = np.maximum(_column(frame, '의료비(공제대상)') - gross * rules["의료비_최저사용률"], 0)
+    medical_credit = np.floor(np.minimum(medical_base, rules["의료비_한도"]) * rules["세액공제율"])
+
+    education_credit = np.floor(_column(frame, '교육비(공제대상)') * rules["세액공제율"])
+
+    donation = _column(frame, '기부금')
+    high = rules["기부금_고액기준"]
+    donation_credit = np.floor(
+        np.minimum(donation, high) * rules["세액공제율"]
+        + np.maximum(donation - high, 0) * rules["기부금_고액공제율"]
+    )
+
+    special_credit = medical_credit + education_credit + donation_credit
+
+    # ==================== 결정세액 ====================
+    # 표준세액공제는 특별소득공제(보험료·주택임차차입금)와 특별세액공제를 모두 신청하지 않은
+    # 경우에만 적용 (소득세법 §59의4⑦) → 두 방식을 모두 계산해 결정세액이 적은 쪽 선택
+    itemized = _settle(earned_income, gross, personal + pension + insurance + housing + card, special_credit)
+    standard = _settle(earned_income, gross, personal + pension + subscription_housing + card,
+                       rules["표준세액공제"])
+    use_standard = standard[4] < itemized[4]
+    tax_base, tax, earned_credit, total_credit, determined_tax = (
+        np.where(use_standard, std, item) for std, item in zip(standard, itemized)
+    )
+
+    insurance = np.where(use_standard, 0, insurance)
+    housing = np.where(use_standard, subscription_housing, housing)
+    total_deduction = personal + pension + insurance + housing + card
+    medical_credit, education_credit, donation_credit = (
+        np.where(use_standard, 0, credit) for credit in (medical_credit, education_credit, donation_credit)
+    )
+    standard_credit = np.where(use_standard, rules["표준세액공제"], 0)
+    determined_local = np.floor(determined_tax * C.LOCAL_TAX_RATE)
+
+    # 차감징수세액: 10원 미만 절사 (환급은 음수)
+    prepaid = _column(frame, 'prepaid_income_tax')
+    prepaid_local = _column(frame, 'prepaid_local_tax')
+    balance = np.trunc((determined_tax - prepaid) / 10) * 10
+    balance_local = np.trunc((determined_local - prepaid_local) / 10) * 10
+
+    result = pd.DataFrame({
+        'emp_id': frame['emp_id'],
+        '직원명': frame['name'] if 'name' in frame else None,
+        '부서': frame['department'] if 'department' in frame else None,
+        '총급여': gross,
+        '근로소득공제': earned_deduction,
+        '근로소득금액': earned_income,
+        '인적공제': personal,
+        '연금보험료공제': pension,
+        '보험료공제': insurance,
+        '주택자금공제': housing,
+        '신용카드공제': card,
+        '소득공제합계': total_deduction,
+        '과세표준': tax_base,
+        '산출세액': tax,
+        '근로소득세액공제': earned_credit,
+        '의료비세액공제': medical_credit,
+        '교육비세액공제': education_credit,
+        '기부금세액공제': donation_credit,
+        '표준세액공제': standard_credit,
+        '세액공제합계': total_credit,
+        '결정세액': determined_tax,
+        '기납부세액': prepaid,
+        '차감징수세액': balance,
+        '지방소득세_결정세액': determined_local,
+        '지방소득세_차감징수세액': balance_local,
+    })
+    money_columns = result.columns[3:]
+    result[money_columns] = result[money_columns].astype(np.int64)
+    return result
+
+
+def run_settlement(year: int, parsed_by_emp: Optional[Dict] = None,
+                   payroll: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    연도별 전 직원 연말정산 실행
+
+    Args:
+        year: 귀속 연도
+        parsed_by_emp: {emp_id: ParsedData 또는 deduction_row 결과}
+        payroll: 미리 조회한 load_payroll_totals 결과 (나눠 계산할 때 1회만 조회)
+
+    Returns:
+        pd.DataFrame: compute_settlement 결과 (급여 이력이 있는 직원만)
+    """
+    if payroll is None:
+        payroll = load_payroll_totals(year)
+    if payroll.empty:
+        return pd.DataFrame()
+
+    deductions = None
+    if parsed_by_emp:
+        deductions = pd.DataFrame.from_dict(
+            {
+                emp_id: data if isinstance(data, dict) else deduction_row(data)
+                for emp_id, data in parsed_by_emp.items()
+            },
+            orient='index'
+        ).reindex(columns=DEDUCTION_COLUMNS)
+
+    return compute_settlement(payroll, deductions)
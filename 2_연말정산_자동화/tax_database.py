@@ -0,0 +1,147 @@
+"""
+TAX-EASY AI - 연말정산 데이터 저장/조회
+일괄 처리 결과를 hr_master.db 의 year_end_tax 테이블에 저장하고
+직원별 전년 대비 증감을 조회합니다.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.database import get_db, init_master_database
+
+# year_end_tax 컬럼 ← 일괄 처리 행(공제 자료·결정세액) 키
+COLUMN_MAP = {
+    'medical_total': '의료비',
+    'medical_insurance_refund': '실손보험금',
+    'medical_net': '의료비(공제대상)',
+    'health_insurance': '건강보험료',
+    'employment_insurance': '고용보험료',
+    'pension_insurance': '국민연금보험료',
+    'credit_card_usage': '신용카드',
+    'housing_loan': '전세자금상환',
+    'housing_savings': '주택청약',
+    'donation': '기부금',
+    'education': '교육비',
+    'total_salary': '총급여',
+    'determined_tax': '결정세액',
+    'balance_tax': '차감징수세액',
+}
+
+# 전년 대비 비교 항목
+DELTA_COLUMNS = [
+    'medical_net', 'credit_card_usage', 'donation', 'education',
+    'housing_loan', 'housing_savings', 'total_salary', 'determined_tax',
+]
+
+
+_schema_ready = False
+
+
+def ensure_year_end_schema():
+    """
+    year_end_tax 테이블·결정세액 컬럼 확인 (없으면 통합 DB 초기화로 생성·마이그레이션)
+
+    결정세액 컬럼(total_salary 등)은 init_master_database 의 마이그레이션으로 추가되므로,
+    예전에 만든 hr_master.db 에서도 저장·조회 전에 한 번 실행합니다.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with get_db() as conn:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(year_end_tax)")}
+    if not set(COLUMN_MAP) <= existing:
+        init_master_database()
+    _schema_ready = True
+
+
+def save_year_end_batch(year: int, rows: List[Dict], parsed_by: str = None) -> int:
+    """
+    일괄 처리 결과 저장 (트랜잭션 1회, 직원·연도별 UPSERT)
+
+    Args:
+        year: 귀속 연도
+        rows: emp_id 와 공제 자료(COLUMN_MAP 값 키), 파일명을 가진 행 목록
+              (없는 항목은 새 행이면 NULL, 기존 행이면 이전 값 유지)
+        parsed_by: 처리자
+
+    Returns:
+        int: 저장된 행 수 (emp_id 없는 행은 제외)
+
+    Raises:
+        sqlite3.Error: 저장 실패 (트랜잭션 전체 취소, 호출 측에서 표시)
+    """
+    columns = list(COLUMN_MAP)
+    params = [
+        [row['emp_id'], year]
+        + [int(row[key]) if row.get(key) is not None else None for key in COLUMN_MAP.values()]
+        + [row.get('파일명'), parsed_by]
+        for row in rows if row.get('emp_id')
+    ]
+    if not params:
+        return 0
+
+    # 행에 없는 항목(예: 결정세액 미계산)은 기존 값을 유지
+    placeholders = ', '.join(['?'] * (len(columns) + 4))
+    updates = ',\n            '.join(f"{col} = COALESCE(excluded.{col}, {col})" for col in columns)
+
+    ensure_year_end_schema()
+    with get_db() as conn:
+        conn.executemany(f"""
+        INSERT INTO year_end_tax (emp_id, year, {', '.join(columns)}, pdf_file_name, parsed_by)
+        VALUES ({placeholders})
+        ON CONFLICT(emp_id, year) DO UPDATE SET
+        {updates},
+        pdf_file_name = excluded.pdf_file_name,
+        parsed_by = excluded.parsed_by,
+        parsed_at = CURRENT_TIMESTAMP
+        """, params)
+        conn.commit()
+    return len(params)
+
+
+def get_year_end_records(year: int) -> List[Dict]:
+    """연도별 저장된 연말정산 자료 (직원 정보 포함)"""
+    try:
+        with get_db() as conn:
+            cursor = conn.execute("""
+            SELECT t.*, e.name, e.department
+            FROM year_end_tax t
+            JOIN employees e ON e.emp_id = t.emp_id
+            WHERE t.year = ?
+            ORDER BY e.department, e.name
+            """, (year,))
+            return [dict(row) for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"연말정산 자료 조회 실패: {e}")
+        return []
+
+
+def get_year_over_year(year: int) -> List[Dict]:
+    """
+    직원별 전년 대비 증감 (year 자료 기준, 전년 자료 없으면 전년 값 NULL)
+
+    Returns:
+        List[Dict]: emp_id, name, department, 항목별 {col}, {col}_prev, {col}_delta
+    """
+    selects = ',\n                   '.join(
+        f"cur.{col} AS {col}, prev.{col} AS {col}_prev, cur.{col} - prev.{col} AS {col}_delta"
+        for col in DELTA_COLUMNS
+    )
+    try:
+        ensure_year_end_schema()
+        with get_db() as conn:
+            cursor = conn.execute(f"""
+            SELECT cur.emp_id, e.name, e.department,
+                   {selects}
+            FROM year_end_tax cur
+            JOIN employees e ON e.emp_id = cur.emp_id
+            LEFT JOIN year_end_tax prev ON prev.emp_id = cur.emp_id AND prev.year = cur.year - 1
+            WHERE cur.year = ?
+            ORDER BY e.department, e.name
+            """, (year,))
+            return [dict(row) for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"전년 대비 조회 실패: {e}")
+        return []
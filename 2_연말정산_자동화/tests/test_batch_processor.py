@@ -0,0 +1,39 @@
+"""
+batch_processor 일괄 처리 테스트
+작업 프로세스가 비정상 종료되어도 다른 파일은 정상 처리되는지 확인
+"""
+
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import batch_processor
+from pdf_parser import ParsedData
+
+
+def fake_parse(file_name: str, data: bytes) -> dict:
+    """'crash' 파일은 작업 프로세스를 즉시 종료 (OOM kill 과 같은 상황)"""
+    if 'crash' in file_name:
+        os._exit(1)
+    return asdict(ParsedData(medical_total=len(data)))
+
+
+def test_crashed_worker_fails_only_its_file(monkeypatch):
+    monkeypatch.setattr(batch_processor, 'parse_pdf_bytes', fake_parse)
+    files = [(f"직원{i}_연말정산.pdf", b"x" * (i + 1)) for i in range(10)]
+    files.insert(3, ("crash_연말정산.pdf", b"boom"))
+
+    results = {
+        r.file_name: r
+        for r in batch_processor.process_pdfs(files, max_workers=3, timeout=30, use_cache=False)
+    }
+
+    assert set(results) == {name for name, _ in files}
+    assert not results["crash_연말정산.pdf"].success
+    assert "비정상 종료" in results["crash_연말정산.pdf"].error
+    for name, _ in files:
+        if name != "crash_연말정산.pdf":
+            assert results[name].success, (name, results[name].error)
@@ -0,0 +1,66 @@
+"""
+settlement 결정세액 계산 테스트
+표준세액공제는 특별소득공제·특별세액공제를 모두 받지 않을 때만 적용되는지 확인
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import settlement
+from settlement import SETTLEMENT_RULES, compute_settlement
+
+
+def payroll_row(**values) -> pd.DataFrame:
+    row = {
+        'emp_id': 'E001', 'name': '홍길동', 'department': '개발', 'dependents': 1,
+        'taxable_total': 40000000, 'pension_total': 1800000,
+        'health_total': 0, 'employment_total': 0,
+        'prepaid_income_tax': 0, 'prepaid_local_tax': 0,
+    }
+    row.update(values)
+    return pd.DataFrame([row])
+
+
+def determined_tax(gross: float, deduction: float, credit: float) -> int:
+    """소득공제 합계·세액공제로 결정세액 직접 계산"""
+    gross = np.array([gross], dtype=np.float64)
+    earned_income = gross - settlement.earned_income_deduction(gross)
+    return int(settlement._settle(earned_income, gross, np.array([deduction]), credit)[4][0])
+
+
+def test_standard_credit_not_added_on_top_of_insurance_deduction():
+    row = compute_settlement(payroll_row(health_total=1500000, employment_total=360000)).iloc[0]
+
+    # 보험료 특별소득공제와 표준세액공제를 동시에 받지 않음
+    assert not (row['보험료공제'] > 0 and row['표준세액공제'] > 0)
+
+    base = 1500000 + 1800000  # 인적공제 + 연금보험료
+    itemized = determined_tax(40000000, base + 1860000, 0)
+    standard = determined_tax(40000000, base, SETTLEMENT_RULES["표준세액공제"])
+    assert row['결정세액'] == min(itemized, standard)
+
+
+def test_standard_credit_when_no_special_deduction_or_credit():
+    row = compute_settlement(payroll_row()).iloc[0]
+
+    assert row['표준세액공제'] == SETTLEMENT_RULES["표준세액공제"]
+    assert row['보험료공제'] == 0
+
+
+def test_itemized_when_special_deductions_exceed_standard_credit():
+    deductions = pd.DataFrame(
+        [{column: 0 for column in settlement.DEDUCTION_COLUMNS}], index=['E001']
+    )
+    deductions.loc['E001', '의료비(공제대상)'] = 5000000
+    row = compute_settlement(
+        payroll_row(health_total=1500000, employment_total=360000), deductions
+    ).iloc[0]
+
+    assert row['표준세액공제'] == 0
+    assert row['보험료공제'] == 1860000
+    assert row['의료비세액공제'] > 0
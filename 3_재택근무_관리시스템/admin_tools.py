@@ -10,11 +10,13 @@ from datetime import datetime, date, timedelta, time
 import random
 from typing import List, Dict
 from database import (
-    bulk_add_work_logs, get_work_logs, update_work_log, 
-    delete_work_log, add_system_log, get_all_employees
+    bulk_write_work_logs, work_log_row, get_work_logs_page, get_work_totals,
+    diff_work_logs, apply_work_log_changes, EDITABLE_WORK_LOG_COLUMNS,
+    add_system_log, get_all_employees
 )
 from work_schedules import WORK_SCHEDULE_PRESETS
-from holidays import is_workday, get_holiday_name
+from history_generator import WORK_LOG_COLUMNS, break_hours, generate_history_rows
+from holidays import get_holiday_name, holidays_between, workdays_between
 from department_tasks import get_department_tasks
 
 
@@ -77,14 +79,7 @@ def generate_weekday_dates(start_date: date, end_date: date) -> List[date]:
     Generate list of workday dates (Monday-Friday, excluding holidays) between start and end
     주말(토/일)과 법정 공휴일을 자동으로 제외합니다.
     """
-    dates = []
-    current = start_date
-    while current <= end_date:
-        # Check if it's a workday (Mon-Fri and not a holiday)
-        if is_workday(current):
-            dates.append(current)
-        current += timedelta(days=1)
-    return dates
+    return workdays_between(start_date, end_date)
 
 
 def bulk_history_injector():
@@ -103,6 +98,7 @@ def bulk_history_injector():
             <li>✅ 시간 자동 랜덤화 (자연스러운 패턴)</li>
             <li>✅ 업무 내용 자동 생성 (15가지 템플릿)</li>
             <li>✅ 한 번에 최대 100일 생성 가능</li>
+            <li>✅ 부서 전체 · 여러 해 기록도 한 번에 생성</li>
         </ul>
     </div>
     """, unsafe_allow_html=True)
@@ -110,29 +106,50 @@ def bulk_history_injector():
     # Step 1: 직원 선택 (form 밖)
     st.markdown("### 1️⃣ 직원 선택")
     employees = get_all_employees()
-    emp_options = {f"👤 {emp['name']} ({emp['emp_id']}) - {emp['department']} {emp['position']}": emp['emp_id'] 
-                  for emp in employees}
-    selected_emp = st.selectbox("대상 직원", options=list(emp_options.keys()), 
-                                help="근무 기록을 생성할 직원을 선택하세요")
-    emp_id = emp_options[selected_emp]
+    target_scope = st.radio(
+        "대상 범위",
+        ["👤 개별 직원", "🏢 부서 전체"],
+        horizontal=True,
+        label_visibility="collapsed",
+        help="부서 전체: 부서의 모든 직원 기록을 한 번에 생성 (표준 모드)"
+    )
+    
+    if "부서 전체" in target_scope:
+        departments = sorted({emp['department'] for emp in employees if emp.get('department')})
+        selected_dept = st.selectbox("대상 부서", options=departments,
+                                     help="이 부서의 모든 재직 직원에게 근무 기록을 생성합니다")
+        target_employees = [emp for emp in employees if emp.get('department') == selected_dept]
+        emp_id = target_employees[0]['emp_id'] if target_employees else None
+        st.caption(f"👥 대상 직원 {len(target_employees)}명: " + ", ".join(emp['name'] for emp in target_employees))
+    else:
+        emp_options = {f"👤 {emp['name']} ({emp['emp_id']}) - {emp['department']} {emp['position']}": emp['emp_id'] 
+                      for emp in employees}
+        selected_emp = st.selectbox("대상 직원", options=list(emp_options.keys()), 
+                                    help="근무 기록을 생성할 직원을 선택하세요")
+        emp_id = emp_options[selected_emp]
+        target_employees = [emp for emp in employees if emp['emp_id'] == emp_id]
     
     st.write("---")
     
     # Step 2: 입력 모드 선택 (form 밖 - 즉시 반영)
     st.markdown("### 2️⃣ 입력 모드 선택")
-    input_mode = st.radio(
-        "입력 방식을 선택하세요",
-        ["📦 표준 모드 - 모든 날짜에 동일한 시간 적용 (빠름)", 
-         "⚙️ 고급 모드 - 날짜별로 다른 시간 설정 (유연함)"],
-        label_visibility="collapsed",
-        help="표준 모드: 같은 시간대로 빠르게 생성 / 고급 모드: 각 날짜마다 다른 출퇴근 시간 설정"
-    )
+    if "부서 전체" in target_scope:
+        input_mode = "📦 표준 모드"
+        st.success("📦 부서 전체 생성은 표준 모드로 진행됩니다.")
+    else:
+        input_mode = st.radio(
+            "입력 방식을 선택하세요",
+            ["📦 표준 모드 - 모든 날짜에 동일한 시간 적용 (빠름)", 
+             "⚙️ 고급 모드 - 날짜별로 다른 시간 설정 (유연함)"],
+            label_visibility="collapsed",
+            help="표준 모드: 같은 시간대로 빠르게 생성 / 고급 모드: 각 날짜마다 다른 출퇴근 시간 설정"
+        )
     
     is_advanced_mode = "고급 모드" in input_mode
     
     if is_advanced_mode:
         st.info("⚙️ 고급 모드: 날짜를 먼저 선택하면 각 날짜별로 시간을 개별 설정할 수 있습니다.")
-    else:
+    elif "개별 직원" in target_scope:
         st.success("📦 표준 모드: 빠르게 일괄 생성합니다.")
     
     st.write("---")
@@ -195,6 +212,9 @@ def bulk_history_injector():
                                               help="예: 7분 → 18:00 ~ 18:07 사이 랜덤", key="end_rand")
                     st.success(f"✅ {base_end.strftime('%H:%M')} + 0~{end_random_min}분")
                 
+                start_jitter = (-abs(start_random_min), abs(start_random_min))
+                end_jitter = (0, end_random_min)
+                
                 with col5:
                     st.markdown("**☕ 휴게 시간**")
                     break_time_preset = st.selectbox(
@@ -222,6 +242,8 @@ def bulk_history_injector():
                 break_time = selected_preset["break_time"]
                 start_random_min = selected_preset["random_start_max"]
                 end_random_min = selected_preset["random_end_max"]
+                start_jitter = (selected_preset["random_start_min"], selected_preset["random_start_max"])
+                end_jitter = (selected_preset["random_end_min"], selected_preset["random_end_max"])
                 
                 # 프리셋 정보 표시
                 col3, col4, col5 = st.columns(3)
@@ -301,13 +323,7 @@ def bulk_history_injector():
                     st.warning("⚠️ 선택한 기간에 근무일이 없습니다. (모두 주말 또는 공휴일)")
                 else:
                     # 제외된 공휴일 정보
-                    from holidays import KOREAN_HOLIDAYS
-                    excluded_holidays = []
-                    current = start_date
-                    while current <= end_date:
-                        if current in KOREAN_HOLIDAYS and current not in weekdays:
-                            excluded_holidays.append((current, KOREAN_HOLIDAYS[current]))
-                        current += timedelta(days=1)
+                    excluded_holidays = holidays_between(start_date, end_date)
                     
                     if excluded_holidays:
                         with st.expander(f"📅 제외된 공휴일 ({len(excluded_holidays)}일)", expanded=False):
@@ -377,6 +393,20 @@ def bulk_history_injector():
             
             st.write("---")
         
+        # 이미 기록이 있는 날 처리 방식
+        conflict_labels = {
+            "⏭️ 건너뛰기 - 기존 기록 유지": 'skip',
+            "♻️ 덮어쓰기 - 새 기록으로 교체": 'replace',
+            "🧩 빈 항목만 채우기 - 기존 기록 보완": 'merge',
+        }
+        conflict_label = st.radio(
+            "📌 이미 기록이 있는 날",
+            options=list(conflict_labels),
+            horizontal=True,
+            help="직원별 하루 1건만 저장됩니다. 같은 기간을 다시 생성해도 기록이 중복되지 않습니다."
+        )
+        on_conflict = conflict_labels[conflict_label]
+        
         # Submit button - 크고 명확하게
         if is_advanced_mode:
             submit = st.form_submit_button("🚀 고급 모드로 생성하기", type="primary", use_container_width=True)
@@ -394,13 +424,7 @@ def bulk_history_injector():
                     st.warning("⚠️ 선택한 기간에 근무일이 없습니다. (모두 주말 또는 공휴일)")
                 else:
                     # 제외된 날짜 정보 수집
-                    from holidays import KOREAN_HOLIDAYS
-                    excluded_holidays = []
-                    current = start_date
-                    while current <= end_date:
-                        if current in KOREAN_HOLIDAYS and current not in weekdays:
-                            excluded_holidays.append((current, KOREAN_HOLIDAYS[current]))
-                        current += timedelta(days=1)
+                    excluded_holidays = holidays_between(start_date, end_date)
                     
                     # 제외된 공휴일이 있으면 표시
                     if excluded_holidays:
@@ -408,63 +432,32 @@ def bulk_history_injector():
                             for holiday_date, holiday_name in excluded_holidays:
                                 st.write(f"- {holiday_date.strftime('%Y-%m-%d')} ({holiday_date.strftime('%a')}): **{holiday_name}**")
                     
-                    # 직원 정보 가져오기 (부서 정보 필요)
-                    from database import get_employee_by_id
-                    employee = get_employee_by_id(emp_id)
-                    employee_department = employee['department'] if employee else "기타"
-                    
-                    # 해당 부서의 업무 템플릿 가져오기
-                    department_task_templates = get_department_tasks(employee_department)
+                    # 직원별 업무 내용 후보 (부서별 업무 템플릿 또는 동일한 내용)
+                    emp_ids = [emp['emp_id'] for emp in target_employees]
+                    descriptions = {
+                        emp['emp_id']: [work_description] if work_description
+                        else get_department_tasks(emp.get('department') or "기타")
+                        for emp in target_employees
+                    }
                     
-                    # Prepare bulk logs
-                    logs = []
-                    for work_date in weekdays:
-                        # Randomize times
-                        random_start = add_random_minutes_seconds(
-                            base_start, 
-                            -abs(start_random_min), 
-                            abs(start_random_min)
-                        )
-                        random_end = add_random_minutes_seconds(
-                            base_end, 
-                            0, 
-                            end_random_min
-                        )
-                        
-                        # Format times
-                        start_str = random_start.strftime("%H:%M:%S")
-                        end_str = random_end.strftime("%H:%M:%S")
-                        
-                        # Calculate hours
-                        work_hours = calculate_work_hours(start_str, end_str, 1.0)
-                        
-                        # Select work description
-                        if work_description:
-                            desc = work_description
-                        else:
-                            # 부서별 업무 템플릿에서 랜덤 선택
-                            desc = random.choice(department_task_templates)
-                        
-                        logs.append({
-                            'emp_id': emp_id,
-                            'work_date': work_date.isoformat(),
-                            'start_time': start_str,
-                            'end_time': end_str,
-                            'break_time': break_time,
-                            'work_hours': work_hours,
-                            'work_description': desc,
-                            'work_type': work_type_clean,
-                            'created_by': st.session_state.full_name,
-                            'is_manual': 1
-                        })
-                    
-                    # Insert to database
+                    # 전체 직원 × 근무일 기록을 한 번에 생성 (시간 랜덤화·근무시간 계산 포함)
                     with st.spinner("⏳ 기록 생성 중... 잠시만 기다려주세요"):
-                        count = bulk_add_work_logs(logs)
+                        rows = generate_history_rows(
+                            emp_ids, start_date, end_date,
+                            base_start, base_end,
+                            start_jitter, end_jitter,
+                            break_time, work_type_clean,
+                            st.session_state.full_name,
+                            descriptions
+                        )
+                        result = bulk_write_work_logs(rows, on_conflict)
+                        count = result['inserted'] + result['updated']
+                        target_label = emp_id if len(emp_ids) == 1 else f"{selected_dept} {len(emp_ids)}명"
                         add_system_log(
                             st.session_state.username,
                             "일괄 기록 생성",
-                            f"{emp_id} / {start_date} ~ {end_date} / {count}건"
+                            f"{target_label} / {start_date} ~ {end_date} / "
+                            f"추가 {result['inserted']}건, 수정 {result['updated']}건, 건너뜀 {result['skipped']}건"
                         )
                     
                     # 성공 메시지 - 더 눈에 띄게
@@ -480,32 +473,34 @@ def bulk_history_injector():
                     </div>
                     """, unsafe_allow_html=True)
                     
+                    st.caption(
+                        f"➕ 추가 {result['inserted']:,}건 · ✏️ 수정 {result['updated']:,}건 · "
+                        f"⏭️ 건너뜀 {result['skipped']:,}건 (이미 기록이 있는 날)"
+                    )
+                    
                     # 통계 카드
+                    logs_df = pd.DataFrame(rows, columns=WORK_LOG_COLUMNS)
                     col_s1, col_s2, col_s3, col_s4 = st.columns(4)
                     with col_s1:
                         total_days = (end_date - start_date).days + 1
                         st.metric("📅 전체 기간", f"{total_days}일")
                     with col_s2:
-                        excluded_count = total_days - count
+                        excluded_count = total_days - len(weekdays)
                         st.metric("🚫 제외일", f"{excluded_count}일", 
                                  help="주말 및 공휴일")
                     with col_s3:
-                        total_hours = sum(log['work_hours'] for log in logs)
+                        total_hours = logs_df['work_hours'].sum()
                         st.metric("⏱️ 총 근무시간", f"{total_hours:.1f}시간")
                     with col_s4:
-                        avg_hours = total_hours / count if count > 0 else 0
+                        avg_hours = total_hours / len(rows) if rows else 0
                         st.metric("📊 평균 시간", f"{avg_hours:.1f}시간")
                     
                     # Show preview - 더 보기 좋게
                     st.write("---")
                     with st.expander("📋 생성된 기록 상세 보기 (클릭)", expanded=False):
-                        preview_df = pd.DataFrame(logs)
-                        # 필요한 컬럼만 선택
-                        display_cols = ['work_date', 'start_time', 'end_time', 'work_hours', 'work_description']
-                        if set(display_cols).issubset(preview_df.columns):
-                            preview_df_display = preview_df[display_cols].copy()
-                            preview_df_display.columns = ['날짜', '시작', '종료', '시간', '업무내용']
-                            st.dataframe(preview_df_display, use_container_width=True, height=400)
+                        preview_df_display = logs_df[['emp_id', 'work_date', 'start_time', 'end_time', 'work_hours', 'work_description']]
+                        preview_df_display.columns = ['직원', '날짜', '시작', '종료', '시간', '업무내용']
+                        st.dataframe(preview_df_display, use_container_width=True, height=400)
         
         elif submit and is_advanced_mode:
             # ==================== 고급 모드 Submit 처리 ====================
@@ -559,11 +554,13 @@ def bulk_history_injector():
                 else:
                     # 데이터베이스에 저장
                     with st.spinner("⏳ 고급 모드로 기록 생성 중... 잠시만 기다려주세요"):
-                        count = bulk_add_work_logs(logs)
+                        result = bulk_write_work_logs([work_log_row(log) for log in logs], on_conflict)
+                        count = result['inserted'] + result['updated']
                         add_system_log(
                             st.session_state.username,
                             "일괄 기록 생성 (고급 모드)",
-                            f"{emp_id} / {count}건"
+                            f"{emp_id} / 추가 {result['inserted']}건, 수정 {result['updated']}건, "
+                            f"건너뜀 {result['skipped']}건"
                         )
                     
                     # 성공 메시지
@@ -579,6 +576,9 @@ def bulk_history_injector():
                     </div>
                     """, unsafe_allow_html=True)
                     
+                    if result['skipped']:
+                        st.caption(f"⏭️ 이미 기록이 있는 {result['skipped']}일은 건너뛰었습니다.")
+                    
                     # 통계 카드
                     col_s1, col_s2, col_s3 = st.columns(3)
                     with col_s1:
@@ -587,7 +587,7 @@ def bulk_history_injector():
                         total_hours = sum(log['work_hours'] for log in logs)
                         st.metric("⏱️ 총 근무시간", f"{total_hours:.1f}시간")
                     with col_s3:
-                        avg_hours = total_hours / count if count > 0 else 0
+                        avg_hours = total_hours / len(logs) if logs else 0
                         st.metric("📊 평균 시간", f"{avg_hours:.1f}시간")
                     
                     # 세션 스테이트 초기화
@@ -599,16 +599,56 @@ def bulk_history_injector():
                         del st.session_state.schedule_dates
 
 
+WORK_TYPES = ["재택근무", "사무실근무", "외근"]
+
+# 조회 화면 정렬 옵션: 표시명 → (WORK_LOG_SORT_KEYS 키, 내림차순 여부)
+LOG_SORT_OPTIONS = {
+    "날짜 (최근순)": ('work_date', True),
+    "날짜 (오래된순)": ('work_date', False),
+    "사번순": ('emp_id', False),
+    "근무시간 (긴 순)": ('work_hours', True),
+}
+
+PAGE_SIZE_OPTIONS = [20, 50, 100, 200]
+
+
+def current_page_cursor(state_key: str, query: tuple):
+    """
+    Keyset cursor for the page being viewed
+    조회 조건(query)이 바뀌면 첫 페이지로 돌아감
+    Returns:
+        get_work_logs_page 의 after 인자 (첫 페이지면 None)
+    """
+    pager = st.session_state.get(state_key)
+    if pager is None or pager['query'] != query:
+        pager = {'query': query, 'cursors': [None]}
+        st.session_state[state_key] = pager
+    return pager['cursors'][-1]
+
+
+def page_navigation(state_key: str, next_cursor, total: int, page_size: int):
+    """이전/다음 페이지 버튼 (방문한 페이지의 시작 커서를 쌓아 두고 이전 페이지로 돌아감)"""
+    pager = st.session_state[state_key]
+    page_no = len(pager['cursors'])
+    page_count = max(1, -(-total // page_size))
+    
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ 이전", key=f"{state_key}_prev", disabled=page_no == 1, use_container_width=True):
+            pager['cursors'].pop()
+            st.rerun()
+    with col_info:
+        st.caption(f"{page_no} / {page_count} 페이지 (총 {total:,}건)")
+    with col_next:
+        if st.button("다음 ▶", key=f"{state_key}_next", disabled=next_cursor is None, use_container_width=True):
+            pager['cursors'].append(next_cursor)
+            st.rerun()
+
+
 def inline_editor():
     """Admin tool: Edit work logs inline - FULLY REDESIGNED"""
     st.markdown("## ✏️ 근무 기록 관리")
     
-    # 초기화
-    if 'selected_logs' not in st.session_state:
-        st.session_state.selected_logs = set()
-    if 'select_all' not in st.session_state:
-        st.session_state.select_all = False
-    
     # Filters - 심플하게
     col_f1, col_f2, col_f3 = st.columns([2, 1, 1])
     with col_f1:
@@ -622,155 +662,126 @@ def inline_editor():
     with col_f3:
         filter_end = st.date_input("종료일", value=date.today())
     
-    # Get logs
+    col_f4, col_f5, col_f6 = st.columns([2, 1, 1])
+    with col_f4:
+        keyword = st.text_input("🔎 업무 내용 검색", key="editor_keyword")
+    
+    with col_f5:
+        sort_label = st.selectbox("정렬", options=list(LOG_SORT_OPTIONS), key="editor_sort")
+    
+    with col_f6:
+        page_size = st.selectbox("페이지당", options=PAGE_SIZE_OPTIONS, index=0, key="editor_page_size")
+    
+    # Get logs (현재 페이지만)
     if selected_emp == "전체":
         emp_id = None
     else:
         emp_id = selected_emp.split('(')[1].strip(')')
     
-    logs = get_work_logs(
-        emp_id=emp_id,
-        start_date=filter_start.isoformat(),
-        end_date=filter_end.isoformat()
+    filters = {
+        'emp_id': emp_id,
+        'start_date': filter_start.isoformat(),
+        'end_date': filter_end.isoformat(),
+        'keyword': keyword.strip() or None,
+    }
+    sort_by, descending = LOG_SORT_OPTIONS[sort_label]
+    cursor = current_page_cursor(
+        "editor_pager", (tuple(filters.values()), sort_by, descending, page_size)
     )
+    page = get_work_logs_page(**filters, sort_by=sort_by, descending=descending,
+                              after=cursor, limit=page_size)
+    logs = page['rows']
     
     if not logs:
         st.info("📭 표시할 기록이 없습니다.")
         return
     
-    # 통계 - 간결하게
-    total_logs = len(logs)
-    total_hours = sum(log['work_hours'] for log in logs)
-    selected_count = len(st.session_state.selected_logs)
+    # 통계 - 간결하게 (조건 전체 집계)
+    totals = get_work_totals(**filters)
+    total_logs = totals['total_logs']
+    total_hours = totals['total_hours']
     
-    col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+    col_stat1, col_stat2, col_stat3 = st.columns(3)
     with col_stat1:
         st.metric("총 기록", f"{total_logs}건")
     with col_stat2:
         st.metric("총 시간", f"{total_hours:.1f}h")
     with col_stat3:
-        st.metric("선택", f"{selected_count}건", delta=f"{selected_count}/{total_logs}")
-    with col_stat4:
-        if selected_count > 0:
-            if st.button(f"🗑️ 선택 삭제 ({selected_count}건)", type="primary", use_container_width=True):
-                for log_id in list(st.session_state.selected_logs):
-                    delete_work_log(log_id)
-                add_system_log(
-                    st.session_state.username,
-                    "일괄 삭제",
-                    f"{selected_count}건 삭제"
-                )
-                st.session_state.selected_logs.clear()
-                st.success(f"✅ {selected_count}개 기록 삭제 완료!")
-                st.rerun()
+        st.metric("현재 페이지", f"{len(logs)}건")
     
-    st.write("")
+    st.caption("💡 표에서 바로 수정하고, 지울 기록은 '삭제'에 체크한 뒤 저장하세요. "
+               "시간·휴게를 바꾸면 근무시간은 자동으로 다시 계산됩니다.")
     
-    # 전체 선택/해제
-    col_select, col_action = st.columns([1, 3])
-    with col_select:
-        select_all = st.checkbox("전체 선택", key="select_all_checkbox")
-        if select_all != st.session_state.select_all:
-            st.session_state.select_all = select_all
-            if select_all:
-                st.session_state.selected_logs = {log['id'] for log in logs}
-            else:
-                st.session_state.selected_logs.clear()
-            st.rerun()
+    # 표 편집 - 현재 페이지
+    original = pd.DataFrame(logs)[['id', 'emp_id', *EDITABLE_WORK_LOG_COLUMNS]]
+    original.insert(0, 'delete', False)
     
-    with col_action:
-        if len(st.session_state.selected_logs) > 0:
-            st.info(f"✅ {len(st.session_state.selected_logs)}개 선택됨")
+    edited = st.data_editor(
+        original,
+        hide_index=True,
+        use_container_width=True,
+        disabled=['id', 'emp_id', 'work_hours'],
+        column_config={
+            'delete': st.column_config.CheckboxColumn("삭제", width="small"),
+            'id': None,
+            'emp_id': st.column_config.TextColumn("사번"),
+            'work_date': st.column_config.TextColumn("날짜", required=True),
+            'start_time': st.column_config.TextColumn("시작", required=True),
+            'end_time': st.column_config.TextColumn("종료", required=True),
+            'break_time': st.column_config.TextColumn("휴게"),
+            'work_hours': st.column_config.NumberColumn("근무시간", format="%.2f"),
+            'work_description': st.column_config.TextColumn("업무 내용", width="large"),
+            'work_type': st.column_config.SelectboxColumn("유형", options=WORK_TYPES, required=True),
+        }
+    )
     
-    st.write("---")
+    # 삭제 체크 행은 빼고, 시간이 바뀐 행은 근무시간 재계산
+    kept = edited[~edited['delete']].drop(columns='delete')
+    time_cols = ['start_time', 'end_time', 'break_time']
+    retimed = (kept[time_cols] != original.loc[kept.index, time_cols]).any(axis=1)
+    for idx in kept.index[retimed]:
+        row = kept.loc[idx]
+        kept.at[idx, 'work_hours'] = calculate_work_hours(
+            row['start_time'], row['end_time'], break_hours(row['break_time'])
+        )
     
-    # 테이블 형식 - 깔끔하게
-    for i, log in enumerate(logs):
-        # 체크박스 + 한 줄 표시
-        col_check, col_date, col_time, col_hours, col_desc, col_actions = st.columns([0.3, 1, 1.5, 0.7, 2.5, 0.8])
-        
-        with col_check:
-            is_selected = st.checkbox(
-                "",
-                value=log['id'] in st.session_state.selected_logs,
-                key=f"check_{log['id']}",
-                label_visibility="collapsed"
+    changes = diff_work_logs(original.drop(columns='delete'), kept)
+    update_count, delete_count = len(changes['updates']), len(changes['deletes'])
+    
+    invalid_dates = []
+    for log_id, row in changes['updates'].items():
+        if 'work_date' in row:
+            try:
+                date.fromisoformat(row['work_date'])
+            except (TypeError, ValueError):
+                invalid_dates.append(str(row['work_date']))
+    
+    col_save, col_info = st.columns([1, 3])
+    with col_info:
+        if invalid_dates:
+            st.error(f"❌ 날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {', '.join(invalid_dates)}")
+        elif update_count or delete_count:
+            st.info(f"저장 대기: 수정 {update_count}건 / 삭제 {delete_count}건")
+    
+    with col_save:
+        if st.button("💾 변경사항 저장", type="primary", use_container_width=True,
+                     disabled=bool(invalid_dates) or not (update_count or delete_count)):
+            # 한 트랜잭션으로 반영 (하나라도 실패하면 전체 취소)
+            result = apply_work_log_changes(
+                changes['updates'], changes['deletes'], st.session_state.full_name
             )
-            if is_selected:
-                st.session_state.selected_logs.add(log['id'])
+            if result is None:
+                st.error("❌ 저장 실패 - 같은 직원·날짜의 기록이 이미 있는지 확인하세요. (변경 내용은 반영되지 않았습니다)")
             else:
-                st.session_state.selected_logs.discard(log['id'])
-        
-        with col_date:
-            st.write(f"**{log['work_date']}**")
-            st.caption(f"{log['emp_id']}")
-        
-        with col_time:
-            st.write(f"{log['start_time']} → {log['end_time']}")
-            st.caption(f"휴게: {log['break_time']}")
-        
-        with col_hours:
-            st.write(f"**{log['work_hours']}h**")
-            st.caption(f"{log['work_type']}")
-        
-        with col_desc:
-            desc_short = log['work_description'][:50] + "..." if len(log['work_description']) > 50 else log['work_description']
-            st.write(desc_short)
-        
-        with col_actions:
-            col_edit, col_del = st.columns(2)
-            with col_edit:
-                if st.button("✏️", key=f"edit_{log['id']}", help="수정"):
-                    st.session_state[f"editing_{log['id']}"] = True
-                    st.rerun()
-            with col_del:
-                if st.button("🗑️", key=f"delete_{log['id']}", help="삭제"):
-                    if delete_work_log(log['id']):
-                        add_system_log(st.session_state.username, "기록 삭제", f"ID {log['id']}")
-                        st.success("✅ 삭제 완료")
-                        st.rerun()
-        
-        # 수정 모드 - 인라인
-        if st.session_state.get(f"editing_{log['id']}", False):
-            with st.container():
-                st.markdown(f"##### ✏️ 기록 수정 (ID: {log['id']})")
-                with st.form(f"edit_form_{log['id']}"):
-                    col_e1, col_e2, col_e3, col_e4 = st.columns(4)
-                    with col_e1:
-                        new_start = st.text_input("시작", value=log['start_time'])
-                    with col_e2:
-                        new_end = st.text_input("종료", value=log['end_time'])
-                    with col_e3:
-                        new_break = st.text_input("휴게", value=log['break_time'])
-                    with col_e4:
-                        new_type = st.selectbox("유형", options=["재택근무", "사무실근무", "외근"],
-                                               index=["재택근무", "사무실근무", "외근"].index(log['work_type']))
-                    
-                    new_desc = st.text_area("업무 내용", value=log['work_description'], height=80)
-                    
-                    col_save, col_cancel = st.columns(2)
-                    with col_save:
-                        if st.form_submit_button("💾 저장", type="primary", use_container_width=True):
-                            new_hours = calculate_work_hours(new_start, new_end, 1.0)
-                            updates = {
-                                'start_time': new_start,
-                                'end_time': new_end,
-                                'break_time': new_break,
-                                'work_hours': new_hours,
-                                'work_description': new_desc,
-                                'work_type': new_type
-                            }
-                            if update_work_log(log['id'], updates, st.session_state.full_name):
-                                add_system_log(st.session_state.username, "기록 수정", f"ID {log['id']}")
-                                st.session_state[f"editing_{log['id']}"] = False
-                                st.success("✅ 저장 완료!")
-                                st.rerun()
-                    with col_cancel:
-                        if st.form_submit_button("❌ 취소", use_container_width=True):
-                            st.session_state[f"editing_{log['id']}"] = False
-                            st.rerun()
-        
-        st.divider()
+                add_system_log(
+                    st.session_state.username,
+                    "기록 일괄 수정",
+                    f"수정 {result['updated']}건, 삭제 {result['deleted']}건"
+                )
+                st.success(f"✅ 수정 {result['updated']}건, 삭제 {result['deleted']}건 저장 완료!")
+                st.rerun()
+    
+    page_navigation("editor_pager", page['next_cursor'], total_logs, page_size)
 
 
 def smart_randomizer():
@@ -18,10 +18,11 @@ from shared.utils import show_success
 # Import custom modules
 from database import (
     init_database, seed_initial_data, get_all_employees,
-    add_work_log, get_work_logs, get_company_setting,
+    add_work_log, get_company_setting,
     update_company_setting, get_system_logs, add_system_log,
     get_work_stats, add_employee, update_employee, delete_employee,
-    get_employee_by_id, add_user
+    get_employee_by_id, add_user, get_work_logs_page, get_work_totals,
+    get_recent_work_logs, count_moved_duplicate_logs
 )
 from auth import (
     hash_password, init_session_state, login_page,
@@ -29,7 +30,8 @@ from auth import (
 )
 from admin_tools import (
     bulk_history_injector, inline_editor, smart_randomizer,
-    calculate_work_hours
+    calculate_work_hours, current_page_cursor, page_navigation,
+    WORK_TYPES, LOG_SORT_OPTIONS, PAGE_SIZE_OPTIONS
 )
 from reports import report_generator, statistics_dashboard
 from work_schedules import WORK_SCHEDULE_PRESETS, get_schedule_names
@@ -390,10 +392,19 @@ def dashboard_page():
     **역할:** {st.session_state.role} | **시스템 버전:** 2.0
     """)
     
+    if is_admin():
+        moved = count_moved_duplicate_logs()
+        if moved:
+            st.warning(
+                f"⚠️ 직원별 하루 1건 규칙을 적용하면서 중복 근무 기록 {moved}건을 "
+                "`work_logs_duplicates` 테이블로 옮겼습니다 (날짜별 최신 기록만 유지). "
+                "시스템 설정 > 시스템 로그에서 확인하세요."
+            )
+    
     st.write("---")
     
     # Overall statistics
-    all_logs = get_work_logs()
+    totals = get_work_totals()
     all_employees = get_all_employees()
     
     col1, col2, col3, col4 = st.columns(4)
@@ -408,13 +419,13 @@ def dashboard_page():
     with col2:
         st.metric(
             "📝 총 근무 기록",
-            len(all_logs),
+            totals['total_logs'],
             help="시스템에 저장된 총 근무 기록 수"
         )
     
     with col3:
-        if all_logs:
-            total_hours = sum(log['work_hours'] for log in all_logs)
+        if totals['total_logs']:
+            total_hours = totals['total_hours']
             st.metric(
                 "⏱️ 총 근무시간",
                 f"{total_hours:.1f}h",
@@ -424,8 +435,8 @@ def dashboard_page():
             st.metric("⏱️ 총 근무시간", "0h")
     
     with col4:
-        if all_logs:
-            manual_count = sum(1 for log in all_logs if log['is_manual'] == 1)
+        if totals['total_logs']:
+            manual_count = totals['manual_count']
             st.metric(
                 "✏️ 수동 입력",
                 f"{manual_count}건",
@@ -439,8 +450,8 @@ def dashboard_page():
     # Recent work logs
     st.subheader("📋 최근 근무 기록 (10건)")
     
-    if all_logs:
-        recent_logs = all_logs[:10]
+    if totals['total_logs']:
+        recent_logs = get_recent_work_logs(10)
         df = pd.DataFrame(recent_logs)
         display_df = df[['work_date', 'emp_id', 'start_time', 'end_time', 'work_hours', 'work_description']]
         display_df.columns = ['날짜', '사번', '시작', '종료', '근무시간', '업무내용']
@@ -485,10 +496,23 @@ def dashboard_page():
                 st.rerun()
 
 
+def replaced_log_notice(work_date, replaced: dict) -> str:
+    """add_work_log 가 같은 날 기존 기록을 교체했을 때 안내 문구"""
+    return (
+        f"⚠️ {work_date} 기존 기록(ID {replaced['id']}, "
+        f"{replaced['start_time'][:5]}~{replaced['end_time'][:5]}, {replaced['work_hours']}시간, "
+        f"입력: {replaced['created_by']})을 새 내용으로 교체했습니다."
+    )
+
+
 def quick_work_entry_page():
     """Quick work entry for regular users"""
     st.title("⚡ 간편 출퇴근 기록")
     
+    notice = st.session_state.pop('work_log_notice', None)
+    if notice:
+        st.warning(notice)
+    
     st.info("💡 간편하게 오늘의 출퇴근을 기록하세요. 빠른 선택으로 쉽게 완료할 수 있습니다!")
     
     # Get current user's emp_id
@@ -602,7 +626,7 @@ def quick_work_entry_page():
                 hours = calculate_work_hours(start_str, end_str, 1.0)
                 
                 # Add to database
-                log_id = add_work_log(
+                saved = add_work_log(
                     emp_id=emp_id,
                     work_date=work_date.isoformat(),
                     start_time=start_str,
@@ -614,13 +638,21 @@ def quick_work_entry_page():
                     created_by=st.session_state.full_name,
                     is_manual=0  # 일반 사용자는 0
                 )
+                if saved is None:
+                    st.error("⚠️ 저장에 실패했습니다. 잠시 후 다시 시도해주세요.")
+                    return
+                replaced = saved['replaced']
                 
                 # Log the action
                 add_system_log(
                     st.session_state.username,
-                    "근무 기록 입력",
+                    "근무 기록 수정" if replaced else "근무 기록 입력",
                     f"{emp_id} / {work_date} / {hours}시간"
+                    + (f" (기존 기록 ID {replaced['id']} 교체)" if replaced else "")
                 )
+                if replaced:
+                    # rerun 후에도 보이도록 세션에 보관
+                    st.session_state.work_log_notice = replaced_log_notice(work_date, replaced)
                 
                 st.success(f"✅ 오늘의 근무 기록이 저장되었습니다! (근무시간: {hours}시간)")
                 st.rerun()
@@ -688,7 +720,7 @@ def work_entry_page():
                 hours = calculate_work_hours(start_str, end_str, 1.0)
                 
                 # Add to database
-                log_id = add_work_log(
+                saved = add_work_log(
                     emp_id=emp_id,
                     work_date=work_date.isoformat(),
                     start_time=start_str,
@@ -700,15 +732,22 @@ def work_entry_page():
                     created_by=st.session_state.full_name,
                     is_manual=1
                 )
+                if saved is None:
+                    st.error("⚠️ 저장에 실패했습니다. 잠시 후 다시 시도해주세요.")
+                    return
+                replaced = saved['replaced']
                 
                 # Log the action
                 add_system_log(
                     st.session_state.username,
-                    "근무 기록 입력",
+                    "근무 기록 수정" if replaced else "근무 기록 입력",
                     f"{emp_id} / {work_date} / {hours}시간"
+                    + (f" (기존 기록 ID {replaced['id']} 교체)" if replaced else "")
                 )
+                if replaced:
+                    st.warning(replaced_log_notice(work_date, replaced))
                 
-                st.success(f"✅ 근무 기록이 저장되었습니다! (ID: {log_id})")
+                st.success(f"✅ 근무 기록이 저장되었습니다! (ID: {saved['id']})")
 
 
 def view_logs_page():
@@ -761,22 +800,46 @@ def view_logs_page():
         else:
             emp_id_filter = selected_emp_filter.split('(')[1].strip(')')
     
-    logs = get_work_logs(
-        emp_id=emp_id_filter,
-        start_date=start_filter.isoformat(),
-        end_date=end_filter.isoformat()
-    )
+    # 검색·정렬·페이지 크기
+    col_q1, col_q2, col_q3, col_q4 = st.columns([1, 2, 1, 1])
+    with col_q1:
+        type_filter = st.selectbox("근무유형", options=["전체"] + WORK_TYPES, key="view_work_type")
+    with col_q2:
+        keyword = st.text_input("업무 내용 검색", key="view_keyword")
+    with col_q3:
+        sort_label = st.selectbox("정렬", options=list(LOG_SORT_OPTIONS), key="view_sort")
+    with col_q4:
+        page_size = st.selectbox("페이지당", options=PAGE_SIZE_OPTIONS, index=1, key="view_page_size")
+    
+    filters = {
+        'emp_id': emp_id_filter,
+        'start_date': start_filter.isoformat(),
+        'end_date': end_filter.isoformat(),
+        'work_type': None if type_filter == "전체" else type_filter,
+        'keyword': keyword.strip() or None,
+    }
+    sort_by, descending = LOG_SORT_OPTIONS[sort_label]
+    
+    # 통계는 SQL 집계, 목록은 현재 페이지만 조회
+    totals = get_work_totals(**filters)
     
-    if not logs:
+    if not totals['total_logs']:
         st.warning("📭 조회된 기록이 없습니다.")
         return
     
+    cursor = current_page_cursor(
+        "view_logs_pager", (tuple(filters.values()), sort_by, descending, page_size)
+    )
+    page = get_work_logs_page(**filters, sort_by=sort_by, descending=descending,
+                              after=cursor, limit=page_size)
+    logs = page['rows']
+    
     # Statistics
     st.subheader("📊 통계")
     col_stat1, col_stat2, col_stat3 = st.columns(3)
     
-    total_days = len(logs)
-    total_hours = sum(log['work_hours'] for log in logs)
+    total_days = totals['total_logs']
+    total_hours = totals['total_hours']
     avg_hours = total_hours / total_days if total_days > 0 else 0
     
     with col_stat1:
@@ -793,6 +856,8 @@ def view_logs_page():
     display_df.columns = ['날짜', '사번', '시작', '종료', '근무시간', '업무내용', '근무유형']
     
     st.dataframe(display_df, use_container_width=True, hide_index=True, height=400)
+    
+    page_navigation("view_logs_pager", page['next_cursor'], total_days, page_size)
 
 
 def admin_tools_page():
@@ -6,10 +6,15 @@ SQLite with WAL mode for better concurrency
 통합 DB 연동: 직원 관련 함수는 shared 모듈 사용
 """
 
+import copy
+import math
+import os
 import sqlite3
 import sys
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -23,15 +28,9 @@ DB_FILE = str(Path(__file__).parent / "work_logs.db")
 
 @contextmanager
 def get_db_connection():
-    """Database connection context manager with WAL mode"""
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    conn.row_factory = sqlite3.Row
-    try:
+    """Database connection context manager (pooled, WAL mode)"""
+    with shared_db.get_pool(DB_FILE).connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 def init_database():
@@ -111,14 +110,61 @@ def init_database():
         """)
         
         # Create indexes for performance
-        c.execute("CREATE INDEX IF NOT EXISTS idx_work_logs_emp_date ON work_logs(emp_id, work_date)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_work_logs_date ON work_logs(work_date)")
+        _ensure_unique_work_day(c)
+        # 기간 조회·페이지 정렬 (work_date, start_time, id) 용
+        c.execute("CREATE INDEX IF NOT EXISTS idx_work_logs_date_start ON work_logs(work_date, start_time)")
+        c.execute("DROP INDEX IF EXISTS idx_work_logs_date")
+        
+        # 월별 집계 테이블 (트리거로 자동 갱신)
+        shared_db.ensure_work_log_rollup(c)
         c.execute("CREATE INDEX IF NOT EXISTS idx_system_logs_timestamp ON system_logs(timestamp)")
         
         conn.commit()
         print("✅ Database initialized with WAL mode")
 
 
+def _ensure_unique_work_day(c):
+    """
+    Unique index on work_logs(emp_id, work_date) - 직원별 하루 1건
+    기존 중복 기록은 가장 최근 것(id 최대)만 남기고 work_logs_duplicates 로 옮긴 뒤 생성
+    (옮긴 건수는 시스템 로그에 남기고 관리자 대시보드에 표시 - count_moved_duplicate_logs)
+    """
+    exists = c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_work_logs_emp_date_unique'"
+    ).fetchone()
+    if exists:
+        return
+    
+    duplicates = """
+        SELECT id FROM work_logs
+        WHERE id NOT IN (SELECT MAX(id) FROM work_logs GROUP BY emp_id, work_date)
+    """
+    if c.execute(f"SELECT 1 FROM work_logs WHERE id IN ({duplicates}) LIMIT 1").fetchone():
+        c.execute("CREATE TABLE IF NOT EXISTS work_logs_duplicates AS SELECT * FROM work_logs WHERE 0")
+        c.execute(f"INSERT INTO work_logs_duplicates SELECT * FROM work_logs WHERE id IN ({duplicates})")
+        moved = c.execute(f"DELETE FROM work_logs WHERE id IN ({duplicates})").rowcount
+        print(f"⚠️ 중복 근무 기록 {moved}건을 work_logs_duplicates 로 이동했습니다")
+        add_system_log(
+            "system", "중복 근무 기록 이동",
+            f"{moved}건 → work_logs_duplicates (직원·날짜별 최신 기록만 유지)"
+        )
+    
+    c.execute("CREATE UNIQUE INDEX idx_work_logs_emp_date_unique ON work_logs(emp_id, work_date)")
+    # 같은 컬럼의 기존 일반 인덱스는 고유 인덱스로 대체
+    c.execute("DROP INDEX IF EXISTS idx_work_logs_emp_date")
+
+
+def count_moved_duplicate_logs() -> int:
+    """고유 인덱스 생성 시 work_logs_duplicates 로 옮긴 중복 근무 기록 수 (없으면 0)"""
+    with get_db_connection() as conn:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'work_logs_duplicates'"
+        ).fetchone()
+        if not exists:
+            return 0
+        return conn.execute("SELECT COUNT(*) FROM work_logs_duplicates").fetchone()[0]
+
+
 def seed_initial_data(admin_password_hash: str, user_password_hash: str):
     """Seed initial admin user and default employee"""
     with get_db_connection() as conn:
@@ -288,43 +334,226 @@ def get_work_logs(emp_id: Optional[str] = None, start_date: Optional[str] = None
         return [dict(row) for row in c.fetchall()]
 
 
-def add_work_log(emp_id: str, work_date: str, start_time: str, end_time: str,
-                break_time: str, work_hours: float, work_description: str,
-                work_type: str, created_by: str, is_manual: int = 1) -> int:
-    """Add a single work log"""
+def _work_log_filter(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     emp_id: Optional[str] = None, work_type: Optional[str] = None,
+                     keyword: Optional[str] = None):
+    """WHERE clause + params for optional work log filters"""
+    clauses, params = [], []
+    if emp_id:
+        clauses.append("emp_id = ?")
+        params.append(emp_id)
+    if start_date:
+        clauses.append("work_date >= ?")
+        params.append(start_date)
+    if end_date:
+        clauses.append("work_date <= ?")
+        params.append(end_date)
+    if work_type:
+        clauses.append("work_type = ?")
+        params.append(work_type)
+    if keyword:
+        clauses.append("work_description LIKE ?")
+        params.append(f"%{keyword}%")
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
+
+# 페이지 정렬 기준: 정렬 컬럼 + 동순위 구분 컬럼 (마지막은 항상 id 로 순서 고정)
+WORK_LOG_SORT_KEYS = {
+    'work_date': ('work_date', 'start_time', 'id'),
+    'emp_id': ('emp_id', 'work_date', 'id'),
+    'work_hours': ('work_hours', 'work_date', 'id'),
+}
+
+MAX_PAGE_SIZE = 500
+
+
+def get_work_logs_page(emp_id: Optional[str] = None, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, work_type: Optional[str] = None,
+                       keyword: Optional[str] = None, sort_by: str = 'work_date',
+                       descending: bool = True, after: Optional[tuple] = None,
+                       limit: int = 50) -> Dict:
+    """
+    Keyset-paginated work logs (OFFSET 없이 마지막 행 이후부터 조회 - 페이지마다 일정한 비용)
+    Args:
+        emp_id, start_date, end_date, work_type, keyword: Filters (keyword 는 업무 내용 검색)
+        sort_by: WORK_LOG_SORT_KEYS 중 하나
+        descending: True 면 최근/큰 값부터
+        after: 이전 페이지의 next_cursor (None 이면 첫 페이지)
+        limit: Page size (최대 MAX_PAGE_SIZE)
+    Returns:
+        {'rows': [...], 'next_cursor': 다음 페이지 커서 (마지막 페이지면 None)}
+    """
+    if sort_by not in WORK_LOG_SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort_by}")
+    keys = WORK_LOG_SORT_KEYS[sort_by]
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    
+    where, params = _work_log_filter(start_date, end_date, emp_id, work_type, keyword)
+    if after is not None:
+        key_expr = f"({', '.join(keys)})"
+        where += (" AND " if where else " WHERE ") + f"{key_expr} {'<' if descending else '>'} (?, ?, ?)"
+        params += list(after)
+    
+    direction = "DESC" if descending else "ASC"
+    order = ", ".join(f"{key} {direction}" for key in keys)
+    
     with get_db_connection() as conn:
         c = conn.cursor()
-        c.execute("""
-            INSERT INTO work_logs 
-            (emp_id, work_date, start_time, end_time, break_time, work_hours, 
-             work_description, work_type, created_by, is_manual, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Approved')
-        """, (emp_id, work_date, start_time, end_time, break_time, work_hours,
-              work_description, work_type, created_by, is_manual))
-        conn.commit()
-        return c.lastrowid
+        c.execute(f"SELECT * FROM work_logs{where} ORDER BY {order} LIMIT ?", params + [limit + 1])
+        rows = [dict(row) for row in c.fetchall()]
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = tuple(rows[-1][key] for key in keys)
+    return {'rows': rows, 'next_cursor': next_cursor}
+
+
+def iter_work_logs(emp_id: Optional[str] = None, start_date: Optional[str] = None,
+                   end_date: Optional[str] = None, descending: bool = True,
+                   chunk_size: int = MAX_PAGE_SIZE) -> Iterator[Dict]:
+    """
+    Stream work logs in get_work_logs order, one keyset page at a time
+    (페이지마다 연결을 반납하므로 긴 읽기 트랜잭션 없이 대량 내보내기에 사용)
+    """
+    cursor = None
+    while True:
+        page = get_work_logs_page(emp_id=emp_id, start_date=start_date, end_date=end_date,
+                                  descending=descending, after=cursor, limit=chunk_size)
+        yield from page['rows']
+        cursor = page['next_cursor']
+        if cursor is None:
+            return
+
+
+_WORK_LOG_INSERT = """
+    INSERT INTO work_logs 
+    (emp_id, work_date, start_time, end_time, break_time, work_hours, 
+     work_description, work_type, created_by, is_manual, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Approved')
+"""
+
+# 같은 (emp_id, work_date) 기록이 이미 있을 때의 처리
+_CONFLICT_CLAUSES = {
+    # 기존 기록 유지
+    'skip': """
+    ON CONFLICT(emp_id, work_date) DO NOTHING
+    """,
+    # 새 기록으로 교체 (id 유지, 수정 이력 기록)
+    'replace': """
+    ON CONFLICT(emp_id, work_date) DO UPDATE SET
+        start_time = excluded.start_time,
+        end_time = excluded.end_time,
+        break_time = excluded.break_time,
+        work_hours = excluded.work_hours,
+        work_description = excluded.work_description,
+        work_type = excluded.work_type,
+        is_manual = excluded.is_manual,
+        modified_at = CURRENT_TIMESTAMP,
+        modified_by = excluded.created_by
+    """,
+    # 기존 기록의 빈 항목만 새 값으로 채움 (채울 값이 있을 때만 수정으로 처리)
+    'merge': """
+    ON CONFLICT(emp_id, work_date) DO UPDATE SET
+        break_time = COALESCE(NULLIF(break_time, ''), excluded.break_time),
+        work_description = COALESCE(NULLIF(work_description, ''), excluded.work_description),
+        work_type = COALESCE(NULLIF(work_type, ''), excluded.work_type),
+        modified_at = CURRENT_TIMESTAMP,
+        modified_by = excluded.created_by
+    WHERE (COALESCE(break_time, '') = '' AND COALESCE(excluded.break_time, '') <> '')
+       OR (COALESCE(work_description, '') = '' AND COALESCE(excluded.work_description, '') <> '')
+       OR (COALESCE(work_type, '') = '' AND COALESCE(excluded.work_type, '') <> '')
+    """,
+}
+
+CONFLICT_POLICIES = tuple(_CONFLICT_CLAUSES)
+
+
+def add_work_log(emp_id: str, work_date: str, start_time: str, end_time: str,
+                break_time: str, work_hours: float, work_description: str,
+                work_type: str, created_by: str, is_manual: int = 1) -> Optional[Dict]:
+    """
+    Add a single work log (같은 날 기록이 있으면 새 내용으로 교체)
+    출퇴근 시간대 동시 입력은 쓰기 큐에서 모아 한 번에 커밋 (잠금 시 재시도)
+    Returns:
+        {'id': 저장된 기록 id, 'replaced': 교체된 기존 기록 (없으면 None)}, 실패 시 None
+    """
+    def write(conn):
+        previous = conn.execute("""
+            SELECT id, start_time, end_time, work_hours, work_type, created_by
+            FROM work_logs WHERE emp_id = ? AND work_date = ?
+        """, (emp_id, work_date)).fetchone()
+        conn.execute(_WORK_LOG_INSERT + _CONFLICT_CLAUSES['replace'],
+                     (emp_id, work_date, start_time, end_time, break_time, work_hours,
+                      work_description, work_type, created_by, is_manual))
+        log_id = conn.execute(
+            "SELECT id FROM work_logs WHERE emp_id = ? AND work_date = ?", (emp_id, work_date)
+        ).fetchone()[0]
+        return {'id': log_id, 'replaced': dict(previous) if previous else None}
+    
+    try:
+        saved = shared_db.queued_write(write, DB_FILE)
+    except sqlite3.Error as e:
+        print(f"Add work log error: {e}")
+        return None
+    invalidate_month_buckets()
+    return saved
+
+
+def work_log_row(log: Dict) -> tuple:
+    """Work log dict → bulk_write_work_logs row tuple"""
+    return (
+        log['emp_id'], log['work_date'], log['start_time'], log['end_time'],
+        log.get('break_time', '12:00-13:00'), log['work_hours'],
+        log['work_description'], log.get('work_type', '재택근무'),
+        log['created_by'], log.get('is_manual', 1)
+    )
+
+
+def bulk_add_work_logs(logs: List[Dict], on_conflict: str = 'skip') -> int:
+    """Bulk insert work logs (returns number of newly inserted rows)"""
+    return bulk_write_work_logs([work_log_row(log) for log in logs], on_conflict)['inserted']
 
 
-def bulk_add_work_logs(logs: List[Dict]) -> int:
-    """Bulk insert work logs"""
+def bulk_write_work_logs(rows: List[tuple], on_conflict: str = 'skip',
+                         chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Chunked executemany bulk writer with duplicate-day protection
+    Args:
+        rows: (emp_id, work_date, start_time, end_time, break_time, work_hours,
+               work_description, work_type, created_by, is_manual) tuples
+        on_conflict: 같은 직원·날짜 기록이 있을 때
+                     'skip' (기존 유지) / 'replace' (새 기록으로 교체) / 'merge' (빈 항목만 채움)
+        chunk_size: 트랜잭션당 행 수
+    Returns:
+        {'inserted': 새로 추가, 'updated': 기존 기록 수정, 'skipped': 변경 없음}
+    """
+    if on_conflict not in _CONFLICT_CLAUSES:
+        raise ValueError(f"on_conflict must be one of {CONFLICT_POLICIES}: {on_conflict}")
+    
+    result = {'inserted': 0, 'updated': 0, 'skipped': 0}
+    if not rows:
+        return result
+    
+    sql = _WORK_LOG_INSERT + _CONFLICT_CLAUSES[on_conflict]
     with get_db_connection() as conn:
-        c = conn.cursor()
-        count = 0
-        for log in logs:
-            c.execute("""
-                INSERT INTO work_logs 
-                (emp_id, work_date, start_time, end_time, break_time, work_hours, 
-                 work_description, work_type, created_by, is_manual, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Approved')
-            """, (
-                log['emp_id'], log['work_date'], log['start_time'], log['end_time'],
-                log.get('break_time', '12:00-13:00'), log['work_hours'],
-                log['work_description'], log.get('work_type', '재택근무'),
-                log['created_by'], log.get('is_manual', 1)
-            ))
-            count += 1
-        conn.commit()
-        return count
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            
+            # 새 행은 AUTOINCREMENT id 가 기존 최대값보다 큼
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM work_logs").fetchone()[0]
+            # rowcount 는 트리거(월별 집계)의 변경을 제외한 직접 변경 행 수
+            changed = conn.executemany(sql, chunk).rowcount
+            inserted = conn.execute("SELECT COUNT(*) FROM work_logs WHERE id > ?", (max_id,)).fetchone()[0]
+            conn.commit()
+            
+            result['inserted'] += inserted
+            result['updated'] += changed - inserted
+            result['skipped'] += len(chunk) - changed
+    
+    invalidate_month_buckets()
+    return result
 
 
 def update_work_log(log_id: int, updates: Dict, modified_by: str) -> bool:
@@ -337,6 +566,7 @@ def update_work_log(log_id: int, updates: Dict, modified_by: str) -> bool:
             params = list(updates.values()) + [datetime.now().isoformat(), modified_by, log_id]
             c.execute(query, params)
             conn.commit()
+        invalidate_month_buckets()
         return True
     except Exception as e:
         print(f"Update error: {e}")
@@ -350,12 +580,119 @@ def delete_work_log(log_id: int) -> bool:
             c = conn.cursor()
             c.execute("DELETE FROM work_logs WHERE id = ?", (log_id,))
             conn.commit()
+        invalidate_month_buckets()
         return True
     except Exception as e:
         print(f"Delete error: {e}")
         return False
 
 
+# 표 편집기에서 수정할 수 있는 컬럼 (id·emp_id·메타데이터 제외)
+EDITABLE_WORK_LOG_COLUMNS = (
+    'work_date', 'start_time', 'end_time', 'break_time', 'work_hours',
+    'work_description', 'work_type'
+)
+
+
+def _is_blank(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _db_value(value):
+    """numpy/pandas 스칼라 → SQLite 바인딩 가능한 값 (NaN → None)"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    return None if _is_blank(value) else value
+
+
+def diff_work_logs(original, edited,
+                   columns: Tuple[str, ...] = EDITABLE_WORK_LOG_COLUMNS) -> Dict:
+    """
+    Minimal change set between the original and edited rows (id 기준 비교)
+    Args:
+        original: 편집 전 DataFrame 또는 행 목록 ('id' 포함)
+        edited: 편집 후 DataFrame 또는 행 목록 (st.data_editor 결과)
+                original 에 있던 id 가 빠지면 삭제로 간주, id 없는 새 행은 무시
+        columns: 비교할 컬럼
+    Returns:
+        {'updates': {id: {컬럼: 새 값}}, 'deletes': [id]} (apply_work_log_changes 인자)
+    """
+    if hasattr(original, 'to_dict'):
+        original = original.to_dict('records')
+    if hasattr(edited, 'to_dict'):
+        edited = edited.to_dict('records')
+    
+    before = {int(row['id']): row for row in original}
+    updates = {}
+    seen = set()
+    for row in edited:
+        if _is_blank(row.get('id')):
+            continue
+        log_id = int(row['id'])
+        if log_id not in before:
+            continue
+        seen.add(log_id)
+        changed = {}
+        for col in columns:
+            if col not in row:
+                continue
+            old, new = _db_value(before[log_id].get(col)), _db_value(row[col])
+            if old != new:
+                changed[col] = new
+        if changed:
+            updates[log_id] = changed
+    deletes = [log_id for log_id in before if log_id not in seen]
+    return {'updates': updates, 'deletes': deletes}
+
+
+def apply_work_log_changes(updates: Dict[int, Dict], deletes: List[int],
+                           modified_by: str) -> Optional[Dict[str, int]]:
+    """
+    Apply a change set in one transaction (전부 반영되거나 전부 취소)
+    같은 컬럼 조합을 바꾼 행끼리 묶어 UPDATE 하나를 executemany 로 실행
+    Args:
+        updates: {id: {컬럼: 새 값}} (diff_work_logs 결과)
+        deletes: 삭제할 id 목록
+        modified_by: 수정자
+    Returns:
+        {'updated', 'deleted'} 또는 실패 시 None (예: 같은 직원·날짜 중복)
+    """
+    groups: Dict[Tuple[str, ...], List[tuple]] = {}
+    modified_at = datetime.now().isoformat()
+    delete_ids = set(deletes)
+    for log_id, changes in updates.items():
+        if log_id in delete_ids:
+            continue
+        cols = tuple(sorted(changes))
+        invalid = set(cols) - set(EDITABLE_WORK_LOG_COLUMNS)
+        if invalid:
+            raise ValueError(f"Not editable: {sorted(invalid)}")
+        groups.setdefault(cols, []).append(
+            tuple(changes[col] for col in cols) + (modified_at, modified_by, log_id)
+        )
+    
+    result = {'updated': 0, 'deleted': 0}
+    try:
+        # 커밋 전에 실패하면 연결 반납 시 전체 롤백
+        with get_db_connection() as conn:
+            for cols, params in groups.items():
+                set_clause = ", ".join(f"{col} = ?" for col in cols)
+                result['updated'] += conn.executemany(
+                    f"UPDATE work_logs SET {set_clause}, modified_at = ?, modified_by = ? WHERE id = ?",
+                    params
+                ).rowcount
+            if delete_ids:
+                result['deleted'] = conn.executemany(
+                    "DELETE FROM work_logs WHERE id = ?", [(log_id,) for log_id in sorted(delete_ids)]
+                ).rowcount
+            conn.commit()
+        invalidate_month_buckets()
+        return result
+    except sqlite3.Error as e:
+        print(f"Apply changes error: {e}")
+        return None
+
+
 # Company Settings
 def get_company_setting(key: str) -> Optional[str]:
     """Get company setting by key"""
@@ -387,14 +724,14 @@ def update_company_setting(key: str, value: str) -> bool:
 
 # System Logs
 def add_system_log(username: str, action: str, details: str = "", ip_address: str = ""):
-    """Add system log entry"""
-    with get_db_connection() as conn:
-        c = conn.cursor()
-        c.execute("""
+    """Add system log entry (쓰기 큐 사용)"""
+    try:
+        shared_db.queued_write(lambda conn: conn.execute("""
             INSERT INTO system_logs (username, action, details, ip_address)
             VALUES (?, ?, ?, ?)
-        """, (username, action, details, ip_address))
-        conn.commit()
+        """, (username, action, details, ip_address)), DB_FILE)
+    except sqlite3.Error as e:
+        print(f"System log error: {e}")
 
 
 def get_system_logs(limit: int = 100) -> List[Dict]:
@@ -410,19 +747,401 @@ def get_system_logs(limit: int = 100) -> List[Dict]:
 
 
 # Statistics
+def _next_month_start(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _split_months(start_date: Optional[str], end_date: Optional[str]):
+    """
+    Split a period into whole months (월별 집계로 계산) and leftover edges (work_logs 로 계산)
+    Returns:
+        ((시작월, 종료월) - 경계가 없으면 None, [(자투리 시작일, 종료일)])
+        온전한 달이 없거나 날짜 형식이 다르면 (None, [(start_date, end_date)])
+    """
+    try:
+        start = date.fromisoformat(start_date) if start_date else None
+        end = date.fromisoformat(end_date) if end_date else None
+    except ValueError:
+        return None, [(start_date, end_date)]
+    
+    first = start if start is None or start.day == 1 else _next_month_start(start)
+    last = end if end is None or (end + timedelta(days=1)).day == 1 else end.replace(day=1) - timedelta(days=1)
+    if first and last and first > last:
+        return None, [(start_date, end_date)]
+    
+    edges = []
+    if start and start < first:
+        edges.append((start_date, (first - timedelta(days=1)).isoformat()))
+    if end and end > last:
+        edges.append(((last + timedelta(days=1)).isoformat(), end_date))
+    months = (first.isoformat()[:7] if first else None, last.isoformat()[:7] if last else None)
+    return months, edges
+
+
+def _rollup_filter(months: Tuple[Optional[str], Optional[str]], emp_id: Optional[str] = None,
+                   work_type: Optional[str] = None):
+    """WHERE clause + params for work_log_monthly"""
+    clauses, params = [], []
+    if emp_id:
+        clauses.append("emp_id = ?")
+        params.append(emp_id)
+    if months[0]:
+        clauses.append("year_month >= ?")
+        params.append(months[0])
+    if months[1]:
+        clauses.append("year_month <= ?")
+        params.append(months[1])
+    if work_type:
+        clauses.append("work_type = ?")
+        params.append(work_type)
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
+
+def _rollup_months(start_date: Optional[str], end_date: Optional[str],
+                   keyword: Optional[str] = None):
+    """월별 집계로 답할 수 있는 조건이면 (시작월, 종료월), 아니면 None"""
+    if keyword:
+        return None
+    months, edges = _split_months(start_date, end_date)
+    return None if edges else months
+
+
 def get_work_stats(emp_id: str, start_date: str, end_date: str) -> Dict:
-    """Get work statistics for an employee in a date range"""
+    """
+    Get work statistics for an employee in a date range
+    온전한 달은 월별 집계에서, 앞뒤 자투리 기간만 work_logs 에서 합산
+    """
+    months, edges = _split_months(start_date, end_date)
+    total_days, total_hours = 0, 0.0
     with get_db_connection() as conn:
         c = conn.cursor()
+        if months:
+            where, params = _rollup_filter(months, emp_id)
+            c.execute(f"SELECT COALESCE(SUM(days), 0), COALESCE(SUM(hours), 0) FROM work_log_monthly{where}", params)
+            days, hours = c.fetchone()
+            total_days += days
+            total_hours += hours
+        for edge_start, edge_end in edges:
+            where, params = _work_log_filter(edge_start, edge_end, emp_id)
+            c.execute(f"SELECT COUNT(*), COALESCE(SUM(work_hours), 0) FROM work_logs{where}", params)
+            days, hours = c.fetchone()
+            total_days += days
+            total_hours += hours
+        
+        # (emp_id, work_date) 고유 인덱스 양 끝 조회
         c.execute("""
-            SELECT 
-                COUNT(*) as total_days,
-                SUM(work_hours) as total_hours,
-                AVG(work_hours) as avg_hours,
-                MIN(work_date) as first_date,
-                MAX(work_date) as last_date
+            SELECT MIN(work_date) as first_date, MAX(work_date) as last_date
             FROM work_logs
             WHERE emp_id = ? AND work_date BETWEEN ? AND ?
         """, (emp_id, start_date, end_date))
-        row = c.fetchone()
-        return dict(row) if row else {}
+        row = dict(c.fetchone())
+    
+    return {
+        'total_days': total_days,
+        'total_hours': round(total_hours, 2) if total_days else None,
+        'avg_hours': total_hours / total_days if total_days else None,
+        **row
+    }
+
+
+def get_work_totals(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                    emp_id: Optional[str] = None, work_type: Optional[str] = None,
+                    keyword: Optional[str] = None) -> Dict:
+    """
+    Overall totals (SQLite 집계 - 기록을 메모리로 읽지 않음)
+    get_work_logs_page 와 같은 필터를 받아 페이지 조회의 건수 집계로도 사용
+    기간이 월 단위이고 검색어가 없으면 월별 집계 테이블에서 계산
+    Returns:
+        {'total_logs', 'total_hours', 'employee_count', 'manual_count'}
+    """
+    months = _rollup_months(start_date, end_date, keyword)
+    if months:
+        where, params = _rollup_filter(months, emp_id, work_type)
+        with get_db_connection() as conn:
+            c = conn.cursor()
+            c.execute(f"""
+                SELECT 
+                    COALESCE(SUM(days), 0) as total_logs,
+                    COALESCE(ROUND(SUM(hours), 2), 0) as total_hours,
+                    COUNT(DISTINCT emp_id) as employee_count,
+                    COALESCE(SUM(manual_days), 0) as manual_count
+                FROM work_log_monthly{where}
+            """, params)
+            return dict(c.fetchone())
+    
+    where, params = _work_log_filter(start_date, end_date, emp_id, work_type, keyword)
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        c.execute(f"""
+            SELECT 
+                COUNT(*) as total_logs,
+                COALESCE(SUM(work_hours), 0) as total_hours,
+                COUNT(DISTINCT emp_id) as employee_count,
+                COALESCE(SUM(is_manual = 1), 0) as manual_count
+            FROM work_logs{where}
+        """, params)
+        return dict(c.fetchone())
+
+
+def get_employee_work_summary(start_date: Optional[str] = None,
+                              end_date: Optional[str] = None) -> List[Dict]:
+    """
+    Per-employee work days / total hours / average hours
+    Returns:
+        [{'emp_id', 'work_days', 'total_hours', 'avg_hours'}] (emp_id 순)
+    """
+    months = _rollup_months(start_date, end_date)
+    if months:
+        where, params = _rollup_filter(months)
+        with get_db_connection() as conn:
+            c = conn.cursor()
+            c.execute(f"""
+                SELECT 
+                    emp_id,
+                    SUM(days) as work_days,
+                    ROUND(SUM(hours), 2) as total_hours,
+                    SUM(hours) / SUM(days) as avg_hours
+                FROM work_log_monthly{where}
+                GROUP BY emp_id
+                ORDER BY emp_id
+            """, params)
+            return [dict(row) for row in c.fetchall()]
+    
+    where, params = _work_log_filter(start_date, end_date)
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        # (emp_id, work_date) 고유 인덱스 순서로 그룹화
+        c.execute(f"""
+            SELECT 
+                emp_id,
+                COUNT(*) as work_days,
+                SUM(work_hours) as total_hours,
+                AVG(work_hours) as avg_hours
+            FROM work_logs{where}
+            GROUP BY emp_id
+            ORDER BY emp_id
+        """, params)
+        return [dict(row) for row in c.fetchall()]
+
+
+def get_department_work_summary(start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> List[Dict]:
+    """
+    Per-department totals
+    직원 마스터는 통합 DB에 있으므로 직원별 집계 결과를 부서 단위로 합산
+    Returns:
+        [{'department', 'employee_count', 'work_days', 'total_hours', 'avg_hours'}] (부서명 순)
+    """
+    departments = {
+        emp['emp_id']: emp.get('department') or '미지정'
+        for emp in shared_db.get_all_employees(active_only=False)
+    }
+    
+    totals: Dict[str, Dict[str, Any]] = {}
+    for row in get_employee_work_summary(start_date, end_date):
+        dept = departments.get(row['emp_id'], '미지정')
+        item = totals.setdefault(dept, {
+            'department': dept, 'employee_count': 0, 'work_days': 0, 'total_hours': 0.0
+        })
+        item['employee_count'] += 1
+        item['work_days'] += row['work_days']
+        item['total_hours'] += row['total_hours'] or 0
+    
+    for item in totals.values():
+        item['avg_hours'] = item['total_hours'] / item['work_days'] if item['work_days'] else 0
+    return [totals[dept] for dept in sorted(totals)]
+
+
+def get_monthly_work_summary(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                             emp_id: Optional[str] = None) -> List[Dict]:
+    """
+    Per-month totals (YYYY-MM)
+    Returns:
+        [{'year_month', 'employee_count', 'work_days', 'total_hours', 'avg_hours'}] (월 순)
+    """
+    months = _rollup_months(start_date, end_date)
+    if months:
+        where, params = _rollup_filter(months, emp_id)
+        with get_db_connection() as conn:
+            c = conn.cursor()
+            c.execute(f"""
+                SELECT 
+                    year_month,
+                    COUNT(DISTINCT emp_id) as employee_count,
+                    SUM(days) as work_days,
+                    ROUND(SUM(hours), 2) as total_hours,
+                    SUM(hours) / SUM(days) as avg_hours
+                FROM work_log_monthly{where}
+                GROUP BY year_month
+                ORDER BY year_month
+            """, params)
+            return [dict(row) for row in c.fetchall()]
+    
+    where, params = _work_log_filter(start_date, end_date, emp_id)
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        c.execute(f"""
+            SELECT 
+                substr(work_date, 1, 7) as year_month,
+                COUNT(DISTINCT emp_id) as employee_count,
+                COUNT(*) as work_days,
+                SUM(work_hours) as total_hours,
+                AVG(work_hours) as avg_hours
+            FROM work_logs{where}
+            GROUP BY year_month
+            ORDER BY year_month
+        """, params)
+        return [dict(row) for row in c.fetchall()]
+
+
+def get_monthly_rollup(year_month: Optional[str] = None, emp_id: Optional[str] = None) -> List[Dict]:
+    """
+    Rows of the monthly rollup (work_log_monthly)
+    Args:
+        year_month: "YYYY-MM" (None 이면 전체 월)
+        emp_id: Employee filter
+    Returns:
+        [{'emp_id', 'year_month', 'work_type', 'days', 'hours', 'manual_days'}]
+    """
+    where, params = _rollup_filter((year_month, year_month), emp_id)
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        c.execute(f"SELECT * FROM work_log_monthly{where} ORDER BY year_month, emp_id, work_type", params)
+        return [dict(row) for row in c.fetchall()]
+
+
+class MonthBucketCache:
+    """
+    캘린더용 월 단위 집계 캐시 - (년월, 사번) 별로 보관
+    
+    - 이 프로세스의 쓰기: 근무 기록 쓰기 함수가 invalidate_month_buckets 호출
+    - 다른 연결·프로세스의 쓰기: 전용 감시 연결의 PRAGMA data_version 변화로 감지
+    - 최근 조회한 max_entries 개만 유지 (LRU)
+    """
+    
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._write_version = 0
+        self._loaded_key = None
+        self._watch_conn = None
+        self._watch_path = None
+        self._entries = OrderedDict()
+    
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 재계산)"""
+        with self._lock:
+            self._write_version += 1
+    
+    def _data_version(self, path: str) -> int:
+        if self._watch_conn is None or self._watch_path != path:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+            self._watch_conn = sqlite3.connect(path, check_same_thread=False)
+            self._watch_path = path
+        return self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def get(self, year_month: str, emp_id: Optional[str] = None) -> Dict:
+        with self._lock:
+            path = os.path.abspath(DB_FILE)
+            key = (path, self._write_version, self._data_version(path))
+            if key != self._loaded_key:
+                self._entries.clear()
+                self._loaded_key = key
+            
+            entry_key = (year_month, emp_id)
+            buckets = self._entries.get(entry_key)
+            if buckets is None:
+                buckets = _load_month_buckets(year_month, emp_id)
+                self._entries[entry_key] = buckets
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(entry_key)
+            return copy.deepcopy(buckets)
+
+
+def _load_month_buckets(year_month: str, emp_id: Optional[str] = None) -> Dict:
+    start = date.fromisoformat(f"{year_month}-01")
+    conditions = ["w.work_date >= ?", "w.work_date < ?"]
+    params = [start.isoformat(), _next_month_start(start).isoformat()]
+    if emp_id:
+        conditions.append("w.emp_id = ?")
+        params.append(emp_id)
+    
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        # 사번은 제어 문자(char(31))로 이어 붙여 한 행으로 받음 (이름은 조회 시 직원 마스터로 변환)
+        c.execute(f"""
+            SELECT w.work_date, w.work_type, COUNT(*) AS count,
+                   group_concat(w.emp_id, char(31)) AS emp_ids
+            FROM work_logs w
+            WHERE {' AND '.join(conditions)}
+            GROUP BY w.work_date, w.work_type
+            ORDER BY w.work_date, count DESC, w.work_type
+        """, params)
+        rows = c.fetchall()
+    
+    days = {}
+    type_days = {}
+    for work_date, work_type, count, emp_ids in rows:
+        days.setdefault(work_date, []).append({
+            'work_type': work_type,
+            'count': count,
+            'emp_ids': sorted(emp_ids.split('\x1f')),
+        })
+        type_days[work_type] = type_days.get(work_type, 0) + count
+    return {'days': days, 'type_days': type_days, 'work_days': len(days)}
+
+
+_month_bucket_cache = MonthBucketCache()
+
+
+def invalidate_month_buckets():
+    """캘린더 월 집계 캐시 무효화 (work_logs 를 직접 수정한 경우 호출)"""
+    _month_bucket_cache.invalidate()
+
+
+def get_month_buckets(year_month: str, emp_id: Optional[str] = None) -> Dict:
+    """
+    Per-day, per-type calendar buckets for one month (캐시 사용)
+    Args:
+        year_month: "YYYY-MM"
+        emp_id: Employee filter (None 이면 전체 직원)
+    Returns:
+        {'days': {'YYYY-MM-DD': [{'work_type', 'count', 'emp_ids', 'names'}]} (인원이 많은 유형 순),
+         'type_days': {work_type: 근무일 수 (직원·일 기준)},
+         'work_days': 기록이 있는 날짜 수}
+    """
+    buckets = _month_bucket_cache.get(year_month, emp_id)
+    
+    # 직원 마스터는 통합 DB에 있으므로 캐시된 직원 목록으로 이름 변환 (없으면 사번 표시)
+    names = {
+        emp['emp_id']: emp['name']
+        for emp in shared_db.get_all_employees(active_only=False)
+    }
+    for day_buckets in buckets['days'].values():
+        for bucket in day_buckets:
+            bucket['names'] = sorted(names.get(i, i) for i in bucket['emp_ids'])
+    return buckets
+
+
+def rebuild_monthly_rollup() -> int:
+    """Recompute work_log_monthly from work_logs (집계 행 수 반환)"""
+    with get_db_connection() as conn:
+        count = shared_db.rebuild_work_log_rollup(conn.cursor())
+        conn.commit()
+        return count
+
+
+def get_recent_work_logs(limit: int = 10) -> List[Dict]:
+    """Most recent work logs (get_work_logs 와 같은 정렬, LIMIT 적용)"""
+    with get_db_connection() as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT * FROM work_logs 
+            ORDER BY work_date DESC, start_time DESC 
+            LIMIT ?
+        """, (limit,))
+        return [dict(row) for row in c.fetchall()]
@@ -0,0 +1,134 @@
+"""
+history_generator.py
+Remote Work Management System - Vectorized History Generator
+근무일 × 직원 전체를 NumPy 배열로 한 번에 생성 (다년간·부서 단위 일괄 생성용)
+"""
+
+from datetime import date, time
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from holidays import BUSDAY_CALENDAR
+
+# bulk_write_work_logs 컬럼 순서
+WORK_LOG_COLUMNS = (
+    'emp_id', 'work_date', 'start_time', 'end_time', 'break_time', 'work_hours',
+    'work_description', 'work_type', 'created_by', 'is_manual'
+)
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _time_strings() -> np.ndarray:
+    """하루 전체 초 → "HH:MM:SS" 조회표"""
+    seconds = np.arange(SECONDS_PER_DAY)
+    return np.array([
+        f"{h:02d}:{m:02d}:{s:02d}"
+        for h, m, s in zip(seconds // 3600, seconds // 60 % 60, seconds % 60)
+    ], dtype=object)
+
+
+def workday_array(start_date: date, end_date: date) -> np.ndarray:
+    """
+    Workdays (Mon-Fri, excluding KOREAN_HOLIDAYS) between start and end as datetime64[D]
+    generate_weekday_dates 와 같은 결과를 한 번의 배열 연산으로 계산
+    """
+    days = np.arange(
+        np.datetime64(start_date, 'D'),
+        np.datetime64(end_date, 'D') + 1,
+        dtype='datetime64[D]'
+    )
+    return days[np.is_busday(days, busdaycal=BUSDAY_CALENDAR)]
+
+
+def break_hours(break_time: str, default: float = 1.0) -> float:
+    """ "12:00-13:00" → 1.0 (형식이 다르면 default) """
+    try:
+        start, end = break_time.split('-')
+        sh, sm = start.strip().split(':')[:2]
+        eh, em = end.strip().split(':')[:2]
+        return max(0.0, ((int(eh) * 60 + int(em)) - (int(sh) * 60 + int(sm))) / 60)
+    except (ValueError, AttributeError):
+        return default
+
+
+def _seconds(t: time) -> int:
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def generate_history_rows(
+    emp_ids: Sequence[str],
+    start_date: date,
+    end_date: date,
+    base_start: time,
+    base_end: time,
+    start_jitter: Tuple[int, int],
+    end_jitter: Tuple[int, int],
+    break_time: str,
+    work_type: str,
+    created_by: str,
+    descriptions: Dict[str, Sequence[str]],
+    seed: Optional[int] = None
+) -> List[tuple]:
+    """
+    Generate work log rows for every (employee, workday) pair at once
+    Args:
+        emp_ids: Target employee IDs
+        start_date, end_date: Period (inclusive)
+        base_start, base_end: Base clock-in / clock-out time
+        start_jitter, end_jitter: (min, max) minutes added to base time
+                                  (WORK_SCHEDULE_PRESETS random_start_* / random_end_*)
+        break_time: "HH:MM-HH:MM"
+        work_type: 근무유형
+        created_by: 작성자
+        descriptions: {emp_id: 업무 내용 후보} (후보 중 랜덤 선택)
+        seed: Random seed (재현용)
+    Returns:
+        Rows in WORK_LOG_COLUMNS order (bulk_write_work_logs 에 바로 전달)
+    """
+    days = workday_array(start_date, end_date)
+    if not len(emp_ids) or not len(days):
+        return []
+
+    rng = np.random.default_rng(seed)
+    n_days = len(days)
+    n = len(emp_ids) * n_days
+
+    # add_random_minutes_seconds 와 같은 분포: 분 단위 오프셋 + 0~59초
+    start_sec = (
+        _seconds(base_start)
+        + rng.integers(start_jitter[0], start_jitter[1] + 1, n) * 60
+        + rng.integers(0, 60, n)
+    ) % SECONDS_PER_DAY
+    end_sec = (
+        _seconds(base_end)
+        + rng.integers(end_jitter[0], end_jitter[1] + 1, n) * 60
+        + rng.integers(0, 60, n)
+    ) % SECONDS_PER_DAY
+
+    # calculate_work_hours 와 같이 분 단위까지만 사용
+    minutes = end_sec // 60 - start_sec // 60
+    work_hours = np.round(np.maximum(0, minutes / 60 - break_hours(break_time)), 2)
+
+    # 직원별 업무 내용 후보에서 랜덤 선택
+    desc = np.empty(n, dtype=object)
+    for i, emp_id in enumerate(emp_ids):
+        choices = np.array(descriptions.get(emp_id) or [""], dtype=object)
+        desc[i * n_days:(i + 1) * n_days] = choices[rng.integers(0, len(choices), n_days)]
+
+    times = _time_strings()
+    return list(zip(
+        np.repeat(np.array(emp_ids, dtype=object), n_days).tolist(),
+        np.tile(np.datetime_as_string(days), len(emp_ids)).tolist(),
+        times[start_sec].tolist(),
+        times[end_sec].tolist(),
+        [break_time] * n,
+        work_hours.tolist(),
+        desc.tolist(),
+        [work_type] * n,
+        [created_by] * n,
+        [1] * n,
+    ))
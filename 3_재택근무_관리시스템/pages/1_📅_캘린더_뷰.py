@@ -14,7 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from shared.database import get_all_employees, get_employee_by_name
-from database import get_db_connection
+from database import get_month_buckets
 
 # 페이지 설정
 st.set_page_config(
@@ -102,47 +102,15 @@ st.divider()
 # 캘린더 데이터 조회
 # ============================================================
 
-# 선택한 월의 근무 로그 조회
-with get_db_connection() as conn:
-    cursor = conn.cursor()
-    
-    if selected_name == "전체 직원":
-        # 전체 직원의 근무 로그
-        cursor.execute("""
-        SELECT e.name, w.work_date, w.work_type, w.work_location, w.notes
-        FROM work_logs w
-        JOIN employees e ON w.emp_id = e.emp_id
-        WHERE strftime('%Y', w.work_date) = ? AND strftime('%m', w.work_date) = ?
-        ORDER BY w.work_date, e.name
-        """, (str(selected_year), f"{selected_month:02d}"))
-    else:
-        # 특정 직원의 근무 로그
-        employee = get_employee_by_name(selected_name)
-        emp_id = employee['emp_id']
-        
-        cursor.execute("""
-        SELECT e.name, w.work_date, w.work_type, w.work_location, w.notes
-        FROM work_logs w
-        JOIN employees e ON w.emp_id = e.emp_id
-        WHERE w.emp_id = ? AND strftime('%Y', w.work_date) = ? AND strftime('%m', w.work_date) = ?
-        ORDER BY w.work_date
-        """, (emp_id, str(selected_year), f"{selected_month:02d}"))
-    
-    work_logs = cursor.fetchall()
-
-# 로그를 딕셔너리로 변환 (날짜별)
-work_dict = {}
-for log in work_logs:
-    work_date = log[1]  # work_date
-    if work_date not in work_dict:
-        work_dict[work_date] = []
-    
-    work_dict[work_date].append({
-        'name': log[0],
-        'work_type': log[2],
-        'work_location': log[3],
-        'notes': log[4]
-    })
+# 선택한 월의 일자·근무유형별 집계 (월·직원별 캐시, 기록이 바뀌면 자동 갱신)
+if selected_name == "전체 직원":
+    emp_id = None
+else:
+    employee = get_employee_by_name(selected_name)
+    emp_id = employee['emp_id']
+
+buckets = get_month_buckets(f"{selected_year}-{selected_month:02d}", emp_id)
+work_dict = buckets['days']
 
 # ============================================================
 # 캘린더 렌더링
@@ -201,13 +169,13 @@ for week in cal:
                 
                 # 근무 로그가 있으면 스타일 추가
                 if date_str in work_dict:
-                    # 첫 번째 로그의 근무 유형으로 배경색 결정
-                    first_log = work_dict[date_str][0]
-                    if '재택' in first_log['work_type']:
+                    # 인원이 가장 많은 근무 유형으로 배경색 결정
+                    main_type = work_dict[date_str][0]['work_type']
+                    if '재택' in main_type:
                         css_class += " work-remote"
-                    elif '사무실' in first_log['work_type'] or '출근' in first_log['work_type']:
+                    elif '사무실' in main_type or '출근' in main_type:
                         css_class += " work-office"
-                    elif '휴가' in first_log['work_type'] or '휴직' in first_log['work_type']:
+                    elif '휴가' in main_type or '휴직' in main_type:
                         css_class += " work-leave"
                 
                 # 날짜 출력
@@ -216,11 +184,14 @@ for week in cal:
                 
                 # 근무 로그 출력
                 if date_str in work_dict:
-                    for log in work_dict[date_str]:
+                    for bucket in work_dict[date_str]:
                         if selected_name == "전체 직원":
-                            st.caption(f"{log['name']}: {log['work_type']}")
+                            st.caption(
+                                f"{bucket['work_type']}: {bucket['count']}명",
+                                help=", ".join(bucket['names'])
+                            )
                         else:
-                            st.caption(f"{log['work_type']}")
+                            st.caption(f"{bucket['work_type']}")
                 
                 st.markdown('</div>', unsafe_allow_html=True)
 
@@ -232,17 +203,14 @@ st.divider()
 
 st.subheader("📊 이번 달 통계")
 
-if work_logs:
-    # 근무 유형별 집계
-    work_type_count = {}
-    for log in work_logs:
-        work_type = log[2]  # work_type
-        work_type_count[work_type] = work_type_count.get(work_type, 0) + 1
-    
+# 근무 유형별 집계
+work_type_count = buckets['type_days']
+
+if work_type_count:
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("총 근무일", len(set([log[1] for log in work_logs])))
+        st.metric("총 근무일", buckets['work_days'])
     
     with col2:
         remote_days = sum([count for wtype, count in work_type_count.items() if '재택' in wtype])
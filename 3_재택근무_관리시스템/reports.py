@@ -7,12 +7,86 @@ Generate clean Excel files for legal compliance (no internal metadata)
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from functools import partial
 from io import BytesIO
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from database import (
-    get_work_logs, get_work_stats, get_all_employees,
-    get_company_setting, add_system_log
+    get_work_logs_page, iter_work_logs, get_work_stats, get_all_employees,
+    get_employee_by_id, get_company_setting, add_system_log,
+    get_work_totals, get_employee_work_summary, get_department_work_summary,
+    get_monthly_work_summary, get_recent_work_logs
 )
+from shared.excel_writer import XLSX_MIME, ZIP_MIME, StreamingWorkbook, build_workbook, zip_workbooks
+
+
+# 근무기록 시트 열 (헤더, 너비) - 외부 제출용 항목만
+RECORD_COLUMNS = [
+    ('날짜', 12), ('성명', 10), ('부서', 12), ('직급', 10), ('출근시간', 10), ('퇴근시간', 10),
+    ('휴게시간', 13), ('근무시간', 10), ('업무내용', 50), ('근무유형', 10)
+]
+
+# 일괄 보고서 요약 시트 열
+BULK_SUMMARY_COLUMNS = [
+    ('사번', 12), ('성명', 10), ('부서', 12), ('직급', 10),
+    ('총 근무일수', 12), ('총 근무시간', 12), ('평균 근무시간', 14)
+]
+
+
+def _company_info() -> Dict:
+    return {
+        'company_name': get_company_setting('company_name') or '(주)예시회사',
+        'representative': get_company_setting('representative') or '이진선',
+        'business_number': get_company_setting('business_number') or '123-45-67890',
+    }
+
+
+def _record_rows(employee: Dict, start_date: str, end_date: str) -> Iterator[tuple]:
+    """Clean record rows streamed from the DB (내부 메타데이터 제외)"""
+    for log in iter_work_logs(emp_id=employee['emp_id'], start_date=start_date, end_date=end_date):
+        yield (
+            log['work_date'],
+            employee['name'],
+            employee['department'],
+            employee['position'],
+            log['start_time'],
+            log['end_time'],
+            log['break_time'],
+            log['work_hours'],
+            log['work_description'],
+            log['work_type']
+        )
+
+
+def _summary_rows(company: Dict, employee: Dict, start_date: str, end_date: str, stats: Dict) -> List[tuple]:
+    """요약 시트 (항목, 내용)"""
+    return [
+        ('회사명', company['company_name']),
+        ('대표자명', company['representative']),
+        ('사업자등록번호', company['business_number']),
+        ('', ''),
+        ('직원명', employee['name']),
+        ('사번', employee['emp_id']),
+        ('부서', employee['department']),
+        ('직급', employee['position']),
+        ('', ''),
+        ('기간 시작일', start_date),
+        ('기간 종료일', end_date),
+        ('', ''),
+        ('총 근무일수', f"{stats.get('total_days', 0)}일"),
+        ('총 근무시간', f"{stats.get('total_hours') or 0:.1f}시간"),
+        ('평균 근무시간', f"{stats.get('avg_hours') or 0:.1f}시간"),
+        ('', ''),
+        ('보고서 생성일', datetime.now().strftime('%Y-%m-%d %H:%M')),
+        ('생성자', st.session_state.get('full_name', '시스템 관리자'))
+    ]
+
+
+def _write_employee_report(book: StreamingWorkbook, employee: Dict, start_date: str,
+                           end_date: str, stats: Dict, company: Dict):
+    """Sheet 1: Work Records (Clean Data), Sheet 2: Summary"""
+    book.add_sheet('근무기록', _record_rows(employee, start_date, end_date), RECORD_COLUMNS)
+    book.add_sheet('요약', _summary_rows(company, employee, start_date, end_date, stats),
+                   [('', 16), ('', 30)], header=False)
 
 
 def generate_clean_export(emp_id: str, start_date: str, end_date: str) -> BytesIO:
@@ -20,119 +94,75 @@ def generate_clean_export(emp_id: str, start_date: str, end_date: str) -> BytesI
     Generate clean Excel export for official submission
     Only includes: date, name, start_time, end_time, work_description, hours
     Excludes: is_manual, created_at, modified_at, internal flags
+    기록은 DB에서 나눠 읽어 바로 시트에 기록 (기간이 길어도 메모리 사용량 일정)
     """
     
-    # Get work logs
-    logs = get_work_logs(emp_id=emp_id, start_date=start_date, end_date=end_date)
+    # Get statistics (기록 유무 확인 겸용)
+    stats = get_work_stats(emp_id, start_date, end_date)
     
-    if not logs:
+    if not stats.get('total_days'):
         st.warning("선택한 기간에 근무 기록이 없습니다.")
         return None
     
     # Get employee info
-    employees = get_all_employees()
-    employee = next((emp for emp in employees if emp['emp_id'] == emp_id), None)
+    employee = get_employee_by_id(emp_id)
     
     if not employee:
         st.error("직원 정보를 찾을 수 없습니다.")
         return None
     
-    # Get company info
-    company_name = get_company_setting('company_name') or '(주)예시회사'
-    representative = get_company_setting('representative') or '이진선'
-    business_number = get_company_setting('business_number') or '123-45-67890'
-    
-    # Prepare clean data (ONLY what should be shown externally)
-    clean_data = []
-    for log in logs:
-        clean_data.append({
-            '날짜': log['work_date'],
-            '성명': employee['name'],
-            '부서': employee['department'],
-            '직급': employee['position'],
-            '출근시간': log['start_time'],
-            '퇴근시간': log['end_time'],
-            '휴게시간': log['break_time'],
-            '근무시간': log['work_hours'],
-            '업무내용': log['work_description'],
-            '근무유형': log['work_type']
-        })
-    
-    # Create DataFrame
-    df_records = pd.DataFrame(clean_data)
-    
-    # Get statistics
-    stats = get_work_stats(emp_id, start_date, end_date)
-    
-    # Prepare summary data
-    summary_data = {
-        '항목': [
-            '회사명',
-            '대표자명',
-            '사업자등록번호',
-            '',
-            '직원명',
-            '사번',
-            '부서',
-            '직급',
-            '',
-            '기간 시작일',
-            '기간 종료일',
-            '',
-            '총 근무일수',
-            '총 근무시간',
-            '평균 근무시간',
-            '',
-            '보고서 생성일',
-            '생성자'
-        ],
-        '내용': [
-            company_name,
-            representative,
-            business_number,
-            '',
-            employee['name'],
-            employee['emp_id'],
-            employee['department'],
-            employee['position'],
-            '',
-            start_date,
-            end_date,
-            '',
-            f"{stats.get('total_days', 0)}일",
-            f"{stats.get('total_hours', 0):.1f}시간",
-            f"{stats.get('avg_hours', 0):.1f}시간",
-            '',
-            datetime.now().strftime('%Y-%m-%d %H:%M'),
-            st.session_state.get('full_name', '시스템 관리자')
-        ]
-    }
+    output = BytesIO()
+    build_workbook(
+        partial(_write_employee_report, employee=employee, start_date=start_date,
+                end_date=end_date, stats=stats, company=_company_info()),
+        output
+    )
+    output.seek(0)
+    return output
+
+
+def generate_bulk_export(employees: List[Dict], start_date: str, end_date: str,
+                         as_zip: bool = False) -> BytesIO:
+    """
+    Multi-employee export (부서·전체 직원 일괄)
+    as_zip=False: 엑셀 1개 - 요약 시트 + 직원별 근무기록 시트
+    as_zip=True: 직원별 보고서(generate_clean_export 와 같은 형식)를 ZIP 으로 묶음
+    직원 한 명씩 스트리밍으로 기록하며, 기간 내 기록이 없는 직원은 제외
+    """
+    targets = []
+    for employee in employees:
+        stats = get_work_stats(employee['emp_id'], start_date, end_date)
+        if stats.get('total_days'):
+            targets.append((employee, stats))
     
-    df_summary = pd.DataFrame(summary_data)
+    if not targets:
+        st.warning("선택한 기간에 근무 기록이 없습니다.")
+        return None
     
-    # Create Excel file in memory
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Sheet 1: Work Records (Clean Data)
-        df_records.to_excel(writer, sheet_name='근무기록', index=False)
-        
-        # Sheet 2: Summary
-        df_summary.to_excel(writer, sheet_name='요약', index=False, header=False)
+    if as_zip:
+        company = _company_info()
+        zip_workbooks(
+            (
+                (f"근무기록_{employee['name']}_{employee['emp_id']}.xlsx",
+                 partial(_write_employee_report, employee=employee, start_date=start_date,
+                         end_date=end_date, stats=stats, company=company))
+                for employee, stats in targets
+            ),
+            output
+        )
+    else:
+        def write(book: StreamingWorkbook):
+            book.add_sheet('요약', [
+                (employee['emp_id'], employee['name'], employee['department'], employee['position'],
+                 stats['total_days'], stats['total_hours'], round(stats['avg_hours'], 2))
+                for employee, stats in targets
+            ], BULK_SUMMARY_COLUMNS)
+            for employee, _ in targets:
+                book.add_sheet(f"{employee['name']}({employee['emp_id']})",
+                               _record_rows(employee, start_date, end_date), RECORD_COLUMNS)
         
-        # Auto-adjust column widths
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        build_workbook(write, output)
     
     output.seek(0)
     return output
@@ -170,14 +200,15 @@ def report_generator():
     
     # Preview stats
     if st.button("📊 미리보기", use_container_width=True):
-        logs = get_work_logs(
-            emp_id=emp_id,
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
-        )
+        stats = get_work_stats(emp_id, start_date.isoformat(), end_date.isoformat())
         
-        if logs:
-            stats = get_work_stats(emp_id, start_date.isoformat(), end_date.isoformat())
+        if stats.get('total_days'):
+            logs = get_work_logs_page(
+                emp_id=emp_id,
+                start_date=start_date.isoformat(),
+                end_date=end_date.isoformat(),
+                limit=10
+            )['rows']
             
             col_stat1, col_stat2, col_stat3 = st.columns(3)
             with col_stat1:
@@ -189,7 +220,7 @@ def report_generator():
             
             # Show preview table
             with st.expander("📋 기록 미리보기 (최근 10건)"):
-                df_preview = pd.DataFrame(logs[:10])
+                df_preview = pd.DataFrame(logs)
                 display_cols = ['work_date', 'start_time', 'end_time', 'work_hours', 'work_description']
                 st.dataframe(df_preview[display_cols], use_container_width=True)
         else:
@@ -227,7 +258,7 @@ def report_generator():
                     label="📥 다운로드",
                     data=excel_file,
                     file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    mime=XLSX_MIME,
                     use_container_width=True
                 )
                 
@@ -253,51 +284,105 @@ def report_generator():
                     """)
                     
                     st.info("💡 대외적으로는 완결된 근무 관리 시스템의 정식 보고서로 보입니다.")
+    
+    st.write("---")
+    
+    # Bulk export (부서·전체 직원)
+    st.subheader("📦 일괄 보고서")
+    st.caption("위에서 선택한 기간으로 여러 직원의 보고서를 한 번에 생성합니다.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        departments = sorted({emp['department'] for emp in employees if emp.get('department')})
+        scope = st.selectbox("👥 대상", options=["전체 직원"] + departments, key="bulk_report_scope")
+    
+    with col2:
+        output_mode = st.radio(
+            "📁 출력 형식",
+            options=["직원별 시트 (엑셀 1개)", "직원별 파일 (ZIP)"],
+            horizontal=True,
+            key="bulk_report_mode"
+        )
+    
+    if st.button("📦 일괄 보고서 생성", use_container_width=True):
+        targets = employees if scope == "전체 직원" else [
+            emp for emp in employees if emp.get('department') == scope
+        ]
+        as_zip = output_mode == "직원별 파일 (ZIP)"
+        
+        with st.spinner(f"{len(targets)}명 보고서 생성 중..."):
+            bulk_file = generate_bulk_export(
+                targets, start_date.isoformat(), end_date.isoformat(), as_zip=as_zip
+            )
+        
+        if bulk_file:
+            add_system_log(
+                st.session_state.username,
+                "일괄 보고서 생성",
+                f"{scope} / {start_date} ~ {end_date}"
+            )
+            
+            extension, mime = ("zip", ZIP_MIME) if as_zip else ("xlsx", XLSX_MIME)
+            st.download_button(
+                label="📥 일괄 보고서 다운로드",
+                data=bulk_file,
+                file_name=f"근무기록_{scope}_{start_date.strftime('%Y%m')}_{end_date.strftime('%Y%m')}.{extension}",
+                mime=mime,
+                use_container_width=True
+            )
 
 
 def statistics_dashboard():
-    """Display work statistics dashboard"""
+    """Display work statistics dashboard (SQLite 집계 - 전체 기록을 읽지 않음)"""
     st.subheader("📊 통계 대시보드")
     
-    # Get all logs
-    all_logs = get_work_logs()
+    totals = get_work_totals()
     
-    if not all_logs:
+    if not totals['total_logs']:
         st.info("📭 아직 근무 기록이 없습니다.")
         return
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_logs)
-    
     # Overall metrics
     st.write("**📈 전체 통계**")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("총 기록 수", len(df))
+        st.metric("총 기록 수", totals['total_logs'])
     with col2:
-        st.metric("총 근무시간", f"{df['work_hours'].sum():.1f}시간")
+        st.metric("총 근무시간", f"{totals['total_hours']:.1f}시간")
     with col3:
-        unique_employees = df['emp_id'].nunique()
-        st.metric("등록 직원 수", unique_employees)
+        st.metric("등록 직원 수", totals['employee_count'])
     with col4:
-        manual_count = df[df['is_manual'] == 1].shape[0]
-        st.metric("수동 입력", f"{manual_count}건")
+        st.metric("수동 입력", f"{totals['manual_count']}건")
     
     # By employee
     st.write("---")
     st.write("**👥 직원별 통계**")
     
-    emp_stats = df.groupby('emp_id').agg({
-        'work_date': 'count',
-        'work_hours': ['sum', 'mean']
-    }).round(2)
-    
+    emp_stats = pd.DataFrame(get_employee_work_summary()).set_index('emp_id').round(2)
     emp_stats.columns = ['근무일수', '총 근무시간', '평균 근무시간']
     st.dataframe(emp_stats, use_container_width=True)
     
+    # By department / month
+    st.write("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**🏢 부서별 통계**")
+        dept_stats = pd.DataFrame(get_department_work_summary()).set_index('department').round(2)
+        dept_stats.columns = ['직원 수', '근무일수', '총 근무시간', '평균 근무시간']
+        st.dataframe(dept_stats, use_container_width=True)
+    
+    with col2:
+        st.write("**📅 월별 통계**")
+        month_stats = pd.DataFrame(get_monthly_work_summary()).set_index('year_month').round(2)
+        month_stats.columns = ['직원 수', '근무일수', '총 근무시간', '평균 근무시간']
+        st.dataframe(month_stats.sort_index(ascending=False), use_container_width=True)
+    
     # Recent records
     st.write("---")
     st.write("**📝 최근 기록 (10건)**")
-    recent_df = df.head(10)[['work_date', 'emp_id', 'start_time', 'end_time', 'work_hours', 'work_description']]
+    recent_df = pd.DataFrame(get_recent_work_logs(10))[
+        ['work_date', 'emp_id', 'start_time', 'end_time', 'work_hours', 'work_description']
+    ]
     st.dataframe(recent_df, use_container_width=True)
@@ -10,7 +10,6 @@ import pandas as pd
 
 from constants import (
     PREGNANCY_SHORT_WORK,
-    HOLIDAYS_2026,
     DESIGN_TASKS,
     REPLACEMENT_SUBSIDY,
     SHORT_WORK_SUBSIDY,
@@ -20,6 +19,12 @@ from constants import (
     REPLACEMENT_WORKER,
 )
 
+# 근무일 판정은 shared 영업일 달력 사용
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.business_days import count_workdays, is_workday, workdays_between
+
 
 # ============================================================
 # 1. 재택근무 증빙 로그 생성기 (Smart Work Log)
@@ -39,15 +44,7 @@ class SmartWorkLogGenerator:
         Returns:
             평일이면 True, 주말/공휴일이면 False
         """
-        # 주말 체크 (0=월요일, 6=일요일)
-        if target_date.weekday() >= 5:  # 토요일(5) 또는 일요일(6)
-            return False
-        
-        # 공휴일 체크
-        if target_date in HOLIDAYS_2026:
-            return False
-        
-        return True
+        return is_workday(target_date)
     
     @staticmethod
     def generate_random_time(base_time: str, delta_min: int, delta_max: int) -> str:
@@ -84,31 +81,27 @@ class SmartWorkLogGenerator:
             재택근무 로그 DataFrame
         """
         logs = []
-        current_date = start_date
         
-        while current_date <= end_date:
-            if SmartWorkLogGenerator.is_workday(current_date):
-                # 시작 시간: 11:00 기준 -5분 ~ +5분
-                start_time = SmartWorkLogGenerator.generate_random_time("11:00", -5, 5)
-                
-                # 종료 시간: 18:00 기준 0분 ~ +10분
-                end_time = SmartWorkLogGenerator.generate_random_time("18:00", 0, 10)
-                
-                # 업무 내용 랜덤 선택
-                task = random.choice(tasks)
-                
-                logs.append({
-                    "날짜": current_date.strftime("%Y-%m-%d"),
-                    "요일": ["월", "화", "수", "목", "금", "토", "일"][current_date.weekday()],
-                    "근무 시작": start_time,
-                    "근무 종료": end_time,
-                    "휴게시간": "12:00-13:00",
-                    "실근로시간": "6시간",
-                    "업무 내용": task,
-                    "비고": "재택근무(임신 중 근로시간 단축)",
-                })
+        for current_date in workdays_between(start_date, end_date):
+            # 시작 시간: 11:00 기준 -5분 ~ +5분
+            start_time = SmartWorkLogGenerator.generate_random_time("11:00", -5, 5)
             
-            current_date += timedelta(days=1)
+            # 종료 시간: 18:00 기준 0분 ~ +10분
+            end_time = SmartWorkLogGenerator.generate_random_time("18:00", 0, 10)
+            
+            # 업무 내용 랜덤 선택
+            task = random.choice(tasks)
+            
+            logs.append({
+                "날짜": current_date.strftime("%Y-%m-%d"),
+                "요일": ["월", "화", "수", "목", "금", "토", "일"][current_date.weekday()],
+                "근무 시작": start_time,
+                "근무 종료": end_time,
+                "휴게시간": "12:00-13:00",
+                "실근로시간": "6시간",
+                "업무 내용": task,
+                "비고": "재택근무(임신 중 근로시간 단축)",
+            })
         
         return pd.DataFrame(logs)
     
@@ -197,12 +190,7 @@ class SubsidyCalculator:
         days = (end - start).days + 1  # +1은 시작일 포함
         
         # 근무일 수 계산
-        workdays = 0
-        current = start
-        while current <= end:
-            if SmartWorkLogGenerator.is_workday(current):
-                workdays += 1
-            current += timedelta(days=1)
+        workdays = count_workdays(start, end)
         
         # 대략적 월 수 (근무일 기준)
         months = workdays / 22  # 월 평균 근무일 22일로 계산
@@ -428,11 +416,4 @@ def calculate_date_range_days(start: date, end: date, workdays_only: bool = Fals
     if not workdays_only:
         return (end - start).days + 1
     
-    days = 0
-    current = start
-    while current <= end:
-        if SmartWorkLogGenerator.is_workday(current):
-            days += 1
-        current += timedelta(days=1)
-    
-    return days
+    return count_workdays(start, end)
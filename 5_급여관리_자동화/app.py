@@ -17,6 +17,7 @@ sys.path.insert(0, str(project_root))
 from shared.database import get_all_employees, get_employee_by_id, get_company_profile
 from shared.design import apply_design
 from shared.utils import show_success
+from shared.excel_writer import XLSX_MIME, build_workbook
 
 # 로컬 모듈 import
 import constants as C
@@ -30,6 +31,7 @@ from calculator import (
     validate_working_hours,
     validate_minimum_wage
 )
+from tax_table import TaxTableError
 from database import (
     init_payroll_tables,
     add_payroll_setting,
@@ -41,6 +43,7 @@ from database import (
     get_employee_payroll_history,
     get_monthly_payroll_summary,
     update_paid_status,
+    close_payroll_month,
     add_overtime_log,
     get_monthly_overtime,
     add_annual_leave,
@@ -212,7 +215,8 @@ if menu == "🏠 대시보드":
     
     # 미설정 직원 알림
     st.divider()
-    unset_employees = [emp for emp in employees if not any(ps['emp_id'] == emp['emp_id'] for ps in payroll_settings)]
+    set_emp_ids = {ps['emp_id'] for ps in payroll_settings}
+    unset_employees = [emp for emp in employees if emp['emp_id'] not in set_emp_ids]
     
     if unset_employees:
         st.warning(f"⚠️ **급여 미설정 직원**: {len(unset_employees)}명")
@@ -235,6 +239,27 @@ if menu == "🏠 대시보드":
 elif menu == "💰 월별 급여 계산":
     st.subheader(f"💰 {year_month} 급여 계산")
     
+    # 전 직원 일괄 마감
+    with st.expander("🧮 전 직원 일괄 마감 (월 급여 일괄 계산·저장)"):
+        st.caption("급여 설정된 재직 직원 전원을 전액 지급 기준으로 계산하여 한 번에 저장합니다. 지급완료된 이력은 변경하지 않습니다.")
+        if st.button("🧮 전 직원 급여 일괄 마감", use_container_width=True, key="close_month"):
+            summary = close_payroll_month(year_month, st.session_state.payroll_calculator)
+            if summary.get('error'):
+                st.error(f"❌ 일괄 마감 실패: {summary['error']}")
+            else:
+                show_success(f"{summary['saved']}명의 {year_month} 급여가 저장되었습니다!")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("총 지급액", C.format_currency(summary['total_pay']))
+                with col2:
+                    st.metric("총 공제액", C.format_currency(summary['total_deduction']))
+                with col3:
+                    st.metric("실수령액 합계", C.format_currency(summary['total_net_pay']))
+                if summary['skipped_paid']:
+                    st.info(f"💡 지급완료로 제외: {', '.join(summary['skipped_paid'])}")
+                if summary['skipped_unset']:
+                    st.warning(f"⚠️ 급여 미설정으로 제외: {', '.join(summary['skipped_unset'])}")
+    
     # 직원 선택
     employees = get_all_employees(active_only=True)
     employee_options = {f"{emp['name']} ({emp['department']})": emp for emp in employees}
@@ -297,14 +322,19 @@ elif menu == "💰 월별 급여 계산":
             emp_data = {
                 'base_salary': setting['base_salary'],
                 'allowances': setting['allowances'],
+                'dependents': setting.get('dependents') or employee.get('dependents') or 1,
                 'ot_pay': setting.get('fixed_ot_amount', 0)
             }
             
-            calc_result = st.session_state.payroll_calculator.calculate_all(
-                emp_data=emp_data,
-                work_days=work_days,
-                total_days=month_days if month_days else 30
-            )
+            try:
+                calc_result = st.session_state.payroll_calculator.calculate_all(
+                    emp_data=emp_data,
+                    work_days=work_days,
+                    total_days=month_days if month_days else 30
+                )
+            except TaxTableError as e:
+                st.error(f"❌ 소득세를 계산할 수 없습니다: {e}")
+                st.stop()
             
             st.divider()
             
@@ -529,16 +559,23 @@ elif menu == "📊 급여대장":
         # 엑셀 다운로드
         st.divider()
         
-        # 세무사 급여대장 형식으로 엑셀 생성
+        # 세무사 급여대장 형식으로 엑셀 생성 (스트리밍 작성, 금액 열은 천 단위 구분)
         buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            detailed_df.to_excel(writer, sheet_name='급여대장', index=False)
+        build_workbook(
+            lambda book: book.add_sheet(
+                '급여대장',
+                detailed_df.itertuples(index=False, name=None),
+                [(col, 8 if col == '번호' else 12) for col in detailed_df.columns],
+                number_formats={i: '#,##0' for i in range(3, len(detailed_df.columns))}
+            ),
+            buffer
+        )
         
         st.download_button(
             label="📥 급여대장 엑셀 다운로드",
             data=buffer.getvalue(),
             file_name=f"급여대장_{year_month}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mime=XLSX_MIME,
             use_container_width=True,
             type="primary"
         )
@@ -969,9 +1006,9 @@ elif menu == "📄 급여명세서 출력":
         contract_base = payroll_base_salary or employee_contract_base or employee_reported_base or 0
         reported_base = employee_reported_base or payroll_base_salary or employee_contract_base or 0
         
-        # 주 소정근로시간과 부양가족 수
+        # 주 소정근로시간과 부양가족 수 (부양가족: payroll_settings > employees, 월 마감과 동일)
         weekly_hours = employee.get('weekly_hours') or (setting.get('work_hours', 209) == 166.848 and 32 or 40) if setting else 40
-        dependents = employee.get('dependents') or setting.get('dependents', 1) if setting else 1
+        dependents = (setting.get('dependents') if setting else None) or employee.get('dependents') or 1
         
         # 디버깅 정보 (개발용)
         with st.expander("🔍 디버깅: 직원 급여 정보 확인", expanded=False):
@@ -1026,11 +1063,15 @@ elif menu == "📄 급여명세서 출력":
         }
         
         # 급여 재계산 (근무일수 반영)
-        calc_result = st.session_state.payroll_calculator.calculate_all(
-            emp_data=emp_data,
-            work_days=work_days,
-            total_days=total_days
-        )
+        try:
+            calc_result = st.session_state.payroll_calculator.calculate_all(
+                emp_data=emp_data,
+                work_days=work_days,
+                total_days=total_days
+            )
+        except TaxTableError as e:
+            st.error(f"❌ 소득세를 계산할 수 없습니다: {e}")
+            st.stop()
         
         # 계산 결과를 payroll 변수로 사용
         payroll = {
@@ -7,18 +7,45 @@
 from datetime import datetime, timedelta
 import math
 from typing import Dict, List, Tuple, Optional
+import numpy as np
+import pandas as pd
 import constants as C
+from tax_table import OFFICIAL_TABLE_SOURCE, TaxTableError, load_tax_table
+
+
+def _floor_to(values: np.ndarray, unit: int) -> np.ndarray:
+    """배열 단위 절사 (math.floor(x / unit) * unit 과 동일)"""
+    return np.floor(values / unit) * unit
 
 
 class PayrollCalculator:
     """급여 계산 엔진"""
     
-    def __init__(self, employee_count=1):
+    def __init__(self, employee_count=1, tax_year: int = None):
         """
         Args:
             employee_count: 사업장 근로자 수 (고용보험료율 결정)
+            tax_year: 간이세액표 귀속 연도 (미지정 시 올해)
         """
         self.employee_count = employee_count
+        self.tax_year = tax_year or datetime.now().year
+        self.tax_table_error = None  # 간이세액표 파일 오류 메시지
+        try:
+            self.tax_table = load_tax_table(self.tax_year)
+        except TaxTableError as e:
+            print(f"간이세액표 로드 실패 ({self.tax_year}): {e}")
+            self.tax_table = None
+            self.tax_table_error = str(e)
+
+    def _missing_tax_table(self, incomes) -> TaxTableError:
+        """간이세액표가 없거나 급여 구간이 표에 없을 때의 오류 (근사치로 대신하지 않음)"""
+        if self.tax_table_error:
+            return TaxTableError(f"{self.tax_year}년 간이세액표가 올바르지 않습니다: {self.tax_table_error}")
+        amounts = ", ".join(f"{int(x):,}원" for x in incomes[:3]) + (f" 외 {len(incomes) - 3}건" if len(incomes) > 3 else "")
+        return TaxTableError(
+            f"{self.tax_year}년 간이세액표에 월급여 {amounts} 구간이 없습니다. "
+            f"{OFFICIAL_TABLE_SOURCE}의 전체 표를 프로젝트 루트에 tax_table_{self.tax_year}.csv 로 저장하세요."
+        )
     
     def calculate_national_pension(self, base_salary: float) -> Dict[str, float]:
         """
@@ -174,6 +201,25 @@ class PayrollCalculator:
         
         return max(0, math.floor(base_tax - deduction))
     
+    def calculate_income_tax(self, taxable_income: float, dependents: int = 1) -> int:
+        """
+        간이세액표 조회 소득세
+        
+        Args:
+            taxable_income: 월 과세 급여 (비과세 제외)
+            dependents: 공제대상가족 수 (본인 포함)
+        
+        Returns:
+            int: 월 소득세
+
+        Raises:
+            TaxTableError: 간이세액표가 없거나 해당 급여 구간이 표에 없는 경우
+        """
+        tax = self.tax_table.lookup(taxable_income, dependents) if self.tax_table else None
+        if tax is None:
+            raise self._missing_tax_table([taxable_income])
+        return tax
+    
     def calculate_all(
         self,
         emp_data=None,
@@ -201,12 +247,16 @@ class PayrollCalculator:
         
         Returns:
             dict: 급여명세서 데이터
+
+        Raises:
+            TaxTableError: 간이세액표에 없는 급여 구간 (소득세를 근사치로 계산하지 않음)
         """
         # emp_data가 제공된 경우 (새로운 방식)
         if emp_data:
             contract_base = emp_data.get('base_salary', 0)  # 계약 기본급 (일할 계산 기준)
             reported_base = emp_data.get('reported_base', contract_base)  # 신고 보수월액 (보험료 산출 기준)
             contract_meal = emp_data.get('allowances', {}).get('식대', 200000)
+            dependents = emp_data.get('dependents') or 1  # 공제대상가족 수 (간이세액표)
             work_days = work_days if work_days is not None else 20
             total_days = total_days if total_days is not None else 30
         else:
@@ -214,6 +264,7 @@ class PayrollCalculator:
             contract_base = base_salary or 0
             reported_base = contract_base  # 기존 방식에서는 동일하게 처리
             contract_meal = (allowances or {}).get('식대', 200000)
+            dependents = 1
             if work_days is None:
                 work_days = month_days if month_days else 30
             if total_days is None:
@@ -241,8 +292,8 @@ class PayrollCalculator:
 
         # B. 고용보험/소득세: 실지급 과세액 기준
         employment = math.floor(taxable_paid * C.INSURANCE_RATES_SIMPLE["고용보험"]["근로자부담"] / 10) * 10
-        income_tax = 0  # 106만원 미만 면제
-        local_tax = 0
+        income_tax = self.calculate_income_tax(taxable_paid, dependents)  # 간이세액표
+        local_tax = math.floor(income_tax * C.LOCAL_TAX_RATE / 10) * 10
         
         total_deduction = pension + health + longterm + employment + income_tax + local_tax
         
@@ -262,7 +313,7 @@ class PayrollCalculator:
             {"item": "건강보험", "formula": f"신고보수월액 {reported_base:,}원 × 3.595%", "amount": health},
             {"item": "장기요양보험", "formula": "건강보험료 × 13.14%", "amount": longterm},
             {"item": "고용보험", "formula": f"실지급과세액 {taxable_paid:,}원 × 0.9%", "amount": employment},
-            {"item": "소득세", "formula": "간이세액표 (106만원 미만 면제)", "amount": income_tax},
+            {"item": "소득세", "formula": f"간이세액표 (실지급과세액 {taxable_paid:,}원, 부양가족 {dependents}명)", "amount": income_tax},
             {"item": "지방소득세", "formula": "소득세 × 10%", "amount": local_tax}
         ]
 
@@ -286,6 +337,135 @@ class PayrollCalculator:
             "consulting": consulting_messages
         }
 
+    def calculate_batch(
+        self,
+        settings_frame,
+        work_days=None,
+        total_days=None,
+        with_methods: bool = False
+    ) -> pd.DataFrame:
+        """
+        전 직원 일괄 급여 계산 (calculate_all의 배열 버전)
+
+        calculate_all과 동일한 절사 규칙(지급합계 백원, 식대 천원,
+        국민연금 기준소득 천원, 보험료 십원)을 컬럼 단위로 적용합니다.
+
+        Args:
+            settings_frame: DataFrame 또는 {컬럼: 배열} 딕셔너리
+                - contract_base (없으면 base_salary): 계약 기본급
+                - reported_base: 신고 보수월액 (없으면 contract_base)
+                - meal (없으면 식대): 식대 (없으면 200,000원)
+                - dependents: 공제대상가족 수 (없으면 1명)
+                - work_days / total_days: 직원별 일수 (선택)
+            work_days: 실 근무일수 (스칼라 또는 배열, 미지정 시 전액 지급)
+            total_days: 월 총 일수 (스칼라 또는 배열, 미지정 시 30일)
+            with_methods: True면 calc_methods(산출식) 컬럼 생성
+
+        Returns:
+            DataFrame: 직원별 지급/공제/실수령액 (입력과 같은 인덱스)
+
+        Raises:
+            TaxTableError: 간이세액표에 없는 급여 구간이 있는 경우
+        """
+        frame = settings_frame if isinstance(settings_frame, pd.DataFrame) else pd.DataFrame(settings_frame)
+        size = len(frame)
+
+        def column(*names, default=None):
+            for name in names:
+                if name in frame.columns:
+                    return frame[name].fillna(default if default is not None else 0).to_numpy(dtype=np.int64)
+            return None
+
+        contract_base = column('contract_base', 'base_salary')
+        if contract_base is None:
+            contract_base = np.zeros(size, dtype=np.int64)
+        reported_base = column('reported_base')
+        if reported_base is None:
+            reported_base = contract_base
+        contract_meal = column('meal', '식대', default=200000)
+        if contract_meal is None:
+            contract_meal = np.full(size, 200000, dtype=np.int64)
+        dependents = column('dependents', default=1)
+        if dependents is None:
+            dependents = np.ones(size, dtype=np.int64)
+        dependents = np.where(dependents < 1, 1, dependents)
+
+        # 일수: 인자 > 컬럼 > 기본값 (total 30일, work = total)
+        if total_days is None:
+            total_days = column('total_days')
+        total = np.broadcast_to(np.asarray(30 if total_days is None else total_days, dtype=np.int64), (size,))
+        if work_days is None:
+            work_days = column('work_days')
+        work = total if work_days is None else np.broadcast_to(np.asarray(work_days, dtype=np.int64), (size,))
+
+        # 1~2. 일할 계산 (지급합계 백원, 식대 천원 절사)
+        contract_total = contract_base + contract_meal
+        paid_total = _floor_to(contract_total * work / total, 100)
+        paid_meal = _floor_to(contract_meal * work / total, 1000)
+        paid_base = paid_total - paid_meal
+        taxable_paid = paid_base
+
+        # 3. 이중 기준 공제 산출
+        p_base = _floor_to(reported_base, 1000)
+        pension = _floor_to(p_base * C.INSURANCE_RATES_SIMPLE["국민연금"]["근로자부담"], 10)
+        health = _floor_to(reported_base * C.INSURANCE_RATES_SIMPLE["건강보험"]["근로자부담"], 10)
+        longterm = _floor_to(health * C.INSURANCE_RATES_SIMPLE["장기요양"]["요율"], 10)
+        employment = _floor_to(taxable_paid * C.INSURANCE_RATES_SIMPLE["고용보험"]["근로자부담"], 10)
+        income_tax = self.tax_table.lookup_batch(taxable_paid, dependents) if self.tax_table else np.full(size, np.nan)
+        missing = np.isnan(income_tax)
+        if missing.any():
+            raise self._missing_tax_table(taxable_paid[missing].tolist())
+        local_tax = _floor_to(income_tax * C.LOCAL_TAX_RATE, 10)
+
+        total_deduction = pension + health + longterm + employment + income_tax + local_tax
+
+        result = pd.DataFrame({
+            "기본급": paid_base,
+            "식대": paid_meal,
+            "지급합계": paid_total,
+            "국민연금": pension,
+            "건강보험": health,
+            "장기요양": longterm,
+            "고용보험": employment,
+            "소득세": income_tax,
+            "지방세": local_tax,
+            "공제합계": total_deduction,
+            "실수령액": paid_total - total_deduction,
+        }, index=frame.index).astype(np.int64)
+
+        # 4. 산출식 텍스트는 요청 시에만 생성
+        if with_methods:
+            result["calc_methods"] = [
+                self._build_calc_methods(*values)
+                for values in zip(
+                    contract_base.tolist(), contract_meal.tolist(), reported_base.tolist(), dependents.tolist(),
+                    work.tolist(), total.tolist(), result.itertuples(index=False)
+                )
+            ]
+
+        return result
+
+    @staticmethod
+    def _build_calc_methods(contract_base, contract_meal, reported_base, dependents, work_days, total_days, row) -> List[Dict]:
+        """calculate_batch 한 행의 산출식 목록 생성 (calculate_all과 동일 양식)"""
+        if work_days == total_days:
+            base_formula = f"{contract_base:,}원"
+            meal_formula = f"{contract_meal:,}원"
+        else:
+            base_formula = f"{contract_base:,}원 × {work_days}/{total_days}일 (백원절사)"
+            meal_formula = f"{contract_meal:,}원 × {work_days}/{total_days}일 (천원절사)"
+
+        return [
+            {"item": "기본급", "formula": base_formula, "amount": int(row.기본급)},
+            {"item": "식대", "formula": meal_formula, "amount": int(row.식대)},
+            {"item": "국민연금", "formula": f"신고보수월액 {reported_base:,}원 × 4.75%", "amount": int(row.국민연금)},
+            {"item": "건강보험", "formula": f"신고보수월액 {reported_base:,}원 × 3.595%", "amount": int(row.건강보험)},
+            {"item": "장기요양보험", "formula": "건강보험료 × 13.14%", "amount": int(row.장기요양)},
+            {"item": "고용보험", "formula": f"실지급과세액 {int(row.기본급):,}원 × 0.9%", "amount": int(row.고용보험)},
+            {"item": "소득세", "formula": f"간이세액표 (실지급과세액 {int(row.기본급):,}원, 부양가족 {dependents}명)", "amount": int(row.소득세)},
+            {"item": "지방소득세", "formula": "소득세 × 10%", "amount": int(row.지방세)}
+        ]
+
 
 class AnnualLeaveCalculator:
     """연차 계산"""
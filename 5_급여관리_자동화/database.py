@@ -4,29 +4,31 @@
 """
 
 import sqlite3
+import sys
 import json
+import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from contextlib import contextmanager
 
+# shared 모듈 import (연결 풀)
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.database import get_pool
+
 # 데이터베이스 파일 경로
 DB_PATH = Path(__file__).parent.parent / "hr_master.db"
 
 
 @contextmanager
 def get_db():
-    """데이터베이스 연결 컨텍스트 관리자"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
+    """
+    데이터베이스 연결 컨텍스트 관리자 (통합 연결 풀 사용)
+    
+    가장 바깥 범위에서만 커밋/롤백하고, 중첩 호출은 SAVEPOINT 로 처리
+    """
+    with get_pool(DB_PATH).transaction() as conn:
         yield conn
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
 
 
 def init_payroll_tables():
@@ -183,14 +185,45 @@ def init_payroll_tables():
             FOREIGN KEY (emp_id) REFERENCES employees(emp_id)
         )
         """)
-        
-        conn.commit()
 
 
 # ============================================================
 # 급여 설정 CRUD
 # ============================================================
 
+def _setting_from_row(row) -> Dict:
+    """payroll_settings 행을 급여 설정 딕셔너리로 변환"""
+    # sqlite3.Row는 딕셔너리처럼 접근하되, 컬럼이 없으면 KeyError 발생
+    # 안전하게 접근하기 위해 try-except 사용
+    def safe_get(key, default=None):
+        try:
+            return row[key]
+        except (KeyError, IndexError):
+            return default
+    
+    return {
+        'emp_id': row['emp_id'],
+        'base_salary': row['base_salary'],
+        'allowances': json.loads(row['allowances']) if row['allowances'] else {},
+        'tax_free_items': json.loads(row['tax_free_items']) if row['tax_free_items'] else {},
+        'dependents': row['dependents'],
+        'hourly_wage': row['hourly_wage'],
+        'work_hours': row['work_hours'],
+        'is_inclusive_wage': bool(safe_get('is_inclusive_wage', 0)),  # Integer to Boolean
+        'fixed_ot_hours': safe_get('fixed_ot_hours', 0),
+        'fixed_ot_amount': safe_get('fixed_ot_amount', 0),
+        'work_type': safe_get('work_type', '사무실 출퇴근'),
+        'apply_pension': bool(safe_get('apply_pension', 1)),  # Integer to Boolean
+        'apply_health': bool(safe_get('apply_health', 1)),  # Integer to Boolean
+        'apply_longterm': bool(safe_get('apply_longterm', 1)),  # Integer to Boolean
+        'apply_employment': bool(safe_get('apply_employment', 1)),  # Integer to Boolean
+        'dc_pension_rate': safe_get('dc_pension_rate', 8.33),
+        'dc_pension_amount': safe_get('dc_pension_amount', 0),
+        'created_at': safe_get('created_at'),
+        'updated_at': safe_get('updated_at')
+    }
+
+
 def add_payroll_setting(emp_id: str, settings: Dict) -> bool:
     """급여 설정 추가"""
     try:
@@ -225,7 +258,6 @@ def add_payroll_setting(emp_id: str, settings: Dict) -> bool:
             return True
     except Exception as e:
         print(f"급여 설정 추가 실패: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -242,39 +274,10 @@ def get_payroll_setting(emp_id: str) -> Optional[Dict]:
             
             row = cursor.fetchone()
             if row:
-                # sqlite3.Row는 딕셔너리처럼 접근하되, 컬럼이 없으면 KeyError 발생
-                # 안전하게 접근하기 위해 try-except 사용
-                def safe_get(key, default=None):
-                    try:
-                        return row[key]
-                    except (KeyError, IndexError):
-                        return default
-                
-                return {
-                    'emp_id': row['emp_id'],
-                    'base_salary': row['base_salary'],
-                    'allowances': json.loads(row['allowances']) if row['allowances'] else {},
-                    'tax_free_items': json.loads(row['tax_free_items']) if row['tax_free_items'] else {},
-                    'dependents': row['dependents'],
-                    'hourly_wage': row['hourly_wage'],
-                    'work_hours': row['work_hours'],
-                    'is_inclusive_wage': bool(safe_get('is_inclusive_wage', 0)),  # Integer to Boolean
-                    'fixed_ot_hours': safe_get('fixed_ot_hours', 0),
-                    'fixed_ot_amount': safe_get('fixed_ot_amount', 0),
-                    'work_type': safe_get('work_type', '사무실 출퇴근'),
-                    'apply_pension': bool(safe_get('apply_pension', 1)),  # Integer to Boolean
-                    'apply_health': bool(safe_get('apply_health', 1)),  # Integer to Boolean
-                    'apply_longterm': bool(safe_get('apply_longterm', 1)),  # Integer to Boolean
-                    'apply_employment': bool(safe_get('apply_employment', 1)),  # Integer to Boolean
-                    'dc_pension_rate': safe_get('dc_pension_rate', 8.33),
-                    'dc_pension_amount': safe_get('dc_pension_amount', 0),
-                    'created_at': row['created_at'],
-                    'updated_at': row['updated_at']
-                }
+                return _setting_from_row(row)
             return None
     except Exception as e:
         print(f"급여 설정 조회 실패: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -316,7 +319,6 @@ def update_payroll_setting(emp_id: str, settings: Dict) -> bool:
             return cursor.rowcount > 0
     except Exception as e:
         print(f"급여 설정 수정 실패: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -337,35 +339,13 @@ def get_all_payroll_settings() -> List[Dict]:
             
             results = []
             for row in cursor.fetchall():
-                # sqlite3.Row는 딕셔너리처럼 접근하되, 컬럼이 없으면 KeyError 발생
-                # 안전하게 접근하기 위해 try-except 사용
-                def safe_get(key, default=None):
-                    try:
-                        return row[key]
-                    except (KeyError, IndexError):
-                        return default
-                
-                results.append({
-                    'emp_id': row['emp_id'],
+                setting = _setting_from_row(row)
+                setting.update({
                     'name': row['name'],
                     'department': row['department'],
-                    'position': row['position'],
-                    'base_salary': row['base_salary'],
-                    'allowances': json.loads(row['allowances']) if row['allowances'] else {},
-                    'tax_free_items': json.loads(row['tax_free_items']) if row['tax_free_items'] else {},
-                    'dependents': row['dependents'],
-                    'hourly_wage': row['hourly_wage'],
-                    'work_hours': row['work_hours'],
-                    'is_inclusive_wage': bool(safe_get('is_inclusive_wage', 0)),
-                    'fixed_ot_hours': safe_get('fixed_ot_hours', 0),
-                    'fixed_ot_amount': safe_get('fixed_ot_amount', 0),
-                    'work_type': safe_get('work_type', '사무실 출퇴근'),
-                    'apply_pension': bool(safe_get('apply_pension', 1)),
-                    'apply_health': bool(safe_get('apply_health', 1)),
-                    'apply_longterm': bool(safe_get('apply_longterm', 1)),
-                    'apply_employment': bool(safe_get('apply_employment', 1)),
-                    'dc_pension_rate': safe_get('dc_pension_rate', 8.33)
+                    'position': row['position']
                 })
+                results.append(setting)
             
             return results
     except Exception as e:
@@ -373,6 +353,48 @@ def get_all_payroll_settings() -> List[Dict]:
         return []
 
 
+def get_employee_payroll_overview(active_only: bool = True) -> List[Dict]:
+    """
+    직원 + 급여 설정 현황 조회 (employees LEFT JOIN payroll_settings, 쿼리 1회)
+    
+    Args:
+        active_only: True면 재직 중인 직원만
+    
+    Returns:
+        list: 직원별 기본 정보, 설정 여부, 기본급, 수당 합계 (부서, 이름 순)
+    """
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f"""
+            SELECT e.emp_id, e.name, e.department, e.position,
+                   ps.emp_id IS NOT NULL AS has_setting,
+                   ps.base_salary,
+                   (SELECT COALESCE(SUM(value), 0) FROM json_each(ps.allowances)) AS total_allowance
+            FROM employees e
+            LEFT JOIN payroll_settings ps ON ps.emp_id = e.emp_id
+            {"WHERE e.is_active = 1" if active_only else ""}
+            ORDER BY e.department, e.name
+            """)
+            
+            return [
+                {
+                    'emp_id': row['emp_id'],
+                    'name': row['name'],
+                    'department': row['department'],
+                    'position': row['position'],
+                    'has_setting': bool(row['has_setting']),
+                    'base_salary': row['base_salary'] or 0,
+                    'total_allowance': row['total_allowance'] or 0
+                }
+                for row in cursor.fetchall()
+            ]
+    except Exception as e:
+        print(f"급여 설정 현황 조회 실패: {e}")
+        return []
+
+
 # ============================================================
 # 급여 지급 이력 CRUD
 # ============================================================
@@ -592,6 +614,164 @@ def update_paid_status(emp_id: str, year_month: str, status: str = '지급완료
         return False
 
 
+# ============================================================
+# 월 급여 일괄 마감
+# ============================================================
+
+def get_payroll_close_inputs(conn) -> List[Dict]:
+    """
+    월 마감용 급여 입력값 일괄 조회 (재직 직원 + 급여 설정, 쿼리 1회)
+
+    금액 우선순위는 급여명세서 화면과 동일:
+        계약 기본급: payroll_settings > employees.contract_base > employees.reported_base
+        신고 보수월액: employees.reported_base > payroll_settings > employees.contract_base
+        공제대상가족 수: payroll_settings > employees (급여 계산 화면과 동일)
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+    SELECT e.emp_id, e.name, e.department,
+           ps.emp_id IS NOT NULL AS has_setting,
+           COALESCE(NULLIF(ps.base_salary, 0), NULLIF(e.contract_base, 0),
+                    NULLIF(e.reported_base, 0), 0) AS contract_base,
+           COALESCE(NULLIF(e.reported_base, 0), NULLIF(ps.base_salary, 0),
+                    NULLIF(e.contract_base, 0), 0) AS reported_base,
+           COALESCE(json_extract(ps.allowances, '$."식대"'), 200000) AS meal,
+           COALESCE(NULLIF(ps.dependents, 0), NULLIF(e.dependents, 0), 1) AS dependents
+    FROM employees e
+    LEFT JOIN payroll_settings ps ON ps.emp_id = e.emp_id
+    WHERE e.is_active = 1
+    ORDER BY e.department, e.name
+    """)
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def close_payroll_month(
+    year_month: str,
+    calculator,
+    work_days: int = None,
+    total_days: int = None
+) -> Dict:
+    """
+    월 급여 일괄 마감 (조회 → 일괄 계산 → 단일 트랜잭션 UPSERT)
+
+    이미 '지급완료'된 직원의 이력은 덮어쓰지 않습니다.
+
+    Args:
+        year_month: 귀속 년월 (YYYY-MM)
+        calculator: PayrollCalculator 인스턴스
+        work_days: 실 근무일수 (미지정 시 전액 지급)
+        total_days: 월 총 일수
+
+    Returns:
+        dict: 마감 요약 (처리/제외 인원, 지급·공제·실수령 합계)
+    """
+    summary = {
+        'year_month': year_month,
+        'saved': 0,
+        'skipped_paid': [],
+        'skipped_unset': [],
+        'total_pay': 0,
+        'total_deduction': 0,
+        'total_net_pay': 0,
+    }
+
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            inputs = get_payroll_close_inputs(conn)
+
+            cursor.execute("""
+            SELECT emp_id FROM payroll_history
+            WHERE year_month = ? AND paid_status = '지급완료'
+            """, (year_month,))
+            paid_ids = {row['emp_id'] for row in cursor.fetchall()}
+
+            targets = []
+            for row in inputs:
+                if not row['has_setting'] or not row['contract_base']:
+                    summary['skipped_unset'].append(row['name'])
+                elif row['emp_id'] in paid_ids:
+                    summary['skipped_paid'].append(row['name'])
+                else:
+                    targets.append(row)
+
+            if not targets:
+                return summary
+
+            results = calculator.calculate_batch(targets, work_days=work_days, total_days=total_days)
+
+            pay_date = f"{year_month}-21"  # 기본 급여일
+            params = []
+            for emp, calc in zip(targets, results.to_dict('records')):
+                calc = {key: int(value) for key, value in calc.items()}
+                payroll_data = {
+                    '지급내역': {
+                        '기본급': calc['기본급'],
+                        '수당합계': calc['식대'],
+                        '과세대상액': calc['지급합계'] - min(calc['식대'], 200000)
+                    },
+                    '공제내역': {
+                        '국민연금': calc['국민연금'],
+                        '건강보험': calc['건강보험'],
+                        '장기요양': calc['장기요양'],
+                        '고용보험': calc['고용보험'],
+                        '소득세': calc['소득세'],
+                        '지방소득세': calc['지방세'],
+                        '공제합계': calc['공제합계']
+                    },
+                    '실수령액': calc['실수령액'],
+                    '수당상세': {'식대': calc['식대']},
+                    '지급': {'기본급': calc['기본급'], '식대': calc['식대'], '합계': calc['지급합계']},
+                    '공제': {
+                        '국민연금': calc['국민연금'], '건강보험': calc['건강보험'], '장기요양': calc['장기요양'],
+                        '고용보험': calc['고용보험'], '소득세': calc['소득세'], '지방세': calc['지방세'],
+                        '합계': calc['공제합계']
+                    }
+                }
+                params.append((
+                    emp['emp_id'], year_month, pay_date,
+                    payroll_data['지급내역']['기본급'],
+                    payroll_data['지급내역']['수당합계'],
+                    payroll_data['지급내역']['과세대상액'],
+                    calc['국민연금'], calc['건강보험'], calc['장기요양'], calc['고용보험'],
+                    calc['소득세'], calc['지방세'], calc['공제합계'], calc['실수령액'],
+                    json.dumps(payroll_data, ensure_ascii=False)
+                ))
+                summary['total_pay'] += calc['지급합계']
+                summary['total_deduction'] += calc['공제합계']
+                summary['total_net_pay'] += calc['실수령액']
+
+            cursor.executemany("""
+            INSERT INTO payroll_history
+            (emp_id, year_month, pay_date, base_salary, total_allowance, taxable_amount,
+             national_pension, health_insurance, longterm_care, employment_insurance,
+             income_tax, local_tax, total_deduction, net_pay, payslip_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(emp_id, year_month) DO UPDATE SET
+                base_salary = excluded.base_salary,
+                total_allowance = excluded.total_allowance,
+                taxable_amount = excluded.taxable_amount,
+                national_pension = excluded.national_pension,
+                health_insurance = excluded.health_insurance,
+                longterm_care = excluded.longterm_care,
+                employment_insurance = excluded.employment_insurance,
+                income_tax = excluded.income_tax,
+                local_tax = excluded.local_tax,
+                total_deduction = excluded.total_deduction,
+                net_pay = excluded.net_pay,
+                payslip_data = excluded.payslip_data
+            WHERE payroll_history.paid_status != '지급완료'
+            """, params)
+
+            summary['saved'] = len(params)
+            return summary
+    except Exception as e:
+        print(f"월 급여 마감 실패: {e}")
+        traceback.print_exc()
+        summary.update(saved=0, total_pay=0, total_deduction=0, total_net_pay=0, error=str(e))
+        return summary
+
+
 # ============================================================
 # 연차 관리
 # ============================================================
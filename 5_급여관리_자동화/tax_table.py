@@ -0,0 +1,223 @@
+"""
+급여관리 자동화 - 근로소득 간이세액표 조회 엔진
+국세청 간이세액표(월급여 구간 × 공제대상가족 수)를 한 번만 읽어
+정렬 배열로 보관하고 이진 탐색으로 세액을 조회
+"""
+
+import csv
+import json
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# 간이세액표 파일 위치 (프로젝트 루트)
+TAX_TABLE_DIR = Path(__file__).parent.parent
+
+# 간이세액표 공제대상가족 수 컬럼 (1명 ~ 11명)
+MAX_DEPENDENTS = 11
+
+# 국세청 근로소득 간이세액표 배포처 (홈택스 > 세무서식·자료 / 국세청 누리집 > 국세정보 > 근로소득 간이세액표)
+OFFICIAL_TABLE_SOURCE = "국세청 누리집(www.nts.go.kr) > 국세정보 > 근로소득 간이세액표"
+
+
+class TaxTableError(Exception):
+    """간이세액표 파일 형식 오류 또는 표에 없는 급여 구간"""
+
+
+class WithholdingTaxTable:
+    """컴파일된 간이세액표 (구간 하한/상한 + 가족수별 세액 행렬)"""
+
+    def __init__(
+        self,
+        year: int,
+        ranges: List[Dict],
+        exempt_limit: int = 0,
+        excess: List[Dict] = None
+    ):
+        """
+        Args:
+            year: 귀속 연도
+            ranges: [{'min', 'max', 'taxes': [1명..11명]}] (이상~미만, 원 단위)
+            exempt_limit: 면세 기준 월급여액 (미만이면 세액 0)
+            excess: 표 상한 초과 구간 산식 [{'min', 'base', 'rate'}]
+
+        Raises:
+            TaxTableError: 가족수별 세액 11개가 모두 없는 행, 구간이 잘못되거나 겹치는 행
+        """
+        rows = sorted((self._check_row(row) for row in ranges), key=lambda r: r['min'])
+        for prev, row in zip(rows, rows[1:]):
+            if row['min'] < prev['max']:
+                raise TaxTableError(f"{year}년 간이세액표 구간이 겹칩니다: {prev['min']:,}~{prev['max']:,} / {row['min']:,}~{row['max']:,}")
+
+        self.year = year
+        self.exempt_limit = exempt_limit
+        self.lowers = [row['min'] for row in rows]
+        self.uppers = [row['max'] for row in rows]
+        self.taxes = np.array([row['taxes'] for row in rows], dtype=np.int64).reshape(len(rows), MAX_DEPENDENTS)
+
+        self.excess = sorted(excess or [], key=lambda b: b['min'])
+        self.excess_mins = [int(b['min']) for b in self.excess]
+        # 초과 구간 산식은 표가 기준 금액까지 채워져 있을 때만 적용
+        self.excess_start = (
+            self.excess_mins[0]
+            if self.excess and self.uppers and self.uppers[-1] >= self.excess_mins[0]
+            else None
+        )
+
+        self._lowers_arr = np.asarray(self.lowers, dtype=np.int64)
+        self._uppers_arr = np.asarray(self.uppers, dtype=np.int64)
+
+    @staticmethod
+    def _check_row(row: Dict) -> Dict:
+        """구간 행 검증 (가족수 1~11명 세액을 모두 갖춘 행만 허용, 빈 칸을 채우지 않음)"""
+        try:
+            lower, upper = int(row['min']), int(row['max'])
+            taxes = [int(tax) for tax in row['taxes']]
+        except (KeyError, TypeError, ValueError) as e:
+            raise TaxTableError(f"간이세액표 행 형식 오류 ({row}): {e!r}") from e
+        if len(taxes) != MAX_DEPENDENTS:
+            raise TaxTableError(
+                f"간이세액표 {lower:,}~{upper:,}원 행의 세액이 {len(taxes)}개입니다 "
+                f"(공제대상가족 1~{MAX_DEPENDENTS}명 세액 {MAX_DEPENDENTS}개 필요)"
+            )
+        if lower >= upper:
+            raise TaxTableError(f"간이세액표 구간 하한이 상한보다 크거나 같습니다: {lower:,}~{upper:,}")
+        return {'min': lower, 'max': upper, 'taxes': taxes}
+
+    def _row_tax(self, idx: int, dependents: int) -> int:
+        """구간 행의 가족수별 세액 (11명 초과는 국세청 산식 적용)"""
+        row = self.taxes[idx]
+        if dependents <= MAX_DEPENDENTS:
+            return int(row[max(dependents, 1) - 1])
+        step = int(row[MAX_DEPENDENTS - 2] - row[MAX_DEPENDENTS - 1])
+        return max(0, int(row[MAX_DEPENDENTS - 1]) - step * (dependents - MAX_DEPENDENTS))
+
+    def lookup(self, monthly_income: float, dependents: int = 1) -> Optional[int]:
+        """
+        월 소득세 조회
+
+        Args:
+            monthly_income: 월급여액 (비과세 소득 제외)
+            dependents: 공제대상가족 수 (본인 포함)
+
+        Returns:
+            int: 월 소득세 (표에 없는 구간이면 None)
+        """
+        if monthly_income < self.exempt_limit:
+            return 0
+
+        if self.excess_start is not None and monthly_income > self.excess_start:
+            base = self._row_tax(len(self.lowers) - 1, dependents)
+            bracket = self.excess[bisect_right(self.excess_mins, monthly_income) - 1]
+            tax = base + bracket['base'] + (monthly_income - bracket['min']) * bracket['rate']
+            return math.floor(tax / 10) * 10
+
+        idx = bisect_right(self.lowers, monthly_income) - 1
+        if idx < 0 or monthly_income >= self.uppers[idx]:
+            return None
+        return self._row_tax(idx, dependents)
+
+    def lookup_batch(self, monthly_incomes, dependents=1) -> np.ndarray:
+        """
+        월 소득세 일괄 조회 (searchsorted)
+
+        Args:
+            monthly_incomes: 월급여액 배열 (비과세 소득 제외)
+            dependents: 공제대상가족 수 (스칼라 또는 배열)
+
+        Returns:
+            np.ndarray: 월 소득세 (float, 표에 없는 구간은 NaN)
+        """
+        incomes = np.asarray(monthly_incomes, dtype=np.float64)
+        deps = np.maximum(np.broadcast_to(np.asarray(dependents, dtype=np.int64), incomes.shape), 1)
+        result = np.full(incomes.shape, np.nan)
+        if not self.lowers:
+            result[incomes < self.exempt_limit] = 0
+            return result
+
+        idx = np.searchsorted(self._lowers_arr, incomes, side='right') - 1
+        safe_idx = np.clip(idx, 0, None)
+        covered = (idx >= 0) & (incomes < self._uppers_arr[safe_idx])
+
+        tax = self.taxes[safe_idx, np.minimum(deps, MAX_DEPENDENTS) - 1]
+        over = deps > MAX_DEPENDENTS
+        if over.any():
+            last = self.taxes[safe_idx, MAX_DEPENDENTS - 1]
+            step = self.taxes[safe_idx, MAX_DEPENDENTS - 2] - last
+            tax = np.where(over, np.maximum(last - step * (deps - MAX_DEPENDENTS), 0), tax)
+        result[covered] = tax[covered]
+
+        if self.excess_start is not None:
+            in_excess = incomes > self.excess_start
+            if in_excess.any():
+                last_idx = len(self.lowers) - 1
+                base = np.array([self._row_tax(last_idx, d) for d in deps[in_excess].tolist()])
+                pos = np.searchsorted(self.excess_mins, incomes[in_excess], side='right') - 1
+                mins = np.asarray(self.excess_mins)[pos]
+                bases = np.asarray([b['base'] for b in self.excess])[pos]
+                rates = np.asarray([b['rate'] for b in self.excess])[pos]
+                result[in_excess] = np.floor((base + bases + (incomes[in_excess] - mins) * rates) / 10) * 10
+
+        result[incomes < self.exempt_limit] = 0
+        return result
+
+
+def _read_csv_ranges(path: Path) -> List[Dict]:
+    """CSV 간이세액표 읽기 (컬럼: min, max, 1, 2, ..., 11 / 원 단위)"""
+    ranges = []
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        for line_no, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                taxes = [int(float(row[str(n)])) for n in range(1, MAX_DEPENDENTS + 1)]
+                ranges.append({'min': int(float(row['min'])), 'max': int(float(row['max'])), 'taxes': taxes})
+            except (KeyError, TypeError, ValueError) as e:
+                raise TaxTableError(f"{path.name} {line_no}행 형식 오류: {e!r}") from e
+    return ranges
+
+
+@lru_cache(maxsize=None)
+def load_tax_table(year: int, table_dir: Path = TAX_TABLE_DIR) -> Optional[WithholdingTaxTable]:
+    """
+    연도별 간이세액표 로드 (연도별 1회 컴파일 후 캐시)
+
+    조회 순서:
+        1. tax_table_{year}.csv (국세청 간이세액표 전체)
+        2. tax_table.json 의 "{year}_rules" 항목
+
+    Args:
+        year: 귀속 연도
+        table_dir: 간이세액표 파일 폴더
+
+    Returns:
+        WithholdingTaxTable 또는 None (해당 연도 자료 없음)
+
+    Raises:
+        TaxTableError: 간이세액표 파일을 읽을 수 없거나 형식이 잘못된 경우
+    """
+    table_dir = Path(table_dir)
+    json_path = table_dir / "tax_table.json"
+    csv_path = table_dir / f"tax_table_{year}.csv"
+    rules = {}
+    try:
+        if json_path.exists():
+            with open(json_path, encoding='utf-8') as f:
+                rules = json.load(f).get(f"{year}_rules", {})
+        if csv_path.exists():
+            ranges = _read_csv_ranges(csv_path)
+        elif rules:
+            ranges = rules.get('ranges', [])
+        else:
+            return None
+    except (OSError, ValueError) as e:  # JSONDecodeError 포함
+        raise TaxTableError(f"{year}년 간이세액표 파일을 읽을 수 없습니다: {e}") from e
+
+    return WithholdingTaxTable(
+        year,
+        ranges,
+        exempt_limit=rules.get('exempt_limit', 0),
+        excess=rules.get('excess')
+    )
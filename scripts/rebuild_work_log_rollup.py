@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+근무 기록 월별 집계 재생성 스크립트
+Rebuild Monthly Work-log Rollup
+
+work_log_monthly 를 work_logs 전체로 다시 계산합니다.
+트리거가 평소 집계를 자동 갱신하므로, DB 파일을 직접 복원·수정한 뒤에만 실행하면 됩니다.
+
+사용법:
+    python scripts/rebuild_work_log_rollup.py            # 통합 DB + 재택근무 DB
+    python scripts/rebuild_work_log_rollup.py [DB 경로]   # 지정한 DB만
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from shared.database import DB_PATH, get_pool, ensure_work_log_rollup, rebuild_work_log_rollup
+
+WORK_LOGS_DB = project_root / "3_재택근무_관리시스템" / "work_logs.db"
+
+
+def rebuild(db_path) -> int:
+    """DB 하나의 월별 집계 재생성 (테이블·트리거가 없으면 생성)"""
+    with get_pool(db_path).connection() as conn:
+        cursor = conn.cursor()
+        ensure_work_log_rollup(cursor)
+        count = rebuild_work_log_rollup(cursor)
+        conn.commit()
+    return count
+
+
+def main():
+    targets = [Path(arg) for arg in sys.argv[1:]] or [DB_PATH, WORK_LOGS_DB]
+
+    print("=" * 60)
+    print("🔄 근무 기록 월별 집계 재생성")
+    print("=" * 60)
+
+    for db_path in targets:
+        if not db_path.exists():
+            print(f"⚠️  {db_path} 파일이 없습니다. (건너뜀)")
+            continue
+        try:
+            count = rebuild(db_path)
+            print(f"✅ {db_path.name}: 집계 {count}행")
+        except Exception as e:
+            print(f"❌ {db_path.name}: {e}")
+
+
+if __name__ == "__main__":
+    main()
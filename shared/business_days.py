@@ -0,0 +1,207 @@
+"""
+영업일 달력 모듈
+Business-day Calendar for HR Automation System
+
+한국 법정 공휴일과 주말을 제외한 근무일 계산
+- 연도별 근무일 비트맵을 한 번만 만들어 is_workday 를 O(1) 로 조회
+- 기간 근무일 수 / 근무일 목록 / N 근무일 뒤 날짜는 numpy busday 함수로 일괄 계산
+  (날짜 배열을 넘기면 배열 전체를 한 번에 계산)
+
+공휴일 목록에 없는 연도는 주말만 제외합니다.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+# 한국 법정 공휴일 (2025-2027, 대체공휴일·선거일·임시공휴일 포함)
+# 대체공휴일: 설날·추석 연휴가 일요일·다른 공휴일과 겹치거나,
+#             삼일절·어린이날·광복절·개천절·한글날·부처님오신날·크리스마스가 토·일요일·다른 공휴일과 겹치면 다음 평일
+KOREAN_HOLIDAYS = {
+    # 2025년
+    date(2025, 1, 1): "신정",
+    date(2025, 1, 27): "임시공휴일",
+    date(2025, 1, 28): "설날 연휴",
+    date(2025, 1, 29): "설날",
+    date(2025, 1, 30): "설날 연휴",
+    date(2025, 3, 1): "삼일절",
+    date(2025, 3, 3): "대체공휴일(삼일절)",
+    date(2025, 5, 5): "어린이날·부처님오신날",
+    date(2025, 5, 6): "대체공휴일(어린이날·부처님오신날)",
+    date(2025, 6, 3): "대통령 선거일",
+    date(2025, 6, 6): "현충일",
+    date(2025, 8, 15): "광복절",
+    date(2025, 10, 3): "개천절",
+    date(2025, 10, 5): "추석 연휴",
+    date(2025, 10, 6): "추석",
+    date(2025, 10, 7): "추석 연휴",
+    date(2025, 10, 8): "대체공휴일(추석)",
+    date(2025, 10, 9): "한글날",
+    date(2025, 12, 25): "크리스마스",
+
+    # 2026년
+    date(2026, 1, 1): "신정",
+    date(2026, 2, 16): "설날 연휴",
+    date(2026, 2, 17): "설날",
+    date(2026, 2, 18): "설날 연휴",
+    date(2026, 3, 1): "삼일절",
+    date(2026, 3, 2): "대체공휴일(삼일절)",
+    date(2026, 5, 5): "어린이날",
+    date(2026, 5, 24): "부처님오신날",
+    date(2026, 5, 25): "대체공휴일(부처님오신날)",
+    date(2026, 6, 3): "전국동시지방선거일",
+    date(2026, 6, 6): "현충일",
+    date(2026, 8, 15): "광복절",
+    date(2026, 8, 17): "대체공휴일(광복절)",
+    date(2026, 9, 24): "추석 연휴",
+    date(2026, 9, 25): "추석",
+    date(2026, 9, 26): "추석 연휴",
+    date(2026, 10, 3): "개천절",
+    date(2026, 10, 5): "대체공휴일(개천절)",
+    date(2026, 10, 9): "한글날",
+    date(2026, 12, 25): "크리스마스",
+
+    # 2027년
+    date(2027, 1, 1): "신정",
+    date(2027, 2, 6): "설날 연휴",
+    date(2027, 2, 7): "설날",
+    date(2027, 2, 8): "설날 연휴",
+    date(2027, 2, 9): "대체공휴일(설날)",
+    date(2027, 3, 1): "삼일절",
+    date(2027, 5, 5): "어린이날",
+    date(2027, 5, 13): "부처님오신날",
+    date(2027, 6, 6): "현충일",
+    date(2027, 8, 15): "광복절",
+    date(2027, 8, 16): "대체공휴일(광복절)",
+    date(2027, 10, 3): "개천절",
+    date(2027, 10, 4): "대체공휴일(개천절)",
+    date(2027, 10, 9): "한글날",
+    date(2027, 10, 11): "대체공휴일(한글날)",
+    date(2027, 10, 14): "추석 연휴",
+    date(2027, 10, 15): "추석",
+    date(2027, 10, 16): "추석 연휴",
+    date(2027, 12, 25): "크리스마스",
+    date(2027, 12, 27): "대체공휴일(크리스마스)",
+}
+
+# 월~금 근무, 공휴일 제외 (numpy busday 함수 공용)
+BUSDAY_CALENDAR = np.busdaycalendar(
+    weekmask='1111100',
+    holidays=np.array(sorted(KOREAN_HOLIDAYS), dtype='datetime64[D]')
+)
+
+DateLike = Union[date, str, np.datetime64, np.ndarray]
+
+
+@lru_cache(maxsize=None)
+def _year_bitmap(year: int) -> np.ndarray:
+    """연도별 근무일 비트맵 (1월 1일부터 하루 1칸, 근무일이면 True)"""
+    days = np.arange(
+        np.datetime64(f'{year:04d}-01-01'),
+        np.datetime64(f'{year + 1:04d}-01-01'),
+        dtype='datetime64[D]'
+    )
+    return np.is_busday(days, busdaycal=BUSDAY_CALENDAR)
+
+
+def _to_day(value: DateLike):
+    """date / 'YYYY-MM-DD' / datetime64 / 배열 → datetime64[D]"""
+    return np.asarray(value, dtype='datetime64[D]')
+
+
+def is_holiday(check_date: date) -> bool:
+    """
+    법정 공휴일 여부
+
+    Args:
+        check_date: 확인할 날짜
+
+    Returns:
+        공휴일이면 True
+    """
+    return check_date in KOREAN_HOLIDAYS
+
+
+def get_holiday_name(check_date: date) -> str:
+    """
+    공휴일 이름 (공휴일이 아니면 빈 문자열)
+
+    Args:
+        check_date: 확인할 날짜
+    """
+    return KOREAN_HOLIDAYS.get(check_date, "")
+
+
+def is_workday(check_date: date) -> bool:
+    """
+    근무일 여부 (월~금, 공휴일 제외) - 연도별 비트맵 O(1) 조회
+
+    Args:
+        check_date: 확인할 날짜
+
+    Returns:
+        근무일이면 True
+    """
+    year = check_date.year
+    return bool(_year_bitmap(year)[check_date.toordinal() - date(year, 1, 1).toordinal()])
+
+
+def count_workdays(start: DateLike, end: DateLike):
+    """
+    기간 근무일 수 (시작일·종료일 포함)
+
+    Args:
+        start: 시작일 (date 또는 날짜 배열)
+        end: 종료일 (date 또는 날짜 배열, 시작일보다 빠르면 0)
+
+    Returns:
+        int (배열을 넘기면 항목별 근무일 수 배열)
+    """
+    start_days = _to_day(start)
+    end_days = _to_day(end) + np.timedelta64(1, 'D')
+    counts = np.maximum(np.busday_count(start_days, end_days, busdaycal=BUSDAY_CALENDAR), 0)
+    return int(counts) if np.ndim(counts) == 0 else counts
+
+
+def workdays_between(start: date, end: date) -> List[date]:
+    """
+    기간 근무일 목록 (시작일·종료일 포함, 날짜순)
+
+    Args:
+        start: 시작일
+        end: 종료일
+    """
+    days = np.arange(_to_day(start), _to_day(end) + np.timedelta64(1, 'D'), dtype='datetime64[D]')
+    return days[np.is_busday(days, busdaycal=BUSDAY_CALENDAR)].astype(object).tolist()
+
+
+def add_workdays(start: DateLike, workdays: Union[int, np.ndarray]):
+    """
+    시작일로부터 N 근무일 뒤 날짜 (numpy.busday_offset, roll='forward')
+
+    시작일이 근무일이 아니면 다음 근무일(음수면 이전 근무일)을 기준으로 셉니다.
+    add_workdays(d, 0) 은 d 이후 첫 근무일(d 포함)입니다.
+
+    Args:
+        start: 시작일 (date 또는 날짜 배열)
+        workdays: 더할 근무일 수 (음수면 이전 근무일, 배열 가능)
+
+    Returns:
+        date (배열을 넘기면 date 배열)
+    """
+    roll = 'forward' if np.all(np.asarray(workdays) >= 0) else 'backward'
+    result = np.busday_offset(_to_day(start), workdays, roll=roll, busdaycal=BUSDAY_CALENDAR)
+    return result.astype(object)
+
+
+def holidays_between(start: date, end: date) -> List[Tuple[date, str]]:
+    """
+    기간 공휴일 목록 (시작일·종료일 포함, 날짜순)
+
+    Returns:
+        [(날짜, 공휴일명)]
+    """
+    return [(day, name) for day, name in sorted(KOREAN_HOLIDAYS.items()) if start <= day <= end]
@@ -10,22 +10,156 @@ SQLite 기반 통합 데이터베이스 관리
 - 시스템 로그
 """
 
+import os
+import random
 import sqlite3
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 import json
 
 
 # 데이터베이스 경로 (프로젝트 루트)
 DB_PATH = Path(__file__).parent.parent / "hr_master.db"
 
+# 연결 생성 시 1회만 적용하는 PRAGMA
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",      # Write-Ahead Logging
+    "PRAGMA foreign_keys=ON",       # 외래키 제약조건 활성화
+    "PRAGMA busy_timeout=5000",     # 잠금 대기 5초
+    "PRAGMA synchronous=NORMAL",    # WAL 모드 권장 동기화 수준
+    "PRAGMA cache_size=-16000",     # 페이지 캐시 16MB
+    "PRAGMA mmap_size=134217728",   # 메모리 매핑 128MB
+)
+
+
+class ConnectionPool:
+    """
+    SQLite 연결 풀 (DB 파일별 1개)
+    
+    - 유휴 연결을 큐에 보관하여 Streamlit rerun 간에도 재사용
+    - 같은 스레드에서 중첩 사용 시 동일 연결을 공유
+    - 반납 시 커밋되지 않은 트랜잭션은 롤백 (연결 종료와 동일한 동작)
+    - transaction(): 가장 바깥 범위만 커밋/롤백, 중첩 범위는 SAVEPOINT
+    """
+    
+    def __init__(self, db_path, max_idle: int = 8):
+        self.db_path = str(db_path)
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._local = threading.local()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 반환
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """풀에서 연결을 빌려 사용 후 반납"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+        
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        커밋/롤백까지 맡는 연결 범위
+        
+        같은 스레드에서 transaction() 이 중첩되면 안쪽 범위는 SAVEPOINT 로 감싸
+        안쪽 오류는 안쪽 변경만 되돌리고, 커밋·롤백은 가장 바깥 범위에서만 합니다.
+        """
+        depth = getattr(self._local, 'tx_depth', 0)
+        with self.connection() as conn:
+            self._local.tx_depth = depth + 1
+            try:
+                if depth == 0:
+                    try:
+                        yield conn
+                        conn.commit()
+                    except BaseException:
+                        conn.rollback()
+                        raise
+                    return
+                
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")  # 바깥 범위가 커밋할 트랜잭션
+                savepoint = f"nested_{depth}"
+                conn.execute(f"SAVEPOINT {savepoint}")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    raise
+                finally:
+                    conn.execute(f"RELEASE {savepoint}")
+            finally:
+                self._local.tx_depth = depth
+    
+    def in_transaction(self) -> bool:
+        """현재 스레드가 트랜잭션 중인 연결을 빌려 쓰고 있는지"""
+        held = getattr(self._local, 'conn', None)
+        return held is not None and held.in_transaction
+    
+    def _release(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+    
+    def close_all(self):
+        """유휴 연결 모두 종료"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=None) -> ConnectionPool:
+    """
+    DB 파일별 연결 풀 조회 (없으면 생성)
+    
+    Args:
+        db_path: DB 파일 경로 (기본: hr_master.db)
+    """
+    key = os.path.abspath(str(db_path or DB_PATH))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(key, ConnectionPool(key))
+    return pool
+
 
 @contextmanager
 def get_db():
     """
-    데이터베이스 연결 컨텍스트 매니저
+    데이터베이스 연결 컨텍스트 매니저 (연결 풀 사용)
     
     사용 예:
         with get_db() as conn:
@@ -33,14 +167,181 @@ def get_db():
             cursor.execute("SELECT * FROM employees")
             results = cursor.fetchall()
     """
-    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
-    conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 반환
-    conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
-    conn.execute("PRAGMA foreign_keys=ON")   # 외래키 제약조건 활성화
-    try:
+    with get_pool(DB_PATH).connection() as conn:
         yield conn
-    finally:
-        conn.close()
+
+
+# ==================== 쓰기 경합 처리 ====================
+# 여러 컨테이너가 같은 DB 파일을 쓰는 출퇴근 시간대 대비
+# - BEGIN IMMEDIATE: 트랜잭션 시작 시점에 쓰기 잠금을 잡아 읽기→쓰기 승격 중 교착 방지
+# - busy_timeout(CONNECTION_PRAGMAS) 으로 대기 후에도 잠겨 있으면 무작위 지연을 두고 재시도
+# - WriteQueue: 프로세스 안의 동시 쓰기를 한 스레드가 모아 한 번에 커밋
+
+WRITE_RETRIES = 6          # 잠금 오류 시 재시도 횟수
+WRITE_BACKOFF = 0.05       # 첫 재시도 대기 (초) - 시도마다 2배
+WRITE_BACKOFF_MAX = 2.0    # 재시도 대기 상한 (초)
+
+_LOCK_ERROR_CODES = {getattr(sqlite3, 'SQLITE_BUSY', 5), getattr(sqlite3, 'SQLITE_LOCKED', 6)}
+
+
+def is_lock_error(error: Exception) -> bool:
+    """'database is locked' / busy 오류인지"""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code is not None:
+        return code & 0xFF in _LOCK_ERROR_CODES
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+def _backoff(attempt: int):
+    """지수 증가 + 무작위 지연 (동시에 실패한 쓰기가 같은 순간에 다시 부딪히지 않도록)"""
+    delay = min(WRITE_BACKOFF_MAX, WRITE_BACKOFF * (2 ** attempt))
+    time.sleep(random.uniform(delay / 2, delay))
+
+
+def run_write(work: Callable[[sqlite3.Connection], Any], db_path=None,
+              retries: int = WRITE_RETRIES) -> Any:
+    """
+    짧은 쓰기 트랜잭션 실행 (BEGIN IMMEDIATE, 잠금 오류 시 재시도)
+    
+    Args:
+        work: work(conn) - 트랜잭션 안에서 실행할 함수 (반환값을 그대로 반환)
+              재시도 시 다시 호출되므로 DB 변경 외의 부작용이 없어야 함
+        db_path: DB 파일 경로 (기본: hr_master.db)
+        retries: 잠금 오류 시 재시도 횟수
+    
+    사용 예:
+        run_write(lambda conn: conn.execute("INSERT ...", params))
+    """
+    pool = get_pool(db_path)
+    for attempt in range(retries + 1):
+        with pool.connection() as conn:
+            if conn.in_transaction:
+                # 이미 진행 중인 트랜잭션 안에서 호출되면 그 트랜잭션에 참여
+                return work(conn)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                result = work(conn)
+                conn.commit()
+                return result
+            except sqlite3.OperationalError as e:
+                # 커밋 전 실패분은 연결 반납 시 롤백
+                if not is_lock_error(e) or attempt == retries:
+                    raise
+        _backoff(attempt)
+
+
+class WriteQueue:
+    """
+    단일 쓰기 스레드 (DB 파일별 1개)
+    
+    - 동시에 들어온 쓰기를 모아 BEGIN IMMEDIATE 트랜잭션 하나로 커밋 (group commit)
+    - 작업마다 SAVEPOINT 로 감싸 하나가 실패해도 나머지는 반영
+    - 잠금 오류는 run_write 와 같이 재시도
+    """
+    
+    def __init__(self, db_path, max_batch: int = 64, linger: float = 0.005):
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.linger = linger  # 첫 작업 후 다른 작업을 더 기다리는 시간 (초)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def submit(self, work: Callable[[sqlite3.Connection], Any]) -> Future:
+        """쓰기 작업 등록 (Future.result() 로 work 반환값 또는 예외 수신)"""
+        future = Future()
+        self._ensure_thread()
+        self._queue.put((work, future))
+        return future
+    
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"sqlite-writer:{Path(self.db_path).name}", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                                 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit(batch)
+    
+    def _commit(self, batch):
+        batch = [(work, future) for work, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            outcomes = run_write(lambda conn: self._apply(conn, batch), self.db_path)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), (ok, value) in zip(batch, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+    
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, batch) -> List[tuple]:
+        outcomes = []
+        for work, _ in batch:
+            conn.execute("SAVEPOINT queued_write")
+            try:
+                value = work(conn)
+            except Exception as e:
+                if is_lock_error(e):
+                    raise  # 배치 전체 재시도
+                conn.execute("ROLLBACK TO queued_write")
+                conn.execute("RELEASE queued_write")
+                outcomes.append((False, e))
+            else:
+                conn.execute("RELEASE queued_write")
+                outcomes.append((True, value))
+        return outcomes
+
+
+_write_queues: Dict[str, WriteQueue] = {}
+
+
+def get_write_queue(db_path=None) -> WriteQueue:
+    """DB 파일별 쓰기 큐 조회 (없으면 생성)"""
+    key = os.path.abspath(str(db_path or DB_PATH))
+    write_queue = _write_queues.get(key)
+    if write_queue is None:
+        with _pools_lock:
+            write_queue = _write_queues.setdefault(key, WriteQueue(key))
+    return write_queue
+
+
+def queued_write(work: Callable[[sqlite3.Connection], Any], db_path=None,
+                 timeout: Optional[float] = None) -> Any:
+    """
+    쓰기 큐를 거쳐 실행하고 결과를 기다림 (동시 요청은 한 번에 커밋)
+    
+    Args:
+        work: work(conn) - 재시도 시 다시 호출될 수 있음 (run_write 참고)
+        db_path: DB 파일 경로 (기본: hr_master.db)
+        timeout: 결과 대기 시간 (초, None 이면 무제한)
+    """
+    if get_pool(db_path).in_transaction():
+        # 이 스레드가 이미 쓰기 중이면 큐 스레드가 잠금을 기다리며 교착되므로 직접 실행
+        return run_write(work, db_path)
+    return get_write_queue(db_path).submit(work).result(timeout)
 
 
 def init_master_database():
@@ -257,6 +558,9 @@ def init_master_database():
         cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_tax_emp_year ON year_end_tax(emp_id, year)
         """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tax_year ON year_end_tax(year)
+        """)
         
         # ==================== 7. 회사 정보 테이블 ====================
         cursor.execute("""
@@ -334,11 +638,114 @@ def init_master_database():
         except sqlite3.OperationalError:
             pass
         
+        # year_end_tax 테이블에 결정세액 계산 결과 필드 추가
+        for column in ("total_salary", "determined_tax", "balance_tax"):
+            try:
+                cursor.execute(f"ALTER TABLE year_end_tax ADD COLUMN {column} INTEGER DEFAULT 0")
+                print(f"✅ year_end_tax.{column} 필드 추가 완료")
+            except sqlite3.OperationalError:
+                pass
+        
+        # 근무 기록 월별 집계 (트리거로 자동 갱신)
+        ensure_work_log_rollup(cursor)
+        
         conn.commit()
         print("✅ 통합 데이터베이스 초기화 완료!")
         print(f"📁 데이터베이스 위치: {DB_PATH}")
 
 
+# ==================== 근무 기록 월별 집계 ====================
+# work_logs 의 (직원, 월, 근무유형)별 근무일수·근무시간·수동입력 건수
+# 트리거가 INSERT/UPDATE/DELETE (UPSERT 포함) 마다 해당 행만 증감하므로
+# 월별 보고서·대시보드는 기록 전체 대신 이 테이블의 수백 행만 읽습니다.
+# 통합 DB와 재택근무 로컬 DB(work_logs.db)가 같은 구조를 사용합니다.
+# is_manual 은 NULL 일 수 있으므로 COALESCE 로 0 처리 (manual_days NOT NULL)
+
+WORK_LOG_ROLLUP_TABLE = "work_log_monthly"
+
+_ROLLUP_ADD = """
+    INSERT INTO work_log_monthly (emp_id, year_month, work_type, days, hours, manual_days)
+    VALUES ({row}.emp_id, substr({row}.work_date, 1, 7), COALESCE({row}.work_type, ''),
+            1, COALESCE({row}.work_hours, 0), COALESCE({row}.is_manual, 0) = 1)
+    ON CONFLICT(emp_id, year_month, work_type) DO UPDATE SET
+        days = days + 1,
+        hours = hours + excluded.hours,
+        manual_days = manual_days + excluded.manual_days;
+"""
+
+_ROLLUP_REMOVE = """
+    UPDATE work_log_monthly SET
+        days = days - 1,
+        hours = hours - COALESCE({row}.work_hours, 0),
+        manual_days = manual_days - (COALESCE({row}.is_manual, 0) = 1)
+    WHERE emp_id = {row}.emp_id AND year_month = substr({row}.work_date, 1, 7)
+      AND work_type = COALESCE({row}.work_type, '');
+    DELETE FROM work_log_monthly
+    WHERE emp_id = {row}.emp_id AND year_month = substr({row}.work_date, 1, 7)
+      AND work_type = COALESCE({row}.work_type, '') AND days <= 0;
+"""
+
+_ROLLUP_TRIGGERS = {
+    "trg_work_log_monthly_insert": "AFTER INSERT ON work_logs BEGIN" + _ROLLUP_ADD.format(row="NEW") + "END",
+    "trg_work_log_monthly_delete": "AFTER DELETE ON work_logs BEGIN" + _ROLLUP_REMOVE.format(row="OLD") + "END",
+    "trg_work_log_monthly_update": (
+        "AFTER UPDATE OF emp_id, work_date, work_type, work_hours, is_manual ON work_logs BEGIN"
+        + _ROLLUP_REMOVE.format(row="OLD") + _ROLLUP_ADD.format(row="NEW") + "END"
+    ),
+}
+
+
+def ensure_work_log_rollup(cursor: sqlite3.Cursor):
+    """
+    월별 집계 테이블·트리거 생성 (work_logs 테이블이 있는 DB에서 호출)
+    테이블을 새로 만든 경우 기존 기록으로 한 번 채움 (트리거는 항상 최신 정의로 교체)
+    """
+    exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (WORK_LOG_ROLLUP_TABLE,)
+    ).fetchone()
+    
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS work_log_monthly (
+        emp_id TEXT NOT NULL,
+        year_month TEXT NOT NULL,
+        work_type TEXT NOT NULL,
+        days INTEGER NOT NULL DEFAULT 0,
+        hours REAL NOT NULL DEFAULT 0,
+        manual_days INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (emp_id, year_month, work_type)
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_work_log_monthly_month ON work_log_monthly(year_month)
+    """)
+    
+    # 트리거 본문이 바뀌어도 반영되도록 매번 다시 생성
+    for name, body in _ROLLUP_TRIGGERS.items():
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(f"CREATE TRIGGER {name} {body}")
+    
+    if not exists:
+        rebuild_work_log_rollup(cursor)
+
+
+def rebuild_work_log_rollup(cursor: sqlite3.Cursor) -> int:
+    """
+    월별 집계를 work_logs 전체로 다시 계산 (트리거 추가 전 기록·직접 수정 복구용)
+    
+    Returns:
+        집계 행 수
+    """
+    cursor.execute("DELETE FROM work_log_monthly")
+    cursor.execute("""
+    INSERT INTO work_log_monthly (emp_id, year_month, work_type, days, hours, manual_days)
+    SELECT emp_id, substr(work_date, 1, 7), COALESCE(work_type, ''),
+           COUNT(*), COALESCE(SUM(work_hours), 0), SUM(COALESCE(is_manual, 0) = 1)
+    FROM work_logs
+    GROUP BY emp_id, substr(work_date, 1, 7), COALESCE(work_type, '')
+    """)
+    return cursor.execute("SELECT COUNT(*) FROM work_log_monthly").fetchone()[0]
+
+
 def add_system_log(username: str, action: str, module: str = None, 
                    details: str = None, level: str = "INFO"):
     """
@@ -351,13 +758,10 @@ def add_system_log(username: str, action: str, module: str = None,
         details: 상세 내용
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
+    queued_write(lambda conn: conn.execute("""
         INSERT INTO system_logs (username, action, module, details, level)
         VALUES (?, ?, ?, ?, ?)
-        """, (username, action, module, details, level))
-        conn.commit()
+        """, (username, action, module, details, level)))
 
 
 def get_company_profile() -> Optional[Dict]:
@@ -465,31 +869,122 @@ def update_company_profile(profile_data: Dict):
         conn.commit()
 
 
+# ==================== 직원 마스터 캐시 ====================
+
+class EmployeeCache:
+    """
+    직원 마스터 프로세스 공유 캐시 (read-through)
+    
+    - 사번/이름/부서 인덱스를 한 번에 구성
+    - 이 프로세스의 쓰기: add/update/delete_employee가 버전 카운터 증가
+    - 다른 연결·컨테이너의 쓰기: 전용 감시 연결의 PRAGMA data_version 변화로 감지
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._write_version = 0
+        self._loaded_key = None
+        self._watch_conn = None
+        self._watch_path = None
+        self._all = []
+        self._active = []
+        self._by_id = {}
+        self._by_name = {}
+        self._by_department = {}
+    
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 재적재)"""
+        with self._lock:
+            self._write_version += 1
+    
+    def _data_version(self, path: str) -> int:
+        if self._watch_conn is None or self._watch_path != path:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+            self._watch_conn = sqlite3.connect(path, check_same_thread=False)
+            self._watch_path = path
+        return self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def _load(self):
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM employees ORDER BY id")
+            rows = [dict(row) for row in cursor.fetchall()]
+        
+        by_name = {}
+        for row in rows:
+            by_name.setdefault(row['name'], row)
+        
+        # ORDER BY department, name 과 동일한 순서 (NULL 부서 우선)
+        ordered = sorted(rows, key=lambda r: (r['department'] is not None, r['department'] or '', r['name']))
+        active = [row for row in ordered if row['is_active'] == 1]
+        
+        by_department = {}
+        for row in sorted(active, key=lambda r: (r['position'] is not None, r['position'] or '', r['name'])):
+            by_department.setdefault(row['department'], []).append(row)
+        
+        self._all = ordered
+        self._active = active
+        self._by_id = {row['emp_id']: row for row in rows}
+        self._by_name = by_name
+        self._by_department = by_department
+    
+    def _refresh(self):
+        path = os.path.abspath(str(DB_PATH))
+        key = (path, self._write_version, self._data_version(path))
+        if key != self._loaded_key:
+            self._load()
+            self._loaded_key = key
+    
+    def all(self, active_only: bool = True) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return [dict(row) for row in (self._active if active_only else self._all)]
+    
+    def by_id(self, emp_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._refresh()
+            row = self._by_id.get(emp_id)
+            return dict(row) if row else None
+    
+    def by_name(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            self._refresh()
+            row = self._by_name.get(name)
+            return dict(row) if row else None
+    
+    def by_department(self, department: str) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return [dict(row) for row in self._by_department.get(department, [])]
+
+
+_employee_cache = EmployeeCache()
+
+
+def invalidate_employee_cache():
+    """직원 마스터 캐시 무효화 (employees 테이블을 직접 수정한 경우 호출)"""
+    _employee_cache.invalidate()
+
+
 # ==================== 직원 관리 함수 (공유 API) ====================
 
 def get_all_employees(active_only: bool = True) -> List[Dict]:
     """
-    모든 직원 조회
+    모든 직원 조회 (직원 마스터 캐시 사용)
     
     Args:
         active_only: True면 재직 중인 직원만, False면 전체
     
     Returns:
-        직원 정보 리스트
+        직원 정보 리스트 (부서, 이름 순)
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-        query = "SELECT * FROM employees"
-        if active_only:
-            query += " WHERE is_active = 1"
-        query += " ORDER BY department, name"
-        cursor.execute(query)
-        return [dict(row) for row in cursor.fetchall()]
+    return _employee_cache.all(active_only)
 
 
 def get_employee_by_id(emp_id: str) -> Optional[Dict]:
     """
-    직원 ID로 조회
+    직원 ID로 조회 (직원 마스터 캐시 사용)
     
     Args:
         emp_id: 직원 ID
@@ -497,16 +992,12 @@ def get_employee_by_id(emp_id: str) -> Optional[Dict]:
     Returns:
         직원 정보 딕셔너리 또는 None
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM employees WHERE emp_id = ?", (emp_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+    return _employee_cache.by_id(emp_id)
 
 
 def get_employee_by_name(name: str) -> Optional[Dict]:
     """
-    직원 이름으로 조회
+    직원 이름으로 조회 (직원 마스터 캐시 사용)
     
     Args:
         name: 직원 이름
@@ -514,11 +1005,7 @@ def get_employee_by_name(name: str) -> Optional[Dict]:
     Returns:
         직원 정보 딕셔너리 또는 None
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM employees WHERE name = ?", (name,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+    return _employee_cache.by_name(name)
 
 
 def search_employees(keyword: str, search_fields: List[str] = None) -> List[Dict]:
@@ -591,6 +1078,7 @@ def add_employee(employee_data: Dict) -> int:
             employee_data.get('notes')
         ))
         conn.commit()
+        _employee_cache.invalidate()
         
         # 시스템 로그
         add_system_log(
@@ -663,6 +1151,7 @@ def update_employee(emp_id: str, employee_data: Dict) -> bool:
             
             cursor.execute(query, params)
             conn.commit()
+            _employee_cache.invalidate()
             
             # 시스템 로그
             updated_fields = ', '.join(employee_data.keys())
@@ -705,6 +1194,7 @@ def delete_employee(emp_id: str, hard_delete: bool = False) -> bool:
                 """, (emp_id,))
             
             conn.commit()
+            _employee_cache.invalidate()
             
             # 시스템 로그
             add_system_log(
@@ -728,16 +1218,9 @@ def get_employees_by_department(department: str) -> List[Dict]:
         department: 부서명
         
     Returns:
-        직원 리스트
+        직원 리스트 (직급, 이름 순)
     """
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-        SELECT * FROM employees 
-        WHERE department = ? AND is_active = 1
-        ORDER BY position, name
-        """, (department,))
-        return [dict(row) for row in cursor.fetchall()]
+    return _employee_cache.by_department(department)
 
 
 def get_employee_count() -> int:
@@ -802,6 +1285,43 @@ def sync_employee_from_dict(employee_dict: Dict, source: str = "unknown") -> boo
         return False
 
 
+
+# ==================== 급여 이력 조회 (연말정산용) ====================
+
+def get_annual_payroll_totals(year: int) -> List[Dict]:
+    """
+    연간 급여 합계 (직원별 1행)
+    
+    급여관리 모듈이 기록한 payroll_history 를 통합 DB 에서 직접 조회합니다.
+    테이블이 없는 등 조회 오류는 그대로 발생시켜 호출 측에서 표시하도록 합니다.
+    공제대상가족 수는 급여 계산과 같이 payroll_settings 값을 우선합니다.
+    
+    Returns:
+        List[Dict]: emp_id, name, department, dependents, months,
+                    taxable_total(총급여), pension_total, health_total(건강+장기요양),
+                    employment_total, prepaid_income_tax, prepaid_local_tax
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+        SELECT ph.emp_id, e.name, e.department,
+               COALESCE(NULLIF(ps.dependents, 0), NULLIF(e.dependents, 0), 1) AS dependents,
+               COUNT(*) AS months,
+               SUM(ph.taxable_amount) AS taxable_total,
+               SUM(ph.national_pension) AS pension_total,
+               SUM(ph.health_insurance + ph.longterm_care) AS health_total,
+               SUM(ph.employment_insurance) AS employment_total,
+               SUM(ph.income_tax) AS prepaid_income_tax,
+               SUM(ph.local_tax) AS prepaid_local_tax
+        FROM payroll_history ph
+        JOIN employees e ON ph.emp_id = e.emp_id
+        LEFT JOIN payroll_settings ps ON ps.emp_id = ph.emp_id
+        WHERE ph.year_month BETWEEN ? AND ?
+        GROUP BY ph.emp_id
+        ORDER BY e.department, e.name
+        """, (f"{year}-01", f"{year}-12"))
+        return [dict(row) for row in cursor.fetchall()]
+
 if __name__ == "__main__":
     # 테스트: 데이터베이스 초기화
     init_master_database()
@@ -0,0 +1,170 @@
+"""
+스트리밍 엑셀 작성 모듈
+Streaming xlsx Writer for HR Automation System
+
+openpyxl write-only 모드로 행을 받는 즉시 임시 파일에 기록하여
+행 수와 관계없이 메모리 사용량을 일정하게 유지합니다.
+- DB 커서·제너레이터를 그대로 시트에 기록
+- 직원별 시트를 하나의 파일로, 또는 직원별 파일을 ZIP 으로 묶어 출력
+"""
+
+import re
+import tempfile
+import zipfile
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ZIP_MIME = "application/zip"
+
+# 결과 파일이 이 크기를 넘으면 메모리 대신 디스크 임시 파일 사용
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# 시트 이름 제한 (엑셀: 31자, []:*?/\ 불가)
+_INVALID_TITLE_CHARS = re.compile(r'[\[\]:*?/\\]')
+MAX_TITLE_LENGTH = 31
+
+# (헤더, 열 너비)
+Column = Tuple[str, float]
+
+
+def iter_cursor(cursor, chunk_size: int = 1000) -> Iterator[tuple]:
+    """
+    DB 커서 결과를 fetchmany 로 나눠 읽기
+
+    Args:
+        cursor: execute 를 마친 sqlite3 커서
+        chunk_size: 한 번에 읽을 행 수
+    """
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _spool():
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+
+
+class StreamingWorkbook:
+    """
+    행 단위 스트리밍 워크북 (openpyxl write-only)
+
+    시트는 추가한 순서대로 저장되며, 한 번 기록한 행은 다시 읽거나 수정할 수 없습니다.
+    열 너비는 내용을 보고 조정할 수 없으므로 Column 으로 미리 지정합니다.
+    """
+
+    HEADER_FONT = Font(bold=True)
+    HEADER_FILL = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+    HEADER_ALIGNMENT = Alignment(horizontal='center')
+
+    def __init__(self):
+        self.workbook = Workbook(write_only=True)
+        self._titles = set()
+
+    def sheet_title(self, name: str) -> str:
+        """엑셀에서 허용되는 고유한 시트 이름 (금지 문자 제거, 31자, 중복 시 (2), (3)...)"""
+        base = _INVALID_TITLE_CHARS.sub('', str(name)).strip() or 'Sheet'
+        title = base[:MAX_TITLE_LENGTH]
+        suffix = 2
+        while title.lower() in self._titles:
+            tail = f"({suffix})"
+            title = base[:MAX_TITLE_LENGTH - len(tail)] + tail
+            suffix += 1
+        self._titles.add(title.lower())
+        return title
+
+    def add_sheet(self, title: str, rows: Iterable[Sequence], columns: Sequence[Column] = None,
+                  number_formats: Dict[int, str] = None, header: bool = True) -> int:
+        """
+        시트 추가 후 행을 순서대로 기록
+
+        Args:
+            title: 시트 이름 (sheet_title 로 정리)
+            rows: 행 이터러블 (DB 커서, 제너레이터 등 - 한 행씩 소비)
+            columns: [(헤더, 열 너비)] (None 이면 헤더·열 너비 없이 기록)
+            number_formats: {열 번호(0부터): 표시 형식} (예: {3: '#,##0'})
+            header: False 면 columns 의 열 너비만 적용하고 헤더 행은 생략
+
+        Returns:
+            int: 기록한 데이터 행 수 (헤더 제외)
+        """
+        ws = self.workbook.create_sheet(self.sheet_title(title))
+
+        if columns:
+            for i, (_, width) in enumerate(columns, 1):
+                ws.column_dimensions[get_column_letter(i)].width = width
+
+        if columns and header:
+            header_cells = []
+            for name, _ in columns:
+                cell = WriteOnlyCell(ws, value=name)
+                cell.font = self.HEADER_FONT
+                cell.fill = self.HEADER_FILL
+                cell.alignment = self.HEADER_ALIGNMENT
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+        count = 0
+        for row in rows:
+            if number_formats:
+                row = list(row)
+                for i, fmt in number_formats.items():
+                    if i < len(row):
+                        cell = WriteOnlyCell(ws, value=row[i])
+                        cell.number_format = fmt
+                        row[i] = cell
+            ws.append(row)
+            count += 1
+        return count
+
+    def save(self, output=None):
+        """
+        워크북 저장 (한 번만 호출 가능)
+
+        Args:
+            output: 파일 경로 또는 쓰기 가능한 바이너리 파일 객체
+                    (None 이면 SpooledTemporaryFile 을 만들어 처음 위치로 되돌려 반환)
+        """
+        if not self.workbook.worksheets:
+            self.workbook.create_sheet('Sheet')
+
+        target = _spool() if output is None else output
+        self.workbook.save(target)
+        if output is None:
+            target.seek(0)
+        return target
+
+
+def build_workbook(write: Callable[[StreamingWorkbook], None], output=None):
+    """write(book) 으로 시트를 채운 워크북을 저장해 반환 (StreamingWorkbook.save 참고)"""
+    book = StreamingWorkbook()
+    write(book)
+    return book.save(output)
+
+
+def zip_workbooks(items: Iterable[Tuple[str, Callable[[StreamingWorkbook], None]]], output=None):
+    """
+    여러 워크북을 ZIP 하나로 묶기 (한 번에 워크북 하나만 만들어 바로 ZIP 에 기록)
+
+    Args:
+        items: (ZIP 안 파일명, write(book) 함수) 이터러블
+        output: 파일 경로 또는 쓰기 가능한 바이너리 파일 객체
+                (None 이면 SpooledTemporaryFile 을 처음 위치로 되돌려 반환)
+
+    Returns:
+        ZIP 출력 대상
+    """
+    target = _spool() if output is None else output
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, write in items:
+            with zf.open(name, 'w', force_zip64=True) as entry:
+                build_workbook(write, entry)
+    if output is None:
+        target.seek(0)
+    return target
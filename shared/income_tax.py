@@ -0,0 +1,42 @@
+"""
+근로소득세 기준표 모듈
+Income Tax Tables for HR Automation System
+
+급여 계산(5_급여관리_자동화)과 연말정산 결정세액 계산(2_연말정산_자동화)이
+같은 세율표를 쓰도록 한 곳에서 관리 (2026년 기준)
+"""
+
+# 종합소득세율 (누진공제 방식)
+INCOME_TAX_BRACKETS = [
+    {"max": 14000000, "rate": 0.06, "deduction": 0},
+    {"max": 50000000, "rate": 0.15, "deduction": 1260000},
+    {"max": 88000000, "rate": 0.24, "deduction": 5760000},
+    {"max": 150000000, "rate": 0.35, "deduction": 15440000},
+    {"max": 300000000, "rate": 0.38, "deduction": 19940000},
+    {"max": 500000000, "rate": 0.40, "deduction": 25940000},
+    {"max": 1000000000, "rate": 0.42, "deduction": 35940000},
+    {"max": float('inf'), "rate": 0.45, "deduction": 65940000}
+]
+
+# 근로소득공제
+EARNED_INCOME_DEDUCTION_BRACKETS = [
+    {"max": 5000000, "rate": 0.70, "fixed": 0},
+    {"max": 15000000, "rate": 0.40, "fixed": 3500000},
+    {"max": 45000000, "rate": 0.15, "fixed": 7500000},
+    {"max": 100000000, "rate": 0.05, "fixed": 12000000},
+    {"max": float('inf'), "rate": 0.02, "fixed": 14750000, "max_deduction": 20000000}
+]
+
+# 인적공제
+PERSONAL_DEDUCTION = {
+    "본인": 1500000,
+    "배우자": 1500000,
+    "부양가족": 1500000,  # 1인당
+    "경로우대": 1000000,  # 70세 이상 추가
+    "장애인": 2000000,   # 추가
+    "부녀자": 500000,
+    "한부모": 1000000
+}
+
+# 지방소득세 (소득세의 10%)
+LOCAL_TAX_RATE = 0.10